@@ -6,7 +6,8 @@ import sys
 import argparse
 from pathlib import Path
 
-from sec_filing_extractor import CLI, Config, __version__
+from sec_filing_extractor import CLI, Config, FilingManager, __version__
+from sec_filing_extractor.watcher import FilingWatcher
 
 
 def main():
@@ -28,6 +29,9 @@ Examples:
   # Set log level
   python main.py --log-level DEBUG
 
+  # Watch mode - process new 10-Q/8-K filings of a watchlist as they appear
+  python main.py --watch --watchlist AAPL,MSFT --watch-forms 10-Q,8-K
+
 For more information, visit: https://github.com/yourusername/sec-filing-extractor
         """
     )
@@ -57,6 +61,31 @@ For more information, visit: https://github.com/yourusername/sec-filing-extracto
         help="Quick mode: automatically download and process latest filing"
     )
 
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Watch mode: poll EDGAR's daily index and process new filings"
+    )
+
+    parser.add_argument(
+        "--watchlist",
+        type=str,
+        help="Comma-separated tickers or CIKs to watch (default: all companies)"
+    )
+
+    parser.add_argument(
+        "--watch-forms",
+        type=str,
+        default="10-Q,8-K",
+        help="Comma-separated form types to watch (default: 10-Q,8-K)"
+    )
+
+    parser.add_argument(
+        "--interval",
+        type=float,
+        help="Seconds between daily-index polls in watch mode (default: 300)"
+    )
+
     parser.add_argument(
         "--output-dir",
         type=str,
@@ -102,9 +131,16 @@ For more information, visit: https://github.com/yourusername/sec-filing-extracto
     if args.log_file:
         config.log_file = args.log_file
 
+    if args.interval:
+        config.watch_interval = args.interval
+
     # Re-setup logging with new config
     config.setup_logging()
 
+    if args.watch:
+        run_watch(config, args)
+        return
+
     # Create CLI
     cli = CLI(config)
 
@@ -130,5 +166,24 @@ For more information, visit: https://github.com/yourusername/sec-filing-extracto
         sys.exit(1)
 
 
+def run_watch(config: Config, args: argparse.Namespace):
+    """Run the daily-index watcher until interrupted."""
+    watchlist = [t.strip() for t in args.watchlist.split(",") if t.strip()] if args.watchlist else None
+    forms = [f.strip() for f in args.watch_forms.split(",") if f.strip()]
+
+    try:
+        with FilingManager(config) as manager:
+            watcher = FilingWatcher(manager, form_types=forms, watchlist=watchlist)
+            print(f"Watching for {', '.join(forms) or 'all forms'} every {watcher.interval:.0f}s "
+                  f"(Ctrl+C to stop)")
+            watcher.run()
+    except KeyboardInterrupt:
+        print("\n\nExiting...")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\nError: {e}")
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
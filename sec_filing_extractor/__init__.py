@@ -3,6 +3,7 @@ SEC Filing Extractor - Download and extract data from SEC EDGAR filings.
 """
 from .config import Config
 from .sec_client import SECClient
+from .async_client import AsyncSECClient
 from .company_lookup import CompanyLookup
 from .filing_downloader import FilingDownloader, Filing
 from .filing_manager import FilingManager
@@ -16,6 +17,7 @@ from .exceptions import (
     ExtractionError,
     APIError,
     RateLimitError,
+    CircuitOpenError,
     ValidationError,
 )
 
@@ -26,6 +28,7 @@ __all__ = [
     # Core classes
     "Config",
     "SECClient",
+    "AsyncSECClient",
     "CompanyLookup",
     "FilingDownloader",
     "Filing",
@@ -41,6 +44,7 @@ __all__ = [
     "ExtractionError",
     "APIError",
     "RateLimitError",
+    "CircuitOpenError",
     "ValidationError",
 
     # Metadata
@@ -0,0 +1,283 @@
+"""
+Asyncio SEC API client sharing one token bucket across all requests.
+"""
+import asyncio
+import functools
+import contextvars
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable
+
+import requests
+
+from .config import Config
+from .rate_limiter import RateLimiter, create_limiter
+from .sec_client import SECClient
+
+
+logger = logging.getLogger(__name__)
+
+
+# Event loop awaiting the client call running in the current worker context
+_request_loop: contextvars.ContextVar = contextvars.ContextVar(
+    "sec_request_loop", default=None
+)
+
+
+class _LoopLimiter:
+    """
+    Limiter adapter that lets worker threads wait for tokens on the event
+    loop, so pacing is scheduled by asyncio rather than by sleeping threads.
+
+    Each call waits on the loop that awaits it (read from ``_request_loop``),
+    so one client can serve several event loops. Threads started outside a
+    client call, such as background cache revalidation, block on the
+    wrapped limiter instead.
+
+    The wrapped limiter is exposed as ``limiter``, so the client queues in
+    that limiter's priority scheduler together with sync clients sharing it.
+    """
+
+    def __init__(self, limiter: RateLimiter):
+        self.limiter = limiter
+
+    def acquire(self) -> float:
+        """Block the calling worker thread until its loop grants a token."""
+        loop = _request_loop.get()
+        if loop is None or loop.is_closed():
+            return self.limiter.acquire()
+        future = asyncio.run_coroutine_threadsafe(
+            self.limiter.acquire_async(), loop
+        )
+        return future.result()
+
+    @property
+    def rate(self) -> float:
+        """Current request rate of the wrapped limiter."""
+        return self.limiter.rate
+
+    def record_success(self):
+        """Forward a successful response to the wrapped limiter."""
+        self.limiter.record_success()
+
+    def record_throttle(self):
+        """Forward a throttled response to the wrapped limiter."""
+        self.limiter.record_throttle()
+
+    def penalize(self, seconds: float) -> bool:
+        """Forward a Retry-After pause to the wrapped limiter."""
+        return self.limiter.penalize(seconds)
+
+
+class AsyncSECClient:
+    """
+    Asyncio client for the SEC EDGAR API.
+
+    Mirrors the SECClient interface with coroutine methods. Requests run on
+    a bounded thread pool so many can be in flight at once, while every
+    request (including retries) waits for its token on the event loop. The
+    limiter is chosen by config.rate_limit_scope exactly as for SECClient,
+    so sync and async clients in one process or host share one budget.
+    Identical concurrent requests are coalesced by the underlying client,
+    so gathering the same URL many times costs one request. Errors are
+    reported with the same exception types.
+    """
+
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        max_concurrency: Optional[int] = None
+    ):
+        """
+        Initialize async SEC client.
+
+        Args:
+            config: Configuration object. If None, uses default config.
+            max_concurrency: Maximum requests in flight. If None, uses
+                             config.async_max_concurrency.
+        """
+        self.config = config or Config()
+        self.max_concurrency = max_concurrency or self.config.async_max_concurrency
+        self._limiter = _LoopLimiter(create_limiter(self.config))
+        self._client = SECClient(
+            self.config,
+            limiter=self._limiter,
+            pool_maxsize=self.max_concurrency
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="sec-async"
+        )
+        logger.info(f"Async SEC Client initialized (max {self.max_concurrency} in flight)")
+
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking client call on the worker pool.
+
+        The call runs in a copy of the caller's context, so a
+        ``request_priority`` set in the calling task applies to it, and
+        its rate limit waits are scheduled on the calling event loop.
+
+        Args:
+            func: SECClient method to call.
+            *args: Positional arguments for func.
+            **kwargs: Keyword arguments for func.
+
+        Returns:
+            Result of the call.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        context.run(_request_loop.set, loop)
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(context.run, func, *args, **kwargs)
+        )
+
+    async def get(self, url: str, params: Optional[Dict] = None) -> requests.Response:
+        """
+        Perform a GET request with rate limiting.
+
+        Args:
+            url: URL to request.
+            params: Optional query parameters.
+
+        Returns:
+            Response object with the body already read.
+
+        Raises:
+            APIError: If the request fails.
+            RateLimitError: If rate limit is exceeded.
+        """
+        return await self._run(self._client.get, url, params=params)
+
+    async def get_json(self, url: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Perform a GET request and parse JSON response.
+
+        Args:
+            url: URL to request.
+            params: Optional query parameters.
+
+        Returns:
+            Parsed JSON data as dictionary.
+
+        Raises:
+            APIError: If the request fails or JSON parsing fails.
+        """
+        return await self._run(self._client.get_json, url, params=params)
+
+    async def download_file(
+        self,
+        url: str,
+        dest_path: Path,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Path:
+        """
+        Download a file from SEC with streaming.
+
+        Args:
+            url: URL of file to download.
+            dest_path: Destination path for downloaded file.
+            progress_callback: Optional callback for progress updates. It is
+                               called from a worker thread.
+
+        Returns:
+            Path to downloaded file.
+
+        Raises:
+            DownloadError: If download fails.
+        """
+        return await self._run(self._client.download_file, url, dest_path, progress_callback)
+
+    async def get_company_submissions(self, cik: str) -> Dict[str, Any]:
+        """
+        Get company submissions data from SEC API.
+
+        Args:
+            cik: 10-digit CIK string.
+
+        Returns:
+            Company submissions data.
+        """
+        return await self._run(self._client.get_company_submissions, cik)
+
+    async def get_company_facts(self, cik: str) -> Dict[str, Any]:
+        """
+        Get company facts (XBRL data) from SEC API.
+
+        Args:
+            cik: 10-digit CIK string.
+
+        Returns:
+            Company facts data.
+        """
+        return await self._run(self._client.get_company_facts, cik)
+
+    async def get_company_tickers(self) -> Dict[str, Any]:
+        """
+        Get mapping of ticker symbols to CIK numbers.
+
+        Returns:
+            Dictionary mapping tickers to company information.
+        """
+        return await self._run(self._client.get_company_tickers)
+
+    async def get_ticker_mapping_text(self) -> str:
+        """
+        Get text-based ticker to CIK mapping.
+
+        Returns:
+            Text content of ticker mapping file.
+        """
+        return await self._run(self._client.get_ticker_mapping_text)
+
+    async def get_filing_index(self, cik_no_zeros: str, accession_no_dash: str) -> Dict[str, Any]:
+        """
+        Get filing index JSON for a specific filing.
+
+        Args:
+            cik_no_zeros: CIK without leading zeros.
+            accession_no_dash: Accession number without dashes.
+
+        Returns:
+            Filing index data.
+        """
+        return await self._run(self._client.get_filing_index, cik_no_zeros, accession_no_dash)
+
+    def priority(self, priority: str):
+        """
+        Context manager running requests awaited inside it at a priority.
+
+        Args:
+            priority: "interactive", "pipeline" or "backfill".
+
+        Returns:
+            Context manager (applies to the current task).
+        """
+        return self._client.priority(priority)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of request metrics.
+
+        Returns:
+            Metrics dictionary as returned by SECClient.stats.
+        """
+        return self._client.stats()
+
+    async def close(self):
+        """Close the session and shut down the worker pool."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._executor.shutdown)
+        self._client.close()
+        logger.info("Async SEC Client closed")
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
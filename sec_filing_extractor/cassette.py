@@ -0,0 +1,248 @@
+"""
+Record/replay of HTTP interactions for deterministic offline runs.
+"""
+import io
+import json
+import time
+import zipfile
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .exceptions import ValidationError
+
+
+logger = logging.getLogger(__name__)
+
+
+CASSETTE_MODES = ("off", "record", "replay")
+
+# Headers describing the wire encoding, which no longer apply once the
+# body has been decoded and stored
+_WIRE_HEADERS = ("Content-Encoding", "Transfer-Encoding", "Content-Length")
+
+# Request headers that change what the server answers (304s, 206 partials),
+# so they are part of an interaction's key
+_KEY_HEADERS = ("If-None-Match", "If-Modified-Since", "Range")
+
+
+class Cassette:
+    """
+    Zip archive of recorded HTTP interactions.
+
+    Each interaction is stored as a small JSON member (method, URL, status,
+    headers) plus a deflate-compressed body member. Requests are told apart
+    by method, URL and their conditional/Range headers, so a revalidation
+    or resumed download never shadows the plain GET. When the same request
+    was recorded more than once, the latest recording wins.
+    """
+
+    def __init__(self, path: Path, mode: str = "replay"):
+        """
+        Open a cassette.
+
+        Args:
+            path: Path of the zip archive.
+            mode: "record" to append interactions, "replay" to read them.
+
+        Raises:
+            ValidationError: If the mode is invalid or a replay cassette
+                             does not exist.
+        """
+        if mode not in ("record", "replay"):
+            raise ValidationError(f"Invalid cassette mode '{mode}'")
+
+        self.path = Path(path)
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._interactions: Dict[str, Dict[str, Any]] = {}
+
+        if mode == "replay" and not self.path.exists():
+            raise ValidationError(f"Cassette not found: {self.path}")
+
+        if mode == "record":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._zip = zipfile.ZipFile(self.path, "a", compression=zipfile.ZIP_DEFLATED)
+        else:
+            self._zip = zipfile.ZipFile(self.path, "r")
+
+        self._load()
+        logger.info(f"Opened cassette {self.path} for {mode} ({len(self._interactions)} interactions)")
+
+    @staticmethod
+    def key(method: str, url: str, headers: Optional[Dict[str, str]] = None) -> str:
+        """
+        Build the lookup key for a request.
+
+        Args:
+            method: HTTP method.
+            url: Full request URL.
+            headers: Request headers; only _KEY_HEADERS are used.
+
+        Returns:
+            Key string.
+        """
+        key = f"{method.upper()} {url}"
+        headers = CaseInsensitiveDict(headers or {})
+        for name in _KEY_HEADERS:
+            value = headers.get(name)
+            if value:
+                key += f"\n{name}: {value}"
+        return key
+
+    @staticmethod
+    def _key_headers(request: requests.PreparedRequest) -> Dict[str, str]:
+        """Get the request headers that belong in the key."""
+        return {name: request.headers[name] for name in _KEY_HEADERS if request.headers.get(name)}
+
+    def _load(self):
+        """Index the interactions already in the archive."""
+        names = sorted(n for n in self._zip.namelist() if n.startswith("interactions/"))
+        for name in names:
+            meta = json.loads(self._zip.read(name))
+            key = self.key(meta["method"], meta["url"], meta.get("request_headers"))
+            self._interactions[key] = meta
+
+    def __len__(self) -> int:
+        return len(self._interactions)
+
+    def record(self, response: requests.Response):
+        """
+        Append an interaction.
+
+        Args:
+            response: Response whose body has been read.
+        """
+        request = response.request
+        request_headers = self._key_headers(request)
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name not in _WIRE_HEADERS
+        }
+        body = response.content or b""
+        headers["Content-Length"] = str(len(body))
+
+        with self._lock:
+            number = len(self._zip.namelist()) // 2 + 1
+            body_name = f"bodies/{number:06d}"
+            meta = {
+                "method": request.method,
+                "url": request.url,
+                "request_headers": request_headers,
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": headers,
+                "body": body_name,
+            }
+            self._zip.writestr(body_name, body)
+            self._zip.writestr(f"interactions/{number:06d}.json", json.dumps(meta))
+            self._interactions[self.key(request.method, request.url, request_headers)] = meta
+
+    def play(self, request: requests.PreparedRequest) -> Optional[requests.Response]:
+        """
+        Build the recorded response for a request.
+
+        Args:
+            request: Prepared request to look up.
+
+        Returns:
+            Response object, or None if the request was never recorded.
+        """
+        meta = self._interactions.get(self.key(request.method, request.url, request.headers))
+        if meta is None:
+            return None
+
+        with self._lock:
+            body = self._zip.read(meta["body"])
+
+        return _build_response(request, meta["status"], meta.get("reason"), meta["headers"], body)
+
+    def close(self):
+        """Close the archive, writing its directory in record mode."""
+        with self._lock:
+            if self._zip is not None:
+                self._zip.close()
+                self._zip = None
+
+
+def _build_response(
+    request: requests.PreparedRequest,
+    status: int,
+    reason: Optional[str],
+    headers: Dict[str, str],
+    body: bytes
+) -> requests.Response:
+    """Build a fully-read Response object from stored parts."""
+    response = requests.Response()
+    response.status_code = status
+    response.reason = reason
+    response.headers = CaseInsensitiveDict(headers)
+    response.url = request.url
+    response.request = request
+    response.raw = io.BytesIO(body)
+    response._content = body
+    response._content_consumed = True
+    response.encoding = get_encoding_from_headers(response.headers)
+    return response
+
+
+class CassetteAdapter(BaseAdapter):
+    """
+    Transport adapter that records to or replays from a Cassette.
+
+    In record mode requests go to the network through a regular
+    HTTPAdapter and each response body is read and archived before being
+    returned. In replay mode no network access happens: recorded responses
+    are served after an optional simulated latency, and requests missing
+    from the cassette get a synthetic 404.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        inner: Optional[HTTPAdapter] = None,
+        latency: float = 0.0
+    ):
+        """
+        Initialize adapter.
+
+        Args:
+            cassette: Open cassette.
+            inner: Real transport used in record mode.
+            latency: Seconds to wait before serving a replayed response.
+        """
+        super().__init__()
+        self.cassette = cassette
+        self.inner = inner or HTTPAdapter(max_retries=0)
+        self.latency = latency
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        """Send a request through the cassette."""
+        if self.cassette.mode == "replay":
+            if self.latency > 0:
+                time.sleep(self.latency)
+            response = self.cassette.play(request)
+            if response is None:
+                logger.warning(f"No recorded response for {request.method} {request.url}")
+                response = _build_response(request, 404, "Not Recorded", {}, b"")
+            return response
+
+        response = self.inner.send(
+            request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies
+        )
+        # Reading the body here keeps it available to streaming callers
+        _ = response.content
+        self.cassette.record(response)
+        return response
+
+    def close(self):
+        """Close the inner transport and the cassette."""
+        self.inner.close()
+        self.cassette.close()
@@ -0,0 +1,801 @@
+"""
+Local SQLite catalog of EDGAR filings for cross-company queries.
+
+The catalog is filled from EDGAR's quarterly full-index files
+(``Archives/edgar/full-index/{year}/QTR{n}/master.idx`` or ``form.idx``),
+which list every filing of a quarter, one line per filer. Files are
+streamed line by line into a ``filings`` table indexed on form, date and
+CIK, so "all 10-Ks filed in March, across all companies" becomes a local
+query instead of one submissions request per company.
+
+Ingestion is incremental: each quarter is recorded once ingested, and a
+quarter is only marked complete once it has ended, so later updates skip
+complete quarters and re-read only the current one.
+
+The catalog can also be loaded from EDGAR's bulk ``submissions.zip``
+(every company's submissions JSON in one archive). Entries are read and
+decoded one at a time straight out of the archive, filling the filing
+columns the full index lacks (primary document, items, XBRL flags, ...)
+and a ``companies`` table with SIC, state, fiscal year end and exchanges,
+so company metadata and filing lists can be served without the network.
+"""
+import re
+import json
+import time
+import sqlite3
+import logging
+import zipfile
+import threading
+from contextlib import closing
+from datetime import date, datetime, timedelta, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple, Union
+
+from .config import Config
+from .sec_client import SECClient
+from .exceptions import APIError, ValidationError
+from .filing_index import Filing, FilingIndex
+
+
+logger = logging.getLogger(__name__)
+
+
+INDEX_TYPES = ("master", "form")
+
+try:
+    from zoneinfo import ZoneInfo
+    _EDGAR_TZ = ZoneInfo("America/New_York")
+except Exception:  # Python < 3.9 or no time zone database (e.g. Windows without tzdata)
+    _EDGAR_TZ = timezone(timedelta(hours=-5))
+
+# Days after quarter end before its full index is considered final
+_QUARTER_SETTLE_DAYS = 2
+# Rows inserted per executemany call
+_BATCH_ROWS = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS filings (
+    accession TEXT NOT NULL,
+    cik INTEGER NOT NULL,
+    company_name TEXT NOT NULL,
+    form TEXT NOT NULL,
+    filing_date TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    PRIMARY KEY (accession, cik)
+);
+CREATE INDEX IF NOT EXISTS filings_form_date ON filings (form, filing_date);
+CREATE INDEX IF NOT EXISTS filings_cik_date ON filings (cik, filing_date);
+CREATE INDEX IF NOT EXISTS filings_date ON filings (filing_date);
+CREATE TABLE IF NOT EXISTS quarters (
+    year INTEGER NOT NULL,
+    quarter INTEGER NOT NULL,
+    index_type TEXT NOT NULL,
+    rows INTEGER NOT NULL,
+    complete INTEGER NOT NULL,
+    ingested_at TEXT NOT NULL,
+    PRIMARY KEY (year, quarter)
+);
+"""
+
+# Schema upgrades, applied in order to databases below each version
+# (statements are split on ";", so scripts must not contain it elsewhere)
+_MIGRATIONS = (
+    (2, """
+ALTER TABLE filings ADD COLUMN primary_doc TEXT;
+ALTER TABLE filings ADD COLUMN report_date TEXT;
+ALTER TABLE filings ADD COLUMN items TEXT;
+ALTER TABLE filings ADD COLUMN size INTEGER;
+ALTER TABLE filings ADD COLUMN is_xbrl INTEGER;
+ALTER TABLE filings ADD COLUMN is_inline_xbrl INTEGER;
+CREATE TABLE IF NOT EXISTS companies (
+    cik INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    entity_type TEXT,
+    sic TEXT,
+    sic_description TEXT,
+    category TEXT,
+    fiscal_year_end TEXT,
+    state_of_incorporation TEXT,
+    tickers TEXT,
+    exchanges TEXT,
+    updated_at REAL NOT NULL
+);
+"""),
+)
+
+# Filing columns read back into a FilingIndex, with their submissions names
+_FILING_COLUMNS = (
+    ("accession", "accessionNumber"),
+    ("cik", "cik"),
+    ("company_name", "companyName"),
+    ("form", "form"),
+    ("filing_date", "filingDate"),
+    ("COALESCE(primary_doc, '')", "primaryDocument"),
+    ("COALESCE(report_date, '')", "reportDate"),
+    ("COALESCE(items, '')", "items"),
+    ("COALESCE(size, 0)", "size"),
+    ("COALESCE(is_xbrl, 0)", "isXBRL"),
+    ("COALESCE(is_inline_xbrl, 0)", "isInlineXBRL"),
+)
+
+_SUBMISSIONS_ENTRY = re.compile(r"CIK(\d{10})(-submissions-\d+)?\.json$")
+# Archive entries decoded per transaction during bulk ingest
+_BULK_COMMIT_ENTRIES = 500
+
+FilingRow = Tuple[str, int, str, str, str, str]
+
+
+def edgar_today() -> date:
+    """Get the current date in EDGAR's time zone (US/Eastern), whatever the host's."""
+    return datetime.now(_EDGAR_TZ).date()
+
+
+def quarter_of(day: date) -> Tuple[int, int]:
+    """Get the (year, quarter) containing a date."""
+    return day.year, (day.month - 1) // 3 + 1
+
+
+def quarter_end(year: int, quarter: int) -> date:
+    """Get the last day of a quarter."""
+    if quarter == 4:
+        return date(year, 12, 31)
+    return date(year, quarter * 3 + 1, 1) - timedelta(days=1)
+
+
+def iter_quarters(start: Tuple[int, int], end: Tuple[int, int]) -> Iterator[Tuple[int, int]]:
+    """
+    Iterate over quarters from start to end, inclusive.
+
+    Args:
+        start: First (year, quarter).
+        end: Last (year, quarter).
+
+    Yields:
+        (year, quarter) tuples in chronological order.
+    """
+    year, quarter = start
+    while (year, quarter) <= end:
+        yield year, quarter
+        year, quarter = (year + 1, 1) if quarter == 4 else (year, quarter + 1)
+
+
+def normalize_index_date(value: str) -> Optional[str]:
+    """Convert an index date (YYYY-MM-DD or YYYYMMDD) to YYYY-MM-DD."""
+    value = value.strip()
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        return value
+    if len(value) == 8 and value.isdigit():
+        return f"{value[:4]}-{value[4:6]}-{value[6:]}"
+    return None
+
+
+def accession_from_filename(filename: str) -> str:
+    """Get the accession number from an index filename (edgar/data/CIK/ACCESSION.txt)."""
+    name = filename.rsplit("/", 1)[-1]
+    return name[:-4] if name.endswith(".txt") else name
+
+
+def parse_full_index(lines: Iterable[Union[str, bytes]], index_type: str = "master") -> Iterator[FilingRow]:
+    """
+    Parse a full-index or daily-index file.
+
+    The free-text header is skipped up to the line of dashes that precedes
+    the data. ``master`` files are pipe-delimited
+    (``CIK|Company Name|Form Type|Date Filed|Filename``); ``form`` files
+    are fixed-width, with the company column located from the header.
+
+    Args:
+        lines: Lines as text or latin-1 bytes (consumed lazily).
+        index_type: "master" or "form".
+
+    Yields:
+        (accession, cik, company_name, form, filing_date, filename) tuples;
+        malformed lines are skipped.
+
+    Raises:
+        ValidationError: If the index type is unknown.
+    """
+    if index_type not in INDEX_TYPES:
+        raise ValidationError(f"Invalid index type '{index_type}'; expected one of {', '.join(INDEX_TYPES)}")
+
+    header = ""
+    in_data = False
+    company_column = 0
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("latin-1")
+        line = line.rstrip("\r\n")
+
+        if not in_data:
+            if line.startswith("---"):
+                in_data = True
+                company_column = header.find("Company Name")
+            elif line.strip():
+                header = line
+            continue
+
+        if index_type == "master":
+            parts = line.split("|")
+            if len(parts) < 5:
+                continue
+            cik_text, form, date_text, filename = parts[0], parts[-3], parts[-2], parts[-1]
+            company = "|".join(parts[1:-3])
+        else:
+            parts = line.rsplit(None, 3)
+            if len(parts) < 4 or company_column <= 0:
+                continue
+            left, cik_text, date_text, filename = parts
+            form, company = left[:company_column], left[company_column:]
+
+        filing_date = normalize_index_date(date_text)
+        if filing_date is None or not cik_text.strip().isdigit():
+            continue
+        filename = filename.strip()
+        yield (
+            accession_from_filename(filename),
+            int(cik_text),
+            company.strip(),
+            form.strip(),
+            filing_date,
+            filename,
+        )
+
+
+class FilingCatalog:
+    """
+    SQLite catalog of filings across all companies.
+
+    Each thread uses its own connection; the database runs in WAL mode so
+    queries proceed while an ingest is writing.
+    """
+
+    def __init__(self, path: Path, client: Optional[SECClient] = None, config: Optional[Config] = None):
+        """
+        Open (or create) a catalog.
+
+        Args:
+            path: SQLite database file.
+            client: SEC API client used by ``ingest_quarter``/``update``. If
+                    None, one is created on first download, so a catalog
+                    used only for queries never opens a session.
+            config: Configuration object.
+        """
+        self.path = Path(path)
+        self.config = config or Config()
+        self._client = client
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._migrate()
+        logger.info(f"Filing catalog opened: {self.path}")
+
+    def _migrate(self):
+        """
+        Create the schema and apply pending upgrades.
+
+        Each upgrade takes the write lock (BEGIN IMMEDIATE) before reading
+        the schema version, so processes opening the catalog at the same
+        time apply it once; the others see the new version and skip it.
+        """
+        conn = self._conn()
+        conn.executescript(_SCHEMA)
+        for target, script in _MIGRATIONS:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if version < target:
+                    for statement in script.split(";"):
+                        if statement.strip():
+                            conn.execute(statement)
+                    conn.execute(f"PRAGMA user_version = {target}")
+                    logger.info(f"Upgraded filing catalog schema to version {target}")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    @property
+    def client(self) -> SECClient:
+        """SEC client used for downloads."""
+        if self._client is None:
+            self._client = SECClient(self.config)
+        return self._client
+
+    def _conn(self) -> sqlite3.Connection:
+        """Get this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=60.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @staticmethod
+    def _insert_rows(conn: sqlite3.Connection, rows: Iterable[FilingRow]) -> int:
+        """Insert parsed index rows in batches. Caller manages the transaction."""
+        rows = iter(rows)
+        before = conn.total_changes
+        while True:
+            batch = list(islice(rows, _BATCH_ROWS))
+            if not batch:
+                break
+            conn.executemany(
+                "INSERT OR IGNORE INTO filings "
+                "(accession, cik, company_name, form, filing_date, filename) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                batch
+            )
+        return conn.total_changes - before
+
+    def add(self, rows: Iterable[FilingRow]) -> int:
+        """
+        Add parsed index rows (see ``parse_full_index``) in one transaction.
+
+        Args:
+            rows: (accession, cik, company_name, form, filing_date, filename)
+                  tuples.
+
+        Returns:
+            Number of filings added.
+        """
+        conn = self._conn()
+        with conn:
+            return self._insert_rows(conn, rows)
+
+    def ingest_lines(
+        self,
+        lines: Iterable[Union[str, bytes]],
+        index_type: str = "master",
+        quarter: Optional[Tuple[int, int]] = None,
+        complete: bool = False
+    ) -> int:
+        """
+        Stream index lines into the catalog in one transaction.
+
+        Args:
+            lines: Full-index or daily-index lines.
+            index_type: "master" or "form".
+            quarter: (year, quarter) to record as ingested, if any.
+            complete: Whether the recorded quarter is final.
+
+        Returns:
+            Number of filings added (rows already present are not counted).
+
+        Raises:
+            ValidationError: If the index type is unknown.
+        """
+        conn = self._conn()
+        with conn:
+            added = self._insert_rows(conn, parse_full_index(lines, index_type))
+
+            if quarter is not None:
+                year, number = quarter
+                total = conn.execute(
+                    "SELECT COUNT(*) FROM filings WHERE filing_date BETWEEN ? AND ?",
+                    (date(year, number * 3 - 2, 1).isoformat(), quarter_end(year, number).isoformat())
+                ).fetchone()[0]
+                conn.execute(
+                    "INSERT OR REPLACE INTO quarters "
+                    "(year, quarter, index_type, rows, complete, ingested_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (year, number, index_type, total, int(complete), datetime.now().isoformat(timespec="seconds"))
+                )
+        return added
+
+    def ingest_file(
+        self,
+        path: Path,
+        quarter: Optional[Tuple[int, int]] = None,
+        index_type: Optional[str] = None,
+        complete: bool = True
+    ) -> int:
+        """
+        Ingest a local full-index file.
+
+        Args:
+            path: ``master.idx`` or ``form.idx`` file.
+            quarter: (year, quarter) to record as ingested, if any.
+            index_type: "master" or "form"; inferred from the file name if None.
+            complete: Whether the recorded quarter is final.
+
+        Returns:
+            Number of filings added.
+        """
+        path = Path(path)
+        if index_type is None:
+            index_type = "form" if path.name.startswith("form") else "master"
+        with open(path, "rb") as f:
+            added = self.ingest_lines(f, index_type, quarter, complete)
+        logger.info(f"Ingested {path}: {added} new filings")
+        return added
+
+    def quarter_status(self, year: int, quarter: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the ingest record of a quarter.
+
+        Args:
+            year: Calendar year.
+            quarter: Quarter (1-4).
+
+        Returns:
+            Dictionary with index_type, rows, complete and ingested_at, or
+            None if the quarter was never ingested.
+        """
+        row = self._conn().execute(
+            "SELECT index_type, rows, complete, ingested_at FROM quarters WHERE year = ? AND quarter = ?",
+            (year, quarter)
+        ).fetchone()
+        if row is None:
+            return None
+        return {"index_type": row[0], "rows": row[1], "complete": bool(row[2]), "ingested_at": row[3]}
+
+    def ingest_quarter(
+        self,
+        year: int,
+        quarter: int,
+        index_type: str = "master",
+        force: bool = False
+    ) -> int:
+        """
+        Download and ingest one quarter's full index.
+
+        Complete quarters are skipped unless forced. A quarter that has not
+        ended yet is re-read on every call and recorded as incomplete; if
+        its index is not published yet, nothing is ingested.
+
+        Args:
+            year: Calendar year.
+            quarter: Quarter (1-4).
+            index_type: "master" or "form".
+            force: Re-ingest even if the quarter is complete.
+
+        Returns:
+            Number of filings added.
+
+        Raises:
+            ValidationError: If the quarter or index type is invalid.
+            APIError: If the download fails.
+        """
+        if not 1 <= quarter <= 4:
+            raise ValidationError(f"Invalid quarter {quarter}; expected 1-4")
+        if index_type not in INDEX_TYPES:
+            raise ValidationError(f"Invalid index type '{index_type}'; expected one of {', '.join(INDEX_TYPES)}")
+
+        status = self.quarter_status(year, quarter)
+        if status and status["complete"] and not force:
+            logger.debug(f"Skipping complete quarter {year} Q{quarter}")
+            return 0
+
+        complete = edgar_today() > quarter_end(year, quarter) + timedelta(days=_QUARTER_SETTLE_DAYS)
+        try:
+            response = self.client.get_full_index(year, quarter, index_type)
+        except APIError as e:
+            # A quarter's index appears only after its first business day
+            if e.status_code == 404 and edgar_today() <= quarter_end(year, quarter):
+                logger.info(f"No full index published yet for {year} Q{quarter}")
+                return 0
+            raise
+        with closing(response):
+            added = self.ingest_lines(
+                response.iter_lines(chunk_size=self.config.chunk_size),
+                index_type, (year, quarter), complete
+            )
+        logger.info(f"Ingested {year} Q{quarter}: {added} new filings"
+                    f"{'' if complete else ' (quarter in progress)'}")
+        return added
+
+    def update(
+        self,
+        since: str,
+        until: Optional[str] = None,
+        index_type: str = "master"
+    ) -> int:
+        """
+        Bring the catalog up to date for a date range, quarter by quarter.
+
+        Args:
+            since: First date to cover (YYYY-MM-DD).
+            until: Last date to cover (YYYY-MM-DD); defaults to today.
+            index_type: "master" or "form".
+
+        Returns:
+            Number of filings added.
+
+        Raises:
+            ValidationError: If a date is invalid.
+            APIError: If a download fails (quarters already ingested stay
+                      recorded, so a later update resumes there).
+        """
+        try:
+            start = date.fromisoformat(since)
+            end = date.fromisoformat(until) if until else edgar_today()
+        except ValueError as e:
+            raise ValidationError(f"Invalid date: {e}") from e
+
+        added = 0
+        for year, quarter in iter_quarters(quarter_of(start), quarter_of(min(end, edgar_today()))):
+            added += self.ingest_quarter(year, quarter, index_type)
+        return added
+
+    def find(
+        self,
+        form_types: Optional[Tuple[str, ...]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        ciks: Optional[Iterable[Union[str, int]]] = None,
+        limit: Optional[int] = None
+    ) -> List[Filing]:
+        """
+        Query filings across companies, newest first.
+
+        Args:
+            form_types: Form types to include; None or empty includes all.
+            since: Earliest filing date (YYYY-MM-DD), or None.
+            until: Latest filing date (YYYY-MM-DD), or None.
+            ciks: Companies to include (CIK strings or integers); None for all.
+            limit: Maximum number of filings, or None for all.
+
+        Returns:
+            List of Filing objects. Filings known only from the full
+            index have an empty primary document.
+
+        Raises:
+            ValidationError: If a CIK is not numeric.
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        if form_types:
+            clauses.append(f"form IN ({', '.join('?' * len(form_types))})")
+            params.extend(form_types)
+        if since:
+            clauses.append("filing_date >= ?")
+            params.append(since)
+        if until:
+            clauses.append("filing_date <= ?")
+            params.append(until)
+        if ciks is not None:
+            try:
+                cik_values = [int(cik) for cik in ciks]
+            except ValueError as e:
+                raise ValidationError(f"Invalid CIK: {e}") from e
+            clauses.append(f"cik IN ({', '.join('?' * len(cik_values))})")
+            params.extend(cik_values)
+
+        sql = ""
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY filing_date DESC, accession DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        index = self._query_index(sql, params)
+        return index.select() if index is not None else []
+
+    def _query_index(self, clause: str, params: List[Any]) -> Optional[FilingIndex]:
+        """Run a filings query and return the rows as a FilingIndex (None if empty)."""
+        columns = ", ".join(expr for expr, _ in _FILING_COLUMNS)
+        rows = self._conn().execute(f"SELECT {columns} FROM filings{clause}", params).fetchall()
+        if not rows:
+            return None
+        data = {name: list(values) for (_, name), values in zip(_FILING_COLUMNS, zip(*rows))}
+        data["cik"] = [f"{cik:010d}" for cik in data["cik"]]
+        return FilingIndex(data)
+
+    def company(self, cik: Union[str, int]) -> Optional[Dict[str, Any]]:
+        """
+        Get company metadata loaded from the bulk submissions archive.
+
+        Args:
+            cik: CIK string (any zero padding) or integer.
+
+        Returns:
+            Dictionary with cik, name, entity_type, sic, sic_description,
+            category, fiscal_year_end, state_of_incorporation, tickers,
+            exchanges and updated_at (epoch seconds), or None if unknown.
+        """
+        row = self._conn().execute(
+            "SELECT cik, name, entity_type, sic, sic_description, category, fiscal_year_end, "
+            "state_of_incorporation, tickers, exchanges, updated_at FROM companies WHERE cik = ?",
+            (int(cik),)
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            "cik": f"{row[0]:010d}",
+            "name": row[1],
+            "entity_type": row[2],
+            "sic": row[3],
+            "sic_description": row[4],
+            "category": row[5],
+            "fiscal_year_end": row[6],
+            "state_of_incorporation": row[7],
+            "tickers": row[8].split(",") if row[8] else [],
+            "exchanges": row[9].split(",") if row[9] else [],
+            "updated_at": row[10],
+        }
+
+    def company_filings(self, cik: Union[str, int], max_age: Optional[float] = None) -> Optional[FilingIndex]:
+        """
+        Get a company's complete filing history from the catalog.
+
+        Only companies loaded from the bulk submissions archive qualify,
+        since the full index alone lacks primary documents and XBRL flags.
+        For the same reason, filings known only from a full or daily index
+        (added after the bulk load) are left out: the history is the one
+        of the last bulk load, which max_age keeps recent.
+
+        Args:
+            cik: CIK string (any zero padding) or integer.
+            max_age: Ignore data loaded more than this many seconds ago.
+
+        Returns:
+            FilingIndex of every filing, newest first, or None if the
+            company was not loaded (or is too old).
+        """
+        cik_int = int(cik)
+        company = self.company(cik_int)
+        if company is None or (max_age is not None and time.time() - company["updated_at"] > max_age):
+            return None
+        index = self._query_index(
+            " WHERE cik = ? AND primary_doc IS NOT NULL ORDER BY filing_date DESC, accession DESC", [cik_int]
+        )
+        if index is None:
+            return FilingIndex({}, cik=f"{cik_int:010d}", company_name=company["name"])
+        return index
+
+    def ingest_submissions_zip(self, path: Path) -> Dict[str, int]:
+        """
+        Load companies and filings from a bulk submissions.zip.
+
+        Entries are decoded one at a time directly from the archive (never
+        extracted), each company's main document before its extra history
+        pages, and committed in batches, so memory stays bounded by the
+        largest entry.
+
+        Args:
+            path: Local copy of submissions.zip.
+
+        Returns:
+            Dictionary with the numbers of companies and filings loaded.
+
+        Raises:
+            ValidationError: If the file is not a zip archive.
+        """
+        try:
+            archive = zipfile.ZipFile(path)
+        except zipfile.BadZipFile as e:
+            raise ValidationError(f"Not a submissions archive: {path}: {e}") from e
+
+        entries = []
+        for info in archive.infolist():
+            match = _SUBMISSIONS_ENTRY.search(info.filename)
+            if match:
+                entries.append((match.group(1), match.group(2) is not None, info))
+        # Main document first, so pages know the company name
+        entries.sort(key=lambda entry: (entry[0], entry[1], entry[2].filename))
+
+        conn = self._conn()
+        companies = filings = 0
+        loaded_at = time.time()
+        names: Dict[int, str] = {}
+        with archive:
+            for start in range(0, len(entries), _BULK_COMMIT_ENTRIES):
+                with conn:
+                    for cik_text, is_page, info in entries[start:start + _BULK_COMMIT_ENTRIES]:
+                        cik = int(cik_text)
+                        try:
+                            with archive.open(info) as f:
+                                document = json.load(f)
+                        except (ValueError, zipfile.BadZipFile) as e:
+                            logger.warning(f"Skipping unreadable entry {info.filename}: {e}")
+                            continue
+
+                        if is_page:
+                            columns = document
+                        else:
+                            self._upsert_company(conn, cik, document, loaded_at)
+                            names = {cik: document.get("name") or ""}
+                            columns = document.get("filings", {}).get("recent", {})
+                            companies += 1
+                        filings += self._upsert_submissions(conn, cik, names.get(cik, ""), columns)
+                logger.info(f"Bulk submissions: {min(start + _BULK_COMMIT_ENTRIES, len(entries))}"
+                            f"/{len(entries)} entries")
+
+        logger.info(f"Loaded {companies} companies and {filings} filings from {path}")
+        return {"companies": companies, "filings": filings}
+
+    @staticmethod
+    def _upsert_company(conn: sqlite3.Connection, cik: int, document: Dict[str, Any], loaded_at: float):
+        """Insert or replace a company row from a submissions document."""
+        def joined(values) -> str:
+            return ",".join(str(v) for v in values or () if v)
+
+        conn.execute(
+            "INSERT OR REPLACE INTO companies (cik, name, entity_type, sic, sic_description, category, "
+            "fiscal_year_end, state_of_incorporation, tickers, exchanges, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                cik,
+                document.get("name") or "",
+                document.get("entityType"),
+                document.get("sic"),
+                document.get("sicDescription"),
+                document.get("category"),
+                document.get("fiscalYearEnd"),
+                document.get("stateOfIncorporation"),
+                joined(document.get("tickers")),
+                joined(document.get("exchanges")),
+                loaded_at,
+            )
+        )
+
+    @staticmethod
+    def _upsert_submissions(conn: sqlite3.Connection, cik: int, name: str, columns: Dict[str, List[Any]]) -> int:
+        """Insert or update the filings of one block of columnar submissions data."""
+        index = FilingIndex(columns)
+        rows = (
+            (
+                index.accessions[i], cik, name, index.forms[i], index.filing_dates[i],
+                f"edgar/data/{cik}/{index.accessions[i]}.txt",
+                # Never NULL, which marks filings known only from an index
+                index.primary_docs[i] or "", index.report_dates[i], index.items[i],
+                index.sizes[i], int(bool(index.is_xbrl[i])), int(bool(index.is_inline_xbrl[i])),
+            )
+            for i in range(len(index))
+        )
+        conn.executemany(
+            "INSERT INTO filings (accession, cik, company_name, form, filing_date, filename, "
+            "primary_doc, report_date, items, size, is_xbrl, is_inline_xbrl) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (accession, cik) DO UPDATE SET "
+            "primary_doc = excluded.primary_doc, report_date = excluded.report_date, "
+            "items = excluded.items, size = excluded.size, is_xbrl = excluded.is_xbrl, "
+            "is_inline_xbrl = excluded.is_inline_xbrl",
+            rows
+        )
+        return len(index)
+
+    def update_from_bulk(self, path: Optional[Path] = None, force: bool = False) -> Dict[str, int]:
+        """
+        Download (resumably) and ingest EDGAR's bulk submissions.zip.
+
+        An existing local copy younger than config.catalog_max_age is
+        reused instead of downloaded again.
+
+        Args:
+            path: Local archive path; defaults to config.bulk_submissions_file,
+                  then ``submissions.zip`` next to the catalog.
+            force: Download even if a recent copy exists.
+
+        Returns:
+            Dictionary with the numbers of companies and filings loaded.
+
+        Raises:
+            DownloadError: If the download fails.
+        """
+        path = Path(path or self.config.bulk_submissions_file or self.path.with_name("submissions.zip"))
+        if force or not path.exists() or time.time() - path.stat().st_mtime > self.config.catalog_max_age:
+            self.client.download_file(self.client.bulk_submissions_url, path)
+        return self.ingest_submissions_zip(path)
+
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM filings").fetchone()[0]
+
+    def close(self):
+        """Close every connection opened by this catalog."""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,205 @@
+"""
+Circuit breakers keyed by host and endpoint family.
+
+A breaker watches the outcome of recent requests to one kind of endpoint
+(e.g. filing archives on www.sec.gov). When the failure rate over that
+window crosses a threshold the circuit opens and requests fail immediately,
+without spending rate limit tokens or retries, until a cooldown passes.
+Then a limited number of probe requests are let through (half-open): a
+successful probe closes the circuit, a failed one reopens it.
+"""
+import time
+import logging
+import threading
+from collections import deque
+from typing import Dict, Any, Tuple
+from urllib.parse import urlsplit
+
+from .config import Config
+from .metrics import endpoint_family
+
+
+logger = logging.getLogger(__name__)
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker for one endpoint family."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: float = 0.5,
+        window: int = 20,
+        min_requests: int = 10,
+        open_seconds: float = 30.0,
+        half_open_probes: int = 1
+    ):
+        """
+        Initialize breaker.
+
+        Args:
+            name: Label used in logs and stats.
+            failure_threshold: Failure rate (0-1) that opens the circuit.
+            window: Number of recent outcomes the rate is computed over.
+            min_requests: Outcomes required before the circuit may open.
+            open_seconds: Time the circuit stays open before probing.
+            half_open_probes: Probe requests allowed at once when half-open.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.min_requests = min_requests
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+        self._outcomes = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_started = 0.0
+        self.rejected = 0
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open."""
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> str:
+        """Get the state, moving from open to half-open once cooled down."""
+        if self._state == OPEN and now - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._probes = 0
+            logger.info(f"Circuit {self.name} half-open, probing")
+        return self._state
+
+    def allow(self) -> bool:
+        """
+        Check whether a request may be sent.
+
+        Returns:
+            True if the circuit is closed or a probe slot is free.
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN:
+                # A probe that never reported back must not block probing forever
+                if self._probes and now - self._probe_started >= self.open_seconds:
+                    self._probes = 0
+                if self._probes < self.half_open_probes:
+                    self._probes += 1
+                    self._probe_started = now
+                    return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        """Record a successful request."""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                logger.info(f"Circuit {self.name} closed after successful probe")
+                self._state = CLOSED
+                self._outcomes.clear()
+            self._outcomes.append(True)
+
+    def record_failure(self):
+        """Record a failed request, opening the circuit if warranted."""
+        with self._lock:
+            now = time.monotonic()
+            if self._state == HALF_OPEN:
+                self._open(now, "probe failed")
+                return
+            if self._state == OPEN:
+                return
+
+            self._outcomes.append(False)
+            if len(self._outcomes) >= self.min_requests:
+                failures = self._outcomes.count(False)
+                rate = failures / len(self._outcomes)
+                if rate >= self.failure_threshold:
+                    self._open(now, f"{failures}/{len(self._outcomes)} recent requests failed")
+
+    def _open(self, now: float, reason: str):
+        """Open the circuit. Caller must hold the lock."""
+        self._state = OPEN
+        self._opened_at = now
+        self._probes = 0
+        self._outcomes.clear()
+        self.trips += 1
+        logger.warning(f"Circuit {self.name} open for {self.open_seconds:.0f}s: {reason}")
+
+    def retry_in(self) -> float:
+        """Seconds until the circuit allows a probe (0 if not open)."""
+        with self._lock:
+            if self._current_state(time.monotonic()) != OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.open_seconds - time.monotonic())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get state and counters."""
+        with self._lock:
+            outcomes = len(self._outcomes)
+            return {
+                "state": self._current_state(time.monotonic()),
+                "failure_rate": self._outcomes.count(False) / outcomes if outcomes else 0.0,
+                "trips": self.trips,
+                "rejected": self.rejected,
+            }
+
+
+class CircuitBreakerRegistry:
+    """Creates and holds one CircuitBreaker per (host, endpoint family)."""
+
+    def __init__(self, config: Config):
+        """
+        Initialize registry.
+
+        Args:
+            config: Configuration providing the circuit_* settings.
+        """
+        self.config = config
+        self._breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker_for(self, url: str) -> CircuitBreaker:
+        """
+        Get the breaker guarding a URL.
+
+        Args:
+            url: Request URL.
+
+        Returns:
+            CircuitBreaker for the URL's host and endpoint family.
+        """
+        key = (urlsplit(url).netloc, endpoint_family(url))
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = CircuitBreaker(
+                    f"{key[0]}/{key[1]}",
+                    failure_threshold=self.config.circuit_failure_threshold,
+                    window=self.config.circuit_window,
+                    min_requests=self.config.circuit_min_requests,
+                    open_seconds=self.config.circuit_open_seconds,
+                    half_open_probes=self.config.circuit_half_open_probes,
+                )
+            return breaker
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the state of every breaker.
+
+        Returns:
+            Mapping of ``host/family`` to breaker state and counters.
+        """
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.snapshot() for breaker in breakers}
@@ -2,6 +2,7 @@
 Command-line interface for SEC Filing Extractor.
 """
 import logging
+import dataclasses
 from pathlib import Path
 from typing import Optional
 
@@ -17,6 +18,9 @@ logger = logging.getLogger(__name__)
 class CLI:
     """
     Interactive command-line interface for SEC Filing Extractor.
+
+    Requests made by the CLI run at interactive priority, ahead of any
+    pipeline or backfill work sharing the same rate limit.
     """
 
     def __init__(self, config: Optional[Config] = None):
@@ -27,7 +31,9 @@ class CLI:
             config: Configuration object.
         """
         self.config = config or Config()
-        self.manager = FilingManager(self.config)
+        self.manager = FilingManager(
+            dataclasses.replace(self.config, default_priority="interactive")
+        )
         logger.info("CLI initialized")
 
     def run(self):
@@ -91,7 +97,7 @@ class CLI:
         Returns:
             Ticker symbol or None.
         """
-        ticker = input("Enter ticker symbol (e.g., AAPL): ").strip()
+        ticker = input("Enter ticker symbol or company name (e.g., AAPL): ").strip()
         return ticker if ticker else None
 
     def _print_company_info(self, info: dict):
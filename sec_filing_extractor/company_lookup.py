@@ -1,12 +1,19 @@
 """
 Company lookup functionality for resolving tickers to CIK numbers.
 """
+import time
 import logging
-from typing import Optional, Dict
+import threading
+from pathlib import Path
+from typing import Optional, Dict, List, Iterable, Any
 
 from .sec_client import SECClient
 from .config import Config
 from .exceptions import TickerNotFoundError, ValidationError
+from .ticker_directory import TickerDirectory
+from .ticker_snapshot import TickerSnapshot
+from .name_index import CompanyNameIndex
+from .catalog import FilingCatalog
 
 
 logger = logging.getLogger(__name__)
@@ -15,19 +22,39 @@ logger = logging.getLogger(__name__)
 class CompanyLookup:
     """
     Handles company information lookup and ticker to CIK resolution.
+
+    Tickers are resolved against a TickerDirectory loaded once from SEC's
+    mapping files, or against a persisted copy (a memory-mapped
+    TickerSnapshot or a JSON file), and refreshed after
+    config.ticker_directory_ttl seconds.
     """
 
-    def __init__(self, client: Optional[SECClient] = None, config: Optional[Config] = None):
+    def __init__(
+        self,
+        client: Optional[SECClient] = None,
+        config: Optional[Config] = None,
+        catalog: Optional[FilingCatalog] = None
+    ):
         """
         Initialize company lookup.
 
         Args:
             client: SEC API client. If None, creates a new one.
             config: Configuration object.
+            catalog: Filing catalog; company metadata loaded into it from
+                     the bulk submissions archive is used without API
+                     requests.
         """
         self.config = config or Config()
         self.client = client or SECClient(self.config)
-        self._ticker_cache: Dict[str, str] = {}
+        self.catalog = catalog
+        self.directory = TickerDirectory()
+        # Snapshot replaced by the last swap, unmapped at the next one
+        self._retired: Optional[TickerSnapshot] = None
+        self._directory_lock = threading.Lock()
+        self._refresh_failed_at = float("-inf")
+        self._name_index: Optional[CompanyNameIndex] = None
+        self._name_index_lock = threading.Lock()
         logger.info("CompanyLookup initialized")
 
     def get_cik_from_ticker(self, ticker: str, use_cache: bool = True) -> str:
@@ -36,7 +63,8 @@ class CompanyLookup:
 
         Args:
             ticker: Stock ticker symbol (e.g., 'AAPL').
-            use_cache: Whether to use cached results.
+            use_cache: Whether to use the loaded ticker directory. If False,
+                       the directory is refreshed from SEC first.
 
         Returns:
             10-digit CIK string.
@@ -46,119 +74,202 @@ class CompanyLookup:
             ValidationError: If ticker format is invalid.
         """
         ticker = self._validate_ticker(ticker)
+        self._ensure_directory(force=not use_cache)
 
-        # Check cache first
-        if use_cache and ticker in self._ticker_cache:
-            logger.debug(f"Using cached CIK for {ticker}")
-            return self._ticker_cache[ticker]
-
-        # Try JSON endpoint first
-        cik = self._lookup_from_json(ticker)
+        cik = self.directory.lookup(ticker)
         if cik:
-            self._ticker_cache[ticker] = cik
-            logger.info(f"Resolved {ticker} to CIK {cik}")
-            return cik
-
-        # Fallback to text mapping
-        cik = self._lookup_from_text(ticker)
-        if cik:
-            self._ticker_cache[ticker] = cik
-            logger.info(f"Resolved {ticker} to CIK {cik} (from text mapping)")
+            logger.debug(f"Resolved {ticker} to CIK {cik}")
             return cik
 
         logger.error(f"Ticker not found: {ticker}")
         raise TickerNotFoundError(f"Ticker '{ticker}' not found in SEC database")
 
-    def _validate_ticker(self, ticker: str) -> str:
+    def resolve_many(self, tickers: Iterable[str]) -> Dict[str, Optional[str]]:
         """
-        Validate and normalize ticker symbol.
+        Resolve a batch of tickers in one pass over the directory.
+
+        The directory is loaded (or refreshed) at most once for the whole
+        batch. Invalid and unknown tickers map to None instead of raising.
 
         Args:
-            ticker: Raw ticker input.
+            tickers: Ticker symbols.
 
         Returns:
-            Normalized ticker (uppercase, stripped).
-
-        Raises:
-            ValidationError: If ticker is invalid.
+            Dictionary mapping each ticker, as given, to its 10-digit CIK
+            or None.
         """
-        if not ticker or not isinstance(ticker, str):
-            raise ValidationError("Ticker must be a non-empty string")
+        self._ensure_directory()
 
-        ticker = ticker.strip().upper()
+        results: Dict[str, Optional[str]] = {}
+        for ticker in tickers:
+            try:
+                results[ticker] = self.directory.lookup(self._validate_ticker(ticker))
+            except ValidationError as e:
+                logger.warning(f"Skipping invalid ticker {ticker!r}: {e}")
+                results[ticker] = None
 
-        if not ticker:
-            raise ValidationError("Ticker cannot be empty after stripping whitespace")
+        missing = sum(1 for cik in results.values() if cik is None)
+        logger.info(f"Resolved {len(results) - missing}/{len(results)} tickers")
+        return results
 
-        if len(ticker) > 10:
-            raise ValidationError("Ticker symbol too long (max 10 characters)")
+    def get_tickers_for_cik(self, cik: str) -> List[str]:
+        """
+        Get all tickers listed for a company.
 
-        # Basic validation - letters and maybe a hyphen or period
-        if not all(c.isalnum() or c in ('-', '.') for c in ticker):
-            raise ValidationError(f"Invalid ticker format: {ticker}")
+        Args:
+            cik: CIK string (any zero padding).
 
-        return ticker
+        Returns:
+            List of ticker symbols (empty if none).
+
+        Raises:
+            ValidationError: If CIK is invalid.
+        """
+        cik = self.validate_cik(cik)
+        self._ensure_directory()
+        return self.directory.tickers_for(cik)
 
-    def _lookup_from_json(self, ticker: str) -> Optional[str]:
+    def _ensure_directory(self, force: bool = False):
         """
-        Look up ticker in company_tickers.json.
+        Make sure the ticker directory is loaded and within its TTL.
+
+        Persisted copies (config.ticker_snapshot_file, then
+        config.ticker_directory_file) are tried before the network, so a
+        process started after another has refreshed them makes no request.
+        If a refresh fails, stale data keeps being served and the refresh
+        is retried after a minute.
 
         Args:
-            ticker: Normalized ticker symbol.
+            force: Refresh from SEC even if the directory is fresh.
+        """
+        ttl = self.config.ticker_directory_ttl
+        if not force and self.directory.age < ttl:
+            return
+
+        with self._directory_lock:
+            if not force and self.directory.age < ttl:
+                return
+
+            if not force and self._load_persisted():
+                return
+
+            if not force and time.monotonic() - self._refresh_failed_at < 60:
+                return
+
+            try:
+                self.refresh_directory()
+            except Exception as e:
+                self._refresh_failed_at = time.monotonic()
+                if self.directory.loaded:
+                    logger.warning(f"Ticker directory refresh failed, using stale data: {e}")
+                else:
+                    logger.warning(f"Failed to load ticker directory: {e}")
+
+    def _set_directory(self, directory):
+        """
+        Swap in a new directory and release mapped snapshots.
 
-        Returns:
-            10-digit CIK string or None if not found.
+        The snapshot being replaced may still be read by a lookup running
+        in another thread, so it is only closed at the following swap.
         """
-        try:
-            data = self.client.get_company_tickers()
+        if self._retired is not None:
+            self._retired.close()
+        previous, self.directory = self.directory, directory
+        self._retired = previous if isinstance(previous, TickerSnapshot) else None
+
+    def _load_persisted(self) -> bool:
+        """
+        Switch to a persisted directory if one is fresh.
 
-            # Data can be dict of indices or list
-            rows = data.values() if isinstance(data, dict) else data
+        Returns:
+            True if a fresh snapshot or JSON directory was loaded.
+        """
+        ttl = self.config.ticker_directory_ttl
+
+        if self.config.ticker_snapshot_file:
+            try:
+                snapshot = TickerSnapshot(Path(self.config.ticker_snapshot_file))
+                if snapshot.age < ttl:
+                    self._set_directory(snapshot)
+                    logger.info(f"Using ticker snapshot {snapshot.path} ({len(snapshot)} tickers)")
+                    return True
+                snapshot.close()
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring ticker snapshot: {e}")
+
+        if self.config.ticker_directory_file:
+            directory = TickerDirectory()
+            if directory.load(Path(self.config.ticker_directory_file)) and directory.age < ttl:
+                self._set_directory(directory)
+                return True
+
+        return False
+
+    def refresh_directory(self):
+        """
+        Download the ticker mapping files and rebuild the directory.
 
-            for row in rows:
-                if not isinstance(row, dict):
-                    continue
+        The result is also written to the configured ticker directory file
+        and snapshot, each replaced atomically.
 
-                row_ticker = row.get("ticker", "").upper()
-                if row_ticker == ticker:
-                    cik_str = row.get("cik_str")
-                    if cik_str is not None:
-                        return f"{int(cik_str):010d}"
+        Raises:
+            APIError: If company_tickers.json cannot be fetched.
+        """
+        tickers_json = self.client.get_company_tickers()
 
+        try:
+            ticker_text = self.client.get_ticker_mapping_text()
         except Exception as e:
-            logger.warning(f"Failed to lookup from JSON: {e}")
+            logger.warning(f"Failed to fetch ticker.txt, using company_tickers.json only: {e}")
+            ticker_text = None
+
+        directory = TickerDirectory()
+        directory.build(tickers_json, ticker_text)
+        self._set_directory(directory)
 
-        return None
+        try:
+            if self.config.ticker_directory_file:
+                directory.save(Path(self.config.ticker_directory_file))
+            if self.config.ticker_snapshot_file:
+                TickerSnapshot.write(
+                    Path(self.config.ticker_snapshot_file),
+                    directory.items(),
+                    directory.loaded_at
+                )
+        except OSError as e:
+            logger.warning(f"Could not persist ticker directory: {e}")
 
-    def _lookup_from_text(self, ticker: str) -> Optional[str]:
+    def _validate_ticker(self, ticker: str) -> str:
         """
-        Look up ticker in ticker.txt mapping file.
+        Validate and normalize ticker symbol.
 
         Args:
-            ticker: Normalized ticker symbol.
+            ticker: Raw ticker input.
 
         Returns:
-            10-digit CIK string or None if not found.
+            Normalized ticker (uppercase, stripped).
+
+        Raises:
+            ValidationError: If ticker is invalid.
         """
-        try:
-            text_content = self.client.get_ticker_mapping_text()
+        if not ticker or not isinstance(ticker, str):
+            raise ValidationError("Ticker must be a non-empty string")
 
-            for line in text_content.splitlines():
-                if "|" not in line:
-                    continue
+        ticker = ticker.strip().upper()
 
-                parts = line.split("|", 1)
-                if len(parts) != 2:
-                    continue
+        if not ticker:
+            raise ValidationError("Ticker cannot be empty after stripping whitespace")
 
-                file_ticker, cik = parts
-                if file_ticker.upper() == ticker:
-                    return f"{int(cik):010d}"
+        if len(ticker) > 10:
+            raise ValidationError("Ticker symbol too long (max 10 characters)")
 
-        except Exception as e:
-            logger.warning(f"Failed to lookup from text file: {e}")
+        # Basic validation - letters and maybe a hyphen or period
+        if not all(c.isalnum() or c in ('-', '.') for c in ticker):
+            raise ValidationError(f"Invalid ticker format: {ticker}")
 
-        return None
+        return ticker
 
     def get_company_info(self, ticker: str) -> Dict[str, any]:
         """
@@ -174,6 +285,38 @@ class CompanyLookup:
             TickerNotFoundError: If ticker cannot be resolved.
         """
         cik = self.get_cik_from_ticker(ticker)
+        return self.get_company_info_by_cik(cik, ticker)
+
+    def get_company_info_by_cik(self, cik: str, ticker: Optional[str] = None) -> Dict[str, any]:
+        """
+        Get comprehensive company information for a CIK.
+
+        Metadata loaded into the catalog within config.catalog_max_age is
+        used instead of the submissions API.
+
+        Args:
+            cik: CIK string (any zero padding).
+            ticker: Ticker to report; defaults to the company's first
+                    ticker in the catalog or, failing that, the directory.
+
+        Returns:
+            Dictionary with company information including CIK, name, etc.
+
+        Raises:
+            ValidationError: If CIK is invalid.
+        """
+        cik = self.validate_cik(cik)
+        if self.catalog is not None:
+            company = self.catalog.company(cik)
+            if company is not None and time.time() - company["updated_at"] <= self.config.catalog_max_age:
+                info = {"ticker": ticker or (company["tickers"][0] if company["tickers"] else None)}
+                info.update(company)
+                del info["updated_at"]
+                return info
+
+        if ticker is None:
+            tickers = self.get_tickers_for_cik(cik)
+            ticker = tickers[0] if tickers else None
 
         try:
             submissions = self.client.get_company_submissions(cik)
@@ -195,9 +338,66 @@ class CompanyLookup:
             return {
                 "ticker": ticker,
                 "cik": cik,
-                "name": "Unknown",
+                "name": self.directory.name_for(cik) or "Unknown",
             }
 
+    def load_name_index(self, force: bool = False) -> CompanyNameIndex:
+        """
+        Build the company-name index from EDGAR's cik-lookup-data.txt.
+
+        The list is streamed line by line, either straight from SEC or,
+        when config.company_names_file is set, from a local copy that is
+        downloaded (resumably) and re-downloaded after
+        config.company_names_ttl seconds.
+
+        Args:
+            force: Rebuild even if an index is already loaded.
+
+        Returns:
+            The loaded CompanyNameIndex.
+
+        Raises:
+            APIError: If the list cannot be downloaded.
+        """
+        with self._name_index_lock:
+            if self._name_index is not None and not force:
+                return self._name_index
+
+            index = CompanyNameIndex()
+            path = self.config.company_names_file
+            if path:
+                path = Path(path)
+                if force or not path.exists() or time.time() - path.stat().st_mtime > self.config.company_names_ttl:
+                    self.client.download_file(self.client.cik_lookup_data_url, path)
+                index.ingest_file(path)
+            else:
+                with self.client.get_cik_lookup_data() as response:
+                    index.ingest_lines(response.iter_lines(chunk_size=self.config.chunk_size))
+
+            self._name_index = index
+            return index
+
+    def search_companies(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Fuzzy search for companies by name, including filers without a
+        ticker and former names.
+
+        The name index is built on first use (see ``load_name_index``).
+
+        Args:
+            query: Company name or fragment.
+            limit: Maximum results.
+
+        Returns:
+            List of dictionaries with name, cik and score, best first.
+
+        Raises:
+            ValidationError: If the query is empty.
+        """
+        if not query or not query.strip():
+            raise ValidationError("Company name query cannot be empty")
+        return self.load_name_index().search(query, limit)
+
     def validate_cik(self, cik: str) -> str:
         """
         Validate and normalize CIK format.
@@ -226,6 +426,16 @@ class CompanyLookup:
             raise ValidationError(f"Invalid CIK format: {cik}")
 
     def clear_cache(self):
-        """Clear the ticker-to-CIK cache."""
-        self._ticker_cache.clear()
+        """Discard the in-memory ticker directory so it is reloaded on next use."""
+        with self._directory_lock:
+            self._set_directory(TickerDirectory())
+            self._refresh_failed_at = float("-inf")
         logger.info("Ticker cache cleared")
+
+    def close(self):
+        """Unmap the ticker snapshots in use."""
+        with self._directory_lock:
+            self._set_directory(TickerDirectory())
+            if self._retired is not None:
+                self._retired.close()
+                self._retired = None
@@ -4,7 +4,7 @@ Configuration management for SEC Filing Extractor.
 import os
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict
 from dataclasses import dataclass, field
 
 
@@ -19,13 +19,111 @@ class Config:
 
     # Rate Limiting
     request_delay: float = 0.2  # seconds between requests
+    rate_limit_burst: int = 1  # requests allowed back-to-back before pacing
+    rate_limit_scope: str = "process"  # "client", "process" or "host"
+    rate_limit_state_file: Optional[str] = None  # host scope; defaults to temp dir
     max_retries: int = 3
-    retry_delay: float = 1.0
+    retry_delay: float = 1.0  # backoff base; doubles per retry, with jitter
+    max_retry_delay: float = 60.0  # cap for backoff and Retry-After waits
+
+    # Circuit breaker per host and endpoint family (connection errors and 5xx count as failures)
+    circuit_breaker: bool = True
+    circuit_failure_threshold: float = 0.5  # failure rate that opens the circuit
+    circuit_window: int = 20  # recent requests the failure rate is computed over
+    circuit_min_requests: int = 10  # requests seen before the circuit may open
+    circuit_open_seconds: float = 30.0  # fail fast this long, then probe
+    circuit_half_open_probes: int = 1  # trial requests at once while half-open
+
+    # Request priority ("interactive", "pipeline" or "backfill")
+    default_priority: str = "pipeline"  # class of requests made outside request_priority()
+    priority_aging: float = 30.0  # seconds of waiting that promote a request one class
+
+    # Adaptive rate control (AIMD) driven by 429s and 503s carrying Retry-After
+    adaptive_rate: bool = True
+    adaptive_min_rate: float = 1.0  # requests per second floor
+    adaptive_increase: float = 0.1  # fraction of the ceiling regained per second of successes
+    adaptive_decrease: float = 0.5  # rate multiplier on throttling
+
+    # Connection Pooling
+    pool_connections: int = 10  # hosts whose keep-alive pools are cached
+    pool_maxsize: int = 10  # keep-alive connections per host
+    # host (e.g. "www.sec.gov") -> keep-alive connections, overriding pool_maxsize
+    pool_maxsize_per_host: Dict[str, int] = field(default_factory=dict)
+    pool_block: bool = False  # wait for a pooled connection instead of opening extras
+    http2: bool = False  # multiplex over HTTP/2; requires httpx[http2]
+
+    # HTTP Cache Configuration
+    http_cache_dir: Optional[str] = None  # on-disk response cache; None disables
+    # (URL substring, TTL seconds, stale-while-revalidate seconds); first match wins
+    http_cache_rules: tuple = field(default_factory=lambda: (
+        ("/files/company_tickers.json", 86400, 3600),
+        ("/include/ticker.txt", 86400, 3600),
+        ("/submissions/", 300, 60),
+        ("/api/xbrl/companyfacts/", 3600, 600),
+        ("/Archives/edgar/data/", 30 * 86400, 0),
+    ))
+
+    # Request Coalescing
+    single_flight: bool = True  # share one request among identical concurrent GETs
+
+    # Decoded JSON Cache (in memory, shared by all users of a client)
+    json_cache_max_bytes: int = 128 * 1024 * 1024  # approximate; 0 disables
+    json_cache_ttl: Optional[float] = 300.0  # seconds; None keeps entries until evicted
+
+    # Record/Replay ("off", "record" or "replay")
+    cassette_mode: str = "off"
+    cassette_path: Optional[str] = None  # zip archive of recorded interactions
+    cassette_latency: float = 0.0  # simulated seconds per replayed request
+
+    # Request Metrics
+    metrics_enabled: bool = True
+    metrics_file: Optional[str] = None  # periodically written snapshot
+    metrics_format: str = "prometheus"  # "prometheus" or "json"
+    metrics_interval: float = 15.0  # seconds between metrics_file writes
+
+    # Async Client Configuration
+    async_max_concurrency: int = 100  # requests in flight at once
+
+    # Ticker/CIK Directory
+    ticker_directory_file: Optional[str] = None  # persisted JSON copy; None keeps it in memory
+    ticker_snapshot_file: Optional[str] = None  # memory-mapped binary copy shared by processes
+    ticker_directory_ttl: float = 86400.0  # seconds before the directory is re-downloaded
+
+    # Company-name search (EDGAR cik-lookup-data.txt)
+    company_names_file: Optional[str] = None  # local copy; None streams from SEC on first search
+    company_names_ttl: float = 7 * 86400.0  # seconds before the local copy is re-downloaded
+    name_match_min_score: float = 0.9  # fuzzy score a name needs to stand in for an unknown ticker
+    name_match_min_lead: float = 0.1  # ...and its lead over the runner-up
+
+    # Filing Catalog (SQLite, filled from EDGAR's quarterly full index)
+    catalog_file: Optional[str] = None  # database path; None disables the catalog
+    catalog_index_type: str = "master"  # full-index flavour: "master" or "form"
+    bulk_submissions_file: Optional[str] = None  # local submissions.zip; defaults next to catalog_file
+    catalog_max_age: float = 2 * 86400.0  # seconds bulk-loaded data is served instead of the API
+
+    # Fact Store (columnar copy of EDGAR's bulk companyfacts.zip)
+    fact_store_dir: Optional[str] = None  # store directory; None fetches company facts from the API
+    bulk_companyfacts_file: Optional[str] = None  # local companyfacts.zip; defaults inside fact_store_dir
+    fact_store_max_age: float = 2 * 86400.0  # seconds stored facts are served instead of the API
+
+    # Watch Mode (daily-index poller)
+    watch_interval: float = 300.0  # seconds between polls of the daily index
+    watch_state_file: Optional[str] = None  # high-water mark; defaults to <output_dir>/.watch_state.json
+    watch_workers: int = 4  # new filings processed concurrently
+    watch_max_attempts: int = 3  # processing attempts per filing before giving up
+
+    # Download Queue (durable, resumable batch downloads)
+    queue_file: Optional[str] = None  # SQLite job queue; defaults to <output_dir>/.download_queue.db
+    queue_lease_seconds: float = 300.0  # a claimed task returns to the queue if its worker goes silent
+    queue_max_attempts: int = 5  # tries per filing index or file before it is marked failed
+    queue_retry_delay: float = 30.0  # seconds before the first retry; doubles with each attempt
 
     # Download Configuration
     default_output_dir: str = "filings"
     include_exhibits: bool = False
     chunk_size: int = 16384  # 16KB chunks for streaming
+    download_resume_attempts: int = 3  # Range resumes after a dropped connection
+    download_workers: int = 8  # files of one filing fetched concurrently (rate limit still applies)
 
     # Extraction Configuration
     min_table_columns: int = 2
@@ -108,6 +206,13 @@ class Config:
         """Get HTTP headers for SEC requests."""
         return {"User-Agent": self.user_agent}
 
+    @property
+    def requests_per_second(self) -> float:
+        """Get the request rate implied by request_delay (0 means unlimited)."""
+        if self.request_delay <= 0:
+            return 0.0
+        return 1.0 / self.request_delay
+
     @property
     def output_dir(self) -> Path:
         """Get output directory as Path object."""
@@ -121,6 +226,7 @@ class Config:
             default_output_dir=os.getenv("SEC_OUTPUT_DIR", cls.default_output_dir),
             log_level=os.getenv("SEC_LOG_LEVEL", cls.log_level),
             log_file=os.getenv("SEC_LOG_FILE"),
+            http_cache_dir=os.getenv("SEC_HTTP_CACHE_DIR"),
         )
 
     def update(self, **kwargs):
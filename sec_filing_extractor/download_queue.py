@@ -0,0 +1,589 @@
+"""
+Durable queue of filing downloads for long-running backfills.
+
+The queue is a SQLite database with one row per filing and one row per
+file of each filing. A filing is first *listed* (its ``index.json`` is
+fetched and one task per file recorded, with the size the index reports),
+then its files are downloaded by a pool of workers. Every state change is
+committed, so a backfill that dies resumes exactly where it stopped.
+
+Task states::
+
+    pending -> running -> done
+                      \\-> pending (retry after a delay) -> ... -> failed
+
+A worker claims a task by taking a lease on it, identified by a token
+unique to that claim. Leases are renewed while a download makes progress;
+a task whose lease runs out, or whose owner process on this host no longer
+exists, can be claimed again. Every update after a claim is conditional on
+the token, so a worker that lost its lease cannot overwrite the new
+holder's outcome. Files are downloaded to a lease-private name and renamed
+into place in the transaction that marks them done, so two holders never
+write the same file. An existing file whose size matches the index is
+finished work and is not fetched again.
+"""
+import os
+import glob
+import time
+import socket
+import sqlite3
+import logging
+import threading
+import itertools
+import contextvars
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Callable, Tuple
+
+from .config import Config
+from .filing_downloader import FilingDownloader
+from .filing_index import Filing
+from .exceptions import CircuitOpenError, DownloadError
+
+
+logger = logging.getLogger(__name__)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS filings (
+    accession TEXT PRIMARY KEY,
+    cik TEXT NOT NULL,
+    form TEXT NOT NULL,
+    filing_date TEXT NOT NULL,
+    primary_doc TEXT NOT NULL,
+    output_dir TEXT NOT NULL,
+    include_exhibits INTEGER NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    not_before REAL NOT NULL DEFAULT 0,
+    owner TEXT,
+    lease_expires REAL,
+    error TEXT,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS filings_state ON filings (state, not_before);
+CREATE TABLE IF NOT EXISTS files (
+    accession TEXT NOT NULL,
+    name TEXT NOT NULL,
+    url TEXT NOT NULL,
+    dest TEXT NOT NULL,
+    size INTEGER,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    not_before REAL NOT NULL DEFAULT 0,
+    owner TEXT,
+    lease_expires REAL,
+    error TEXT,
+    updated_at REAL,
+    PRIMARY KEY (accession, name)
+);
+CREATE INDEX IF NOT EXISTS files_state ON files (state, not_before);
+"""
+
+# Filing states: pending (not listed yet), listing, ready (files queued),
+# done, failed. File states: pending, running, done, failed.
+
+# Longest sleep of an idle worker while other tasks are still running
+_IDLE_POLL = 1.0
+
+
+def _index_size(value: Any) -> Optional[int]:
+    """Parse the size of an index.json item (empty for some entries)."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether a process exists on this host."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class DownloadQueue:
+    """
+    Persistent, resumable queue of filing downloads.
+
+    Several workers (threads of one process, or several processes sharing
+    the database file) may run the queue at once.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        downloader: Optional[FilingDownloader] = None,
+        config: Optional[Config] = None
+    ):
+        """
+        Open (or create) a queue.
+
+        Args:
+            path: SQLite database file.
+            downloader: Downloader whose client fetches indexes and files.
+                        If None, one is created.
+            config: Configuration object.
+        """
+        self.path = Path(path)
+        self.config = config or (downloader.config if downloader else Config())
+        self.downloader = downloader or FilingDownloader(config=self.config)
+        self.client = self.downloader.client
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self._lease_ids = itertools.count(1)
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn().executescript(_SCHEMA)
+        logger.info(f"Download queue opened: {self.path}")
+
+    def _conn(self) -> sqlite3.Connection:
+        """Get this thread's connection (autocommit; see ``_transaction``)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.path), timeout=60.0, isolation_level=None, check_same_thread=False
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in one write transaction, taking the lock up front."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def add(
+        self,
+        filings: Iterable[Filing],
+        output_dir: Optional[Path] = None,
+        include_exhibits: bool = False
+    ) -> int:
+        """
+        Queue filings for download.
+
+        Filings already in the queue are left as they are.
+
+        Args:
+            filings: Filings to download.
+            output_dir: Output directory (each filing gets a subdirectory
+                        named after its accession). If None, uses config
+                        default.
+            include_exhibits: Whether to include exhibit files.
+
+        Returns:
+            Number of filings newly queued.
+        """
+        output_dir = str(output_dir if output_dir is not None else self.config.output_dir)
+        now = time.time()
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO filings (accession, cik, form, filing_date, primary_doc, "
+                "output_dir, include_exhibits, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (f.accession, f.cik, f.form, f.filing_date, f.primary_doc,
+                     output_dir, int(include_exhibits), now)
+                    for f in filings
+                )
+            )
+            added = conn.total_changes - before
+        logger.info(f"Queued {added} filings")
+        return added
+
+    def status(self) -> Dict[str, Dict[str, int]]:
+        """
+        Count filings and files by state.
+
+        Returns:
+            Dictionary with ``filings`` and ``files`` state counts.
+        """
+        conn = self._conn()
+        return {
+            table: dict(conn.execute(f"SELECT state, COUNT(*) FROM {table} GROUP BY state").fetchall())
+            for table in ("filings", "files")
+        }
+
+    def retry_failed(self) -> int:
+        """
+        Return failed filings and files to the queue with fresh attempts.
+
+        Returns:
+            Number of tasks re-queued.
+        """
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.execute("UPDATE files SET state = 'pending', attempts = 0, not_before = 0 WHERE state = 'failed'")
+            conn.execute(
+                "UPDATE filings SET state = CASE WHEN EXISTS "
+                "(SELECT 1 FROM files WHERE files.accession = filings.accession) THEN 'ready' ELSE 'pending' END, "
+                "attempts = 0, not_before = 0 WHERE state = 'failed'"
+            )
+            return conn.total_changes - before
+
+    def recover(self) -> int:
+        """
+        Release the leases of workers that died on this host.
+
+        Leases of other hosts are released when they expire.
+
+        Returns:
+            Number of tasks returned to the queue.
+        """
+        host = socket.gethostname()
+        conn = self._conn()
+        dead = []
+        for (owner,) in conn.execute(
+            "SELECT owner FROM files WHERE state = 'running' "
+            "UNION SELECT owner FROM filings WHERE state = 'listing'"
+        ):
+            # Lease tokens are "<host>:<pid>:<claim number>"
+            owner_host, pid, _ = ((owner or "").rsplit(":", 2) + ["", ""])[:3]
+            if owner_host == host and pid.isdigit() and int(pid) != os.getpid() and os.name == "posix" \
+                    and not _pid_alive(int(pid)):
+                dead.append(owner)
+        if not dead:
+            return 0
+
+        with self._transaction() as conn:
+            before = conn.total_changes
+            for owner in dead:
+                conn.execute("UPDATE files SET state = 'pending', owner = NULL "
+                             "WHERE state = 'running' AND owner = ?", (owner,))
+                conn.execute("UPDATE filings SET state = 'pending', owner = NULL "
+                             "WHERE state = 'listing' AND owner = ?", (owner,))
+            released = conn.total_changes - before
+        logger.info(f"Recovered {released} tasks from stopped workers")
+        return released
+
+    def _claim(self, table: str, running: str, order: str = "") -> Optional[Dict[str, Any]]:
+        """
+        Lease the next claimable row of a table: a pending row that is due,
+        else a row whose lease has expired.
+
+        Returns:
+            The row as a dictionary, with the claim's ``lease`` token, or
+            None if nothing is claimable.
+        """
+        now = time.time()
+        lease = f"{self.owner}:{next(self._lease_ids)}"
+        with self._transaction() as conn:
+            row = conn.execute(
+                f"SELECT rowid, * FROM {table} WHERE state = 'pending' AND not_before <= ? {order} LIMIT 1",
+                (now,)
+            ).fetchone() or conn.execute(
+                f"SELECT rowid, * FROM {table} WHERE state = ? AND lease_expires < ? LIMIT 1",
+                (running, now)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                f"UPDATE {table} SET state = ?, owner = ?, lease_expires = ? WHERE rowid = ?",
+                (running, lease, now + self.config.queue_lease_seconds, row["rowid"])
+            )
+        task = dict(zip(row.keys(), row))
+        task["lease"] = lease
+        return task
+
+    def _claim_filing(self) -> Optional[Dict[str, Any]]:
+        """Lease a filing that still needs listing, newest first."""
+        return self._claim("filings", "listing", "ORDER BY filing_date DESC")
+
+    def _claim_file(self) -> Optional[Dict[str, Any]]:
+        """Lease a file waiting to be downloaded."""
+        return self._claim("files", "running")
+
+    @staticmethod
+    def _lost_lease(what: str) -> None:
+        """Log that a task was re-leased to another worker before this one finished."""
+        logger.warning(f"Lease on {what} expired and was taken over; dropping this worker's result")
+
+    def _retry_at(self, attempts: int, error: Exception) -> Tuple[str, float]:
+        """Get the state and earliest retry time after a failed attempt."""
+        cause = error.__cause__ if isinstance(error, DownloadError) else error
+        # Missing documents stay missing; retry_failed() re-queues them if needed
+        if attempts >= self.config.queue_max_attempts or getattr(cause, "status_code", None) == 404:
+            return "failed", 0.0
+        return "pending", time.time() + self.config.queue_retry_delay * 2 ** (attempts - 1)
+
+    def _list_filing(self, task: Dict[str, Any]):
+        """Fetch a filing's index and queue one task per file."""
+        filing = Filing(task["form"], task["accession"], task["filing_date"], task["primary_doc"], cik=task["cik"])
+        try:
+            files = self.downloader.list_filing_files(filing, bool(task["include_exhibits"]))
+        except CircuitOpenError as e:
+            with self._transaction() as conn:
+                conn.execute(
+                    "UPDATE filings SET state = 'pending', owner = NULL, not_before = ? "
+                    "WHERE accession = ? AND owner = ?",
+                    (time.time() + e.retry_in, filing.accession, task["lease"])
+                )
+            raise
+        except Exception as e:
+            attempts = task["attempts"] + 1
+            state, not_before = self._retry_at(attempts, e)
+            logger.warning(f"Listing {filing} failed (attempt {attempts}): {e}")
+            with self._transaction() as conn:
+                updated = conn.execute(
+                    "UPDATE filings SET state = ?, attempts = ?, not_before = ?, owner = NULL, error = ?, "
+                    "updated_at = ? WHERE accession = ? AND owner = ?",
+                    (state, attempts, not_before, str(e), time.time(), filing.accession, task["lease"])
+                ).rowcount
+            if not updated:
+                self._lost_lease(str(filing))
+            return
+
+        folder = self.downloader.build_filing_urls(filing)["folder"]
+        filing_dir = Path(task["output_dir"]) / filing.accession
+        now = time.time()
+        with self._transaction() as conn:
+            # Nothing left to download (e.g. only exhibits) completes the filing
+            updated = conn.execute(
+                "UPDATE filings SET state = ?, owner = NULL, error = NULL, updated_at = ? "
+                "WHERE accession = ? AND owner = ?",
+                ("ready" if files else "done", now, filing.accession, task["lease"])
+            ).rowcount
+            if updated:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO files (accession, name, url, dest, size, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        (filing.accession, item["name"], f"{folder}/{item['name']}",
+                         str(filing_dir / item["name"]), _index_size(item.get("size")), now)
+                        for item in files
+                    )
+                )
+        if not updated:
+            self._lost_lease(str(filing))
+            return
+        logger.info(f"Listed {len(files)} files of {filing}")
+
+    def _download(self, task: Dict[str, Any]) -> str:
+        """
+        Download one file task and record the outcome.
+
+        Returns:
+            "skipped", "downloaded", "retry", "failed", or "lost" if the
+            lease was taken over before the outcome could be recorded.
+        """
+        dest = Path(task["dest"])
+        expected = task["size"]
+
+        def complete(path: Path) -> bool:
+            try:
+                size = path.stat().st_size
+            except OSError:
+                return False
+            return expected is None or size == expected
+
+        if complete(dest):
+            return "skipped" if self._finish_file(task, "done") else "lost"
+
+        # Private to this claim: a worker whose lease expired writes elsewhere
+        token = task["lease"].rsplit(":", 2)
+        tmp = dest.with_name(f"{dest.name}.lease-{token[1]}-{token[2]}")
+        # Leftovers of earlier holders of this task (a process that died)
+        for stale in glob.glob(glob.escape(str(dest)) + ".lease-*"):
+            if not stale.startswith(str(tmp)):
+                try:
+                    os.unlink(stale)
+                except OSError:
+                    pass
+
+        lease_seconds = self.config.queue_lease_seconds
+        renew_at = [time.monotonic() + lease_seconds / 3]
+
+        def renew_lease(*_):
+            # Keep the task while a long download is making progress
+            if time.monotonic() >= renew_at[0]:
+                renew_at[0] = time.monotonic() + lease_seconds / 3
+                self._conn().execute(
+                    "UPDATE files SET lease_expires = ? WHERE rowid = ? AND owner = ?",
+                    (time.time() + lease_seconds, task["rowid"], task["lease"])
+                )
+
+        try:
+            self.client.download_file(task["url"], tmp, progress_callback=renew_lease)
+            if not complete(tmp):
+                size = tmp.stat().st_size
+                tmp.unlink()
+                raise DownloadError(f"Size mismatch: got {size} bytes, index lists {expected}")
+        except CircuitOpenError as e:
+            with self._transaction() as conn:
+                conn.execute(
+                    "UPDATE files SET state = 'pending', owner = NULL, not_before = ? WHERE rowid = ? AND owner = ?",
+                    (time.time() + e.retry_in, task["rowid"], task["lease"])
+                )
+            raise
+        except Exception as e:
+            attempts = task["attempts"] + 1
+            state, not_before = self._retry_at(attempts, e)
+            logger.warning(f"Downloading {task['url']} failed (attempt {attempts}): {e}")
+            if not self._finish_file(task, state, attempts=attempts, not_before=not_before, error=str(e)):
+                return "lost"
+            return "failed" if state == "failed" else "retry"
+
+        if not self._finish_file(task, "done", publish=tmp):
+            tmp.unlink()
+            return "lost"
+        return "downloaded"
+
+    def _finish_file(
+        self,
+        task: Dict[str, Any],
+        state: str,
+        attempts: Optional[int] = None,
+        not_before: float = 0.0,
+        error: Optional[str] = None,
+        publish: Optional[Path] = None
+    ) -> bool:
+        """
+        Record a file outcome and settle its filing once no file is left.
+
+        Args:
+            task: Claimed file task.
+            state: New state.
+            attempts: Attempts so far; None keeps the stored count.
+            not_before: Earliest retry time (for "pending").
+            error: Error message of a failed attempt.
+            publish: Downloaded file renamed to the destination together
+                     with the update.
+
+        Returns:
+            False if the lease was lost (nothing recorded).
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            updated = conn.execute(
+                "UPDATE files SET state = ?, attempts = ?, not_before = ?, owner = NULL, error = ?, "
+                "updated_at = ? WHERE rowid = ? AND owner = ?",
+                (state, task["attempts"] if attempts is None else attempts, not_before, error, now,
+                 task["rowid"], task["lease"])
+            ).rowcount
+            if not updated:
+                self._lost_lease(task["url"])
+                return False
+            if publish is not None:
+                # A failed rename rolls the update back
+                os.replace(publish, task["dest"])
+            if state in ("done", "failed"):
+                open_files, failed_files = conn.execute(
+                    "SELECT SUM(state IN ('pending', 'running')), SUM(state = 'failed') "
+                    "FROM files WHERE accession = ?", (task["accession"],)
+                ).fetchone()
+                if not open_files:
+                    conn.execute(
+                        "UPDATE filings SET state = ?, updated_at = ? WHERE accession = ? AND state = 'ready'",
+                        ("failed" if failed_files else "done", now, task["accession"])
+                    )
+        return True
+
+    def _next_retry(self) -> Optional[float]:
+        """Seconds until the next queued task may run (None if nothing is queued)."""
+        conn = self._conn()
+        waits = [
+            conn.execute(
+                f"SELECT MIN(CASE WHEN state = 'pending' THEN not_before ELSE lease_expires END) "
+                f"FROM {table} WHERE state IN ('pending', ?)", (running,)
+            ).fetchone()[0]
+            for table, running in (("filings", "listing"), ("files", "running"))
+        ]
+        waits = [w for w in waits if w is not None]
+        return max(0.0, min(waits) - time.time()) if waits else None
+
+    def run(
+        self,
+        workers: Optional[int] = None,
+        stop_event: Optional[threading.Event] = None,
+        progress_callback: Optional[Callable[[Dict[str, int]], None]] = None
+    ) -> Dict[str, int]:
+        """
+        Work through the queue until it is empty or stopped.
+
+        Tasks left running by a worker that died are recovered first.
+        Workers run in a copy of the caller's context, so a request
+        priority set by the caller (e.g. "backfill") applies. While the
+        archive circuit is open, workers wait instead of burning attempts.
+
+        Args:
+            workers: Concurrent workers; defaults to config.download_workers.
+            stop_event: Event that makes workers stop after their current
+                        task. Unfinished work stays queued.
+            progress_callback: Optional callback invoked with running totals
+                               (downloaded, skipped, retry, failed, lost)
+                               after each file.
+
+        Returns:
+            Totals for this run.
+        """
+        workers = workers or self.config.download_workers
+        stop_event = stop_event or threading.Event()
+        totals = {"downloaded": 0, "skipped": 0, "retry": 0, "failed": 0, "lost": 0}
+        totals_lock = threading.Lock()
+        self.recover()
+        logger.info(f"Running download queue with {workers} workers: {self.status()}")
+
+        def work():
+            while not stop_event.is_set():
+                try:
+                    task = self._claim_file()
+                    if task is not None:
+                        outcome = self._download(task)
+                        with totals_lock:
+                            totals[outcome] += 1
+                            if progress_callback:
+                                progress_callback(dict(totals))
+                        continue
+                    task = self._claim_filing()
+                    if task is not None:
+                        self._list_filing(task)
+                        continue
+                except CircuitOpenError as e:
+                    logger.warning(f"Archive circuit open, pausing queue for {e.retry_in:.0f}s")
+                    stop_event.wait(e.retry_in)
+                    continue
+
+                wait = self._next_retry()
+                if wait is None:
+                    return
+                stop_event.wait(min(max(wait, 0.05), _IDLE_POLL))
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sec-queue") as executor:
+            futures = [executor.submit(contextvars.copy_context().run, work) for _ in range(workers)]
+        for future in futures:
+            future.result()
+
+        logger.info(f"Download queue run finished: {totals}")
+        return totals
+
+    def close(self):
+        """Close every connection opened by this queue."""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -1,6 +1,7 @@
 """
 Custom exceptions for the SEC Filing Extractor.
 """
+from typing import Optional, List, Dict, Any
 
 
 class SECFilingException(Exception):
@@ -10,7 +11,18 @@ class SECFilingException(Exception):
 
 class TickerNotFoundError(SECFilingException):
     """Raised when a ticker symbol cannot be found."""
-    pass
+
+    def __init__(self, message: str = "", matches: Optional[List[Dict[str, Any]]] = None):
+        """
+        Initialize ticker not found error.
+
+        Args:
+            message: Error message.
+            matches: Company-name candidates too weak to stand in for
+                     the query, best first.
+        """
+        super().__init__(message)
+        self.matches = matches or []
 
 
 class CIKNotFoundError(SECFilingException):
@@ -35,7 +47,32 @@ class ExtractionError(SECFilingException):
 
 class APIError(SECFilingException):
     """Raised when SEC API returns an error."""
-    pass
+
+    def __init__(self, message: str = "", status_code: Optional[int] = None):
+        """
+        Initialize API error.
+
+        Args:
+            message: Error message.
+            status_code: HTTP status code, if the server responded.
+        """
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class CircuitOpenError(APIError):
+    """Raised without a request when an endpoint's circuit breaker is open."""
+
+    def __init__(self, message: str = "", retry_in: float = 0.0):
+        """
+        Initialize circuit open error.
+
+        Args:
+            message: Error message.
+            retry_in: Seconds until the circuit allows a probe request.
+        """
+        super().__init__(message)
+        self.retry_in = retry_in
 
 
 class RateLimitError(SECFilingException):
@@ -10,6 +10,7 @@ from typing import Dict, Any, Optional, Tuple, List
 from .base import BaseExtractor
 from ..sec_client import SECClient
 from ..config import Config
+from ..fact_store import FactStore
 from ..exceptions import ExtractionError
 
 
@@ -24,7 +25,8 @@ class FinancialStatementExtractor(BaseExtractor):
     def __init__(
         self,
         client: Optional[SECClient] = None,
-        config: Optional[Config] = None
+        config: Optional[Config] = None,
+        fact_store: Optional[FactStore] = None
     ):
         """
         Initialize financial statement extractor.
@@ -32,9 +34,33 @@ class FinancialStatementExtractor(BaseExtractor):
         Args:
             client: SEC API client for fetching company facts.
             config: Configuration object.
+            fact_store: Local bulk company facts, read instead of the API
+                        for companies it holds.
         """
         super().__init__(config)
         self.client = client or SECClient(self.config)
+        self.fact_store = fact_store
+
+    def _get_company_facts(self, cik: str, concepts: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        """
+        Get company facts from the fact store, or the API if the store does
+        not hold the company or is older than config.fact_store_max_age.
+
+        Args:
+            cik: 10-digit CIK string.
+            concepts: Concept names needed; None for all. The API always
+                      returns every concept.
+
+        Returns:
+            Company facts data.
+        """
+        store = self.fact_store
+        if store is not None and store.age <= self.config.fact_store_max_age:
+            facts = store.company_facts(cik, concepts)
+            if facts is not None:
+                logger.debug(f"Company facts for CIK {cik} read from fact store")
+                return facts
+        return self.client.get_company_facts(cik)
 
     def extract(
         self,
@@ -66,8 +92,16 @@ class FinancialStatementExtractor(BaseExtractor):
         logger.info(f"Extracting financial statements for CIK {cik}")
 
         try:
-            # Fetch company facts
-            facts = self.client.get_company_facts(cik)
+            # Define statement concepts
+            statements = {
+                "IS": self.config.income_statement_concepts,
+                "BS": self.config.balance_sheet_concepts,
+                "CF": self.config.cash_flow_concepts,
+            }
+
+            # Fetch company facts (all of them if the raw document is kept)
+            needed = None if save_raw else tuple(c for concepts in statements.values() for c in concepts)
+            facts = self._get_company_facts(cik, needed)
 
             # Extract US-GAAP facts
             us_gaap = facts.get("facts", {}).get("us-gaap", {})
@@ -77,13 +111,6 @@ class FinancialStatementExtractor(BaseExtractor):
             if not us_gaap:
                 raise ExtractionError("No US-GAAP facts found in company facts")
 
-            # Define statement concepts
-            statements = {
-                "IS": self.config.income_statement_concepts,
-                "BS": self.config.balance_sheet_concepts,
-                "CF": self.config.cash_flow_concepts,
-            }
-
             generated = {}
 
             # Generate each statement
@@ -273,7 +300,7 @@ class FinancialStatementExtractor(BaseExtractor):
         logger.info(f"Extracting custom concepts for CIK {cik}")
 
         try:
-            facts = self.client.get_company_facts(cik)
+            facts = self._get_company_facts(cik, tuple(concepts))
             us_gaap = facts.get("facts", {}).get("us-gaap", {})
             if not us_gaap:
                 us_gaap = facts.get("facts", {})
@@ -0,0 +1,476 @@
+"""
+Columnar on-disk store of XBRL company facts.
+
+EDGAR publishes every company's ``companyfacts`` document in one nightly
+archive (``Archives/edgar/daily-index/xbrl/companyfacts.zip``). The store
+loads it member by member and appends every observation to a set of
+column files, one fixed-width array per field::
+
+    fact_store/
+        manifest.json            generation, string tables, per-CIK row ranges
+        g-<timestamp>/
+            concept.col          u32 id into the concept table
+            unit.col             u32 id into the unit table
+            start.col, end.col   u32 dates as YYYYMMDD (0 if absent)
+            filed.col            u32 date as YYYYMMDD
+            val.col              f64 value
+            accn.col             u64 accession number digits
+            fy.col               u16 fiscal year (0 if absent)
+            fp.col, form.col     u16 ids into the fiscal-period/form tables
+            frame.col            u32 id into the frame table (0 if absent)
+
+Column files are written in native byte order with ``array.tofile`` and
+read back through ``mmap``, so opening a store parses only the manifest,
+and a company's facts are a contiguous row range in every column. Each
+ingest writes a new generation directory and switches to it by atomically
+replacing the manifest.
+"""
+import os
+import re
+import json
+import mmap
+import time
+import shutil
+import logging
+import zipfile
+import tempfile
+import threading
+from array import array
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Iterable, Tuple
+
+from .config import Config
+from .sec_client import SECClient
+from .exceptions import ValidationError
+
+
+logger = logging.getLogger(__name__)
+
+
+# Column name -> array typecode
+_COLUMNS = (
+    ("concept", "I"),
+    ("unit", "I"),
+    ("start", "I"),
+    ("end", "I"),
+    ("filed", "I"),
+    ("val", "d"),
+    ("accn", "Q"),
+    ("fy", "H"),
+    ("fp", "H"),
+    ("form", "H"),
+    ("frame", "I"),
+)
+
+_FACTS_ENTRY = re.compile(r"CIK(\d{10})\.json$")
+
+# Rows buffered in memory per column before they are appended to disk
+_FLUSH_ROWS = 1 << 16
+
+_MANIFEST = "manifest.json"
+
+
+def _pack_date(value: Optional[str]) -> int:
+    """Encode YYYY-MM-DD as the integer YYYYMMDD (0 if absent)."""
+    if not value:
+        return 0
+    try:
+        return int(value.replace("-", ""))
+    except ValueError:
+        return 0
+
+
+def _unpack_date(value: int) -> str:
+    """Decode an integer YYYYMMDD to YYYY-MM-DD."""
+    return f"{value // 10000:04d}-{value // 100 % 100:02d}-{value % 100:02d}"
+
+
+def _pack_accession(value: Optional[str]) -> int:
+    """Encode an accession number (0000320193-24-000123) as its 18 digits."""
+    digits = (value or "").replace("-", "")
+    return int(digits) if len(digits) == 18 and digits.isdigit() else 0
+
+
+def _unpack_accession(value: int) -> str:
+    """Decode accession digits to the dashed form."""
+    if not value:
+        return ""
+    digits = f"{value:018d}"
+    return f"{digits[:10]}-{digits[10:12]}-{digits[12:]}"
+
+
+class _StringTable(dict):
+    """Append-only value to id mapping used while ingesting (``table[value]`` assigns ids)."""
+
+    def __init__(self, reserve_empty: bool):
+        super().__init__()
+        self.values: List[Any] = []
+        if reserve_empty:
+            self[None]  # id 0
+
+    def __missing__(self, value: Any) -> int:
+        key = self[value] = len(self.values)
+        self.values.append(value)
+        return key
+
+
+class _Packed(dict):
+    """Memo of an encoding function; dates and accessions repeat across observations."""
+
+    def __init__(self, pack):
+        super().__init__()
+        self._pack = pack
+
+    def __missing__(self, value: Any) -> int:
+        packed = self[value] = self._pack(value)
+        return packed
+
+
+class FactStore:
+    """
+    Local columnar copy of EDGAR's bulk company facts.
+
+    ``company_facts`` returns the same document shape as the companyfacts
+    API, so extractors can use either source.
+    """
+
+    def __init__(self, path: Path, client: Optional[SECClient] = None, config: Optional[Config] = None):
+        """
+        Open (or prepare) a store.
+
+        Args:
+            path: Store directory.
+            client: SEC API client used by ``update_from_bulk``. If None, one
+                    is created on first download.
+            config: Configuration object.
+        """
+        self.path = Path(path)
+        self.config = config or Config()
+        self._client = client
+        self._lock = threading.Lock()
+        self._manifest: Optional[Dict[str, Any]] = None
+        self._maps: List[mmap.mmap] = []
+        self._views: Dict[str, memoryview] = {}
+        self._concepts: List[Tuple[str, str, Optional[str], Optional[str]]] = []
+        self._concept_ids: Dict[str, List[int]] = {}
+        self.reload()
+
+    @property
+    def client(self) -> SECClient:
+        """SEC client used for downloads."""
+        if self._client is None:
+            self._client = SECClient(self.config)
+        return self._client
+
+    def reload(self):
+        """Map the generation named by the manifest (if any)."""
+        try:
+            with open(self.path / _MANIFEST, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable fact store manifest in {self.path}: {e}")
+            return
+
+        maps, views = [], {}
+        generation = self.path / manifest["generation"]
+        try:
+            if manifest["rows"]:
+                for name, typecode in _COLUMNS:
+                    with open(generation / f"{name}.col", "rb") as f:
+                        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    maps.append(mm)
+                    views[name] = memoryview(mm).cast(typecode)
+                    if len(views[name]) != manifest["rows"]:
+                        raise ValueError(f"column {name} has {len(views[name])} rows")
+        except (OSError, ValueError) as e:
+            for view in views.values():
+                view.release()
+            for mm in maps:
+                mm.close()
+            logger.warning(f"Ignoring damaged fact store generation {generation}: {e}")
+            return
+
+        concept_ids: Dict[str, List[int]] = {}
+        for concept_id, (_, name, _, _) in enumerate(manifest["concepts"]):
+            concept_ids.setdefault(name, []).append(concept_id)
+
+        with self._lock:
+            self._unmap()
+            self._manifest = manifest
+            self._maps = maps
+            self._views = views
+            self._concepts = [tuple(entry) for entry in manifest["concepts"]]
+            self._concept_ids = concept_ids
+        logger.debug(f"Mapped fact store {generation} ({manifest['rows']} facts)")
+
+    def _unmap(self):
+        """Release the mapped columns. Caller must hold the lock."""
+        for view in self._views.values():
+            view.release()
+        for mm in self._maps:
+            mm.close()
+        self._views = {}
+        self._maps = []
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the store holds an ingested archive."""
+        return self._manifest is not None
+
+    @property
+    def age(self) -> float:
+        """Seconds since the store was built (infinite if empty)."""
+        if self._manifest is None:
+            return float("inf")
+        return time.time() - self._manifest["built_at"]
+
+    def __len__(self) -> int:
+        return self._manifest["rows"] if self._manifest is not None else 0
+
+    def __contains__(self, cik: str) -> bool:
+        return self._manifest is not None and cik in self._manifest["companies"]
+
+    def ingest_companyfacts_zip(self, path: Path) -> Dict[str, int]:
+        """
+        Build the store from a bulk companyfacts.zip.
+
+        Members are decoded one at a time directly from the archive and
+        their observations appended to column buffers that are flushed to
+        disk every few thousand rows, so memory stays bounded by the
+        largest member plus the string tables.
+
+        Args:
+            path: Local copy of companyfacts.zip.
+
+        Returns:
+            Dictionary with the numbers of companies and facts loaded.
+
+        Raises:
+            ValidationError: If the file is not a zip archive.
+        """
+        try:
+            archive = zipfile.ZipFile(path)
+        except zipfile.BadZipFile as e:
+            raise ValidationError(f"Not a companyfacts archive: {path}: {e}") from e
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        generation = f"g-{time.time_ns()}"
+        generation_dir = self.path / generation
+        generation_dir.mkdir()
+
+        tables = {
+            # Id 0 of the optional fields' tables stands for "absent"
+            "concepts": _StringTable(reserve_empty=False),
+            "units": _StringTable(reserve_empty=False),
+            "fps": _StringTable(reserve_empty=True),
+            "forms": _StringTable(reserve_empty=True),
+            "frames": _StringTable(reserve_empty=True),
+            "dates": _Packed(_pack_date),
+            "accessions": _Packed(_pack_accession),
+        }
+        concept_text: Dict[int, Tuple[Optional[str], Optional[str]]] = {}
+        buffers = {name: array(typecode) for name, typecode in _COLUMNS}
+        files = {name: open(generation_dir / f"{name}.col", "wb") for name, _ in _COLUMNS}
+        companies: Dict[str, Tuple[int, int, str]] = {}
+        rows = 0
+
+        def flush():
+            for name, buffer in buffers.items():
+                buffer.tofile(files[name])
+                del buffer[:]
+
+        try:
+            with archive:
+                entries = [info for info in archive.infolist() if _FACTS_ENTRY.search(info.filename)]
+                for position, info in enumerate(entries, 1):
+                    cik = _FACTS_ENTRY.search(info.filename).group(1)
+                    try:
+                        with archive.open(info) as f:
+                            document = json.load(f)
+                    except (ValueError, zipfile.BadZipFile) as e:
+                        logger.warning(f"Skipping unreadable entry {info.filename}: {e}")
+                        continue
+
+                    first = rows
+                    tables["accessions"].clear()  # accession numbers rarely recur across companies
+                    for taxonomy, concepts in (document.get("facts") or {}).items():
+                        for concept, fact in concepts.items():
+                            concept_id = tables["concepts"][(taxonomy, concept)]
+                            if concept_id not in concept_text:
+                                concept_text[concept_id] = (fact.get("label"), fact.get("description"))
+                            for unit, observations in (fact.get("units") or {}).items():
+                                unit_id = tables["units"][unit]
+                                rows += self._append_observations(
+                                    buffers, tables, concept_id, unit_id, observations
+                                )
+                            if len(buffers["concept"]) >= _FLUSH_ROWS:
+                                flush()
+                    companies[cik] = (first, rows - first, document.get("entityName") or "")
+
+                    if position % 1000 == 0:
+                        logger.info(f"Bulk company facts: {position}/{len(entries)} companies, {rows} facts")
+            flush()
+        except BaseException:
+            for f in files.values():
+                f.close()
+            shutil.rmtree(generation_dir, ignore_errors=True)
+            raise
+        for f in files.values():
+            f.close()
+
+        manifest = {
+            "generation": generation,
+            "rows": rows,
+            "built_at": time.time(),
+            "source": str(path),
+            "concepts": [
+                [taxonomy, concept, *concept_text[concept_id]]
+                for concept_id, (taxonomy, concept) in enumerate(tables["concepts"].values)
+            ],
+            "units": tables["units"].values,
+            "fps": tables["fps"].values,
+            "forms": tables["forms"].values,
+            "frames": tables["frames"].values,
+            "companies": {cik: list(entry) for cik, entry in companies.items()},
+        }
+        fd, tmp_name = tempfile.mkstemp(dir=str(self.path), prefix=".tmp-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, separators=(",", ":"))
+        os.replace(tmp_name, self.path / _MANIFEST)
+        self.reload()
+
+        # Older generations are no longer referenced (mapped copies stay valid on POSIX)
+        for old in self.path.glob("g-*"):
+            if old.name != generation:
+                shutil.rmtree(old, ignore_errors=True)
+
+        logger.info(f"Loaded {len(companies)} companies and {rows} facts from {path}")
+        return {"companies": len(companies), "facts": rows}
+
+    @staticmethod
+    def _append_observations(
+        buffers: Dict[str, array],
+        tables: Dict[str, _StringTable],
+        concept_id: int,
+        unit_id: int,
+        observations: List[Dict[str, Any]]
+    ) -> int:
+        """Append one concept/unit block of observations to the column buffers, column by column."""
+        count = len(observations)
+        dates, accessions = tables["dates"], tables["accessions"]
+        fps, forms, frames = tables["fps"], tables["forms"], tables["frames"]
+        buffers["concept"].extend([concept_id] * count)
+        buffers["unit"].extend([unit_id] * count)
+        buffers["start"].extend([dates[obs.get("start")] for obs in observations])
+        buffers["end"].extend([dates[obs.get("end")] for obs in observations])
+        buffers["filed"].extend([dates[obs.get("filed")] for obs in observations])
+        buffers["val"].extend([float(obs.get("val") or 0) for obs in observations])
+        buffers["accn"].extend([accessions[obs.get("accn")] for obs in observations])
+        buffers["fy"].extend([obs.get("fy") or 0 for obs in observations])
+        buffers["fp"].extend([fps[obs.get("fp")] for obs in observations])
+        buffers["form"].extend([forms[obs.get("form")] for obs in observations])
+        buffers["frame"].extend([frames[obs.get("frame")] for obs in observations])
+        return count
+
+    def update_from_bulk(self, path: Optional[Path] = None, force: bool = False) -> Dict[str, int]:
+        """
+        Download (resumably) and ingest EDGAR's bulk companyfacts.zip.
+
+        An existing local copy younger than config.fact_store_max_age is
+        reused instead of downloaded again.
+
+        Args:
+            path: Local archive path; defaults to config.bulk_companyfacts_file,
+                  then ``companyfacts.zip`` inside the store directory.
+            force: Download even if a recent copy exists.
+
+        Returns:
+            Dictionary with the numbers of companies and facts loaded.
+
+        Raises:
+            DownloadError: If the download fails.
+        """
+        path = Path(path or self.config.bulk_companyfacts_file or self.path / "companyfacts.zip")
+        if force or not path.exists() or time.time() - path.stat().st_mtime > self.config.fact_store_max_age:
+            self.client.download_file(self.client.bulk_companyfacts_url, path)
+        return self.ingest_companyfacts_zip(path)
+
+    def company_facts(self, cik: str, concepts: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a company's facts in the companyfacts API document shape.
+
+        Args:
+            cik: 10-digit CIK string.
+            concepts: Concept names (any taxonomy) to include; None includes
+                      all.
+
+        Returns:
+            Dictionary with cik, entityName and facts, or None if the
+            company is not in the store.
+        """
+        with self._lock:
+            manifest = self._manifest
+            if manifest is None or cik not in manifest["companies"]:
+                return None
+            start, count, entity_name = manifest["companies"][cik]
+            end = start + count
+            views = self._views
+            concept_table, concept_ids = self._concepts, self._concept_ids
+            columns = {name: views[name][start:end].tolist() for name, _ in _COLUMNS} if count else {}
+
+        facts: Dict[str, Dict[str, Any]] = {}
+        if not count:
+            return {"cik": int(cik), "entityName": entity_name, "facts": facts}
+
+        wanted = None
+        if concepts is not None:
+            wanted = {cid for name in concepts for cid in concept_ids.get(name, ())}
+
+        units, fps, forms, frames = manifest["units"], manifest["fps"], manifest["forms"], manifest["frames"]
+        concept_column, unit_column = columns["concept"], columns["unit"]
+        starts, ends, filed, vals = columns["start"], columns["end"], columns["filed"], columns["val"]
+        accns, fys, fp_column, form_column, frame_column = (
+            columns["accn"], columns["fy"], columns["fp"], columns["form"], columns["frame"]
+        )
+
+        for row in range(count):
+            concept_id = concept_column[row]
+            taxonomy, concept, label, description = concept_table[concept_id]
+            # Taxonomies are listed even when none of their concepts are wanted
+            taxonomy_facts = facts.setdefault(taxonomy, {})
+            if wanted is not None and concept_id not in wanted:
+                continue
+            fact = taxonomy_facts.get(concept)
+            if fact is None:
+                fact = taxonomy_facts[concept] = {"label": label, "description": description, "units": {}}
+
+            val = vals[row]
+            obs: Dict[str, Any] = {}
+            if starts[row]:
+                obs["start"] = _unpack_date(starts[row])
+            obs["end"] = _unpack_date(ends[row]) if ends[row] else None
+            obs["val"] = int(val) if val.is_integer() else val
+            obs["accn"] = _unpack_accession(accns[row])
+            obs["fy"] = fys[row] or None
+            obs["fp"] = fps[fp_column[row]]
+            obs["form"] = forms[form_column[row]]
+            obs["filed"] = _unpack_date(filed[row]) if filed[row] else None
+            if frame_column[row]:
+                obs["frame"] = frames[frame_column[row]]
+            fact["units"].setdefault(units[unit_column[row]], []).append(obs)
+
+        return {"cik": int(cik), "entityName": entity_name, "facts": facts}
+
+    def close(self):
+        """Unmap the store."""
+        with self._lock:
+            self._unmap()
+            self._manifest = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -3,35 +3,25 @@ Filing download functionality.
 """
 import logging
 import re
+import threading
+import contextvars
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple, Callable
-from dataclasses import dataclass
+from typing import Optional, List, Dict, Tuple, Callable, Iterator, Any
 
 from .sec_client import SECClient
 from .config import Config
-from .exceptions import DownloadError, FilingNotFoundError
+from .filing_index import Filing, FilingIndex
+from .catalog import FilingCatalog
+from .exceptions import DownloadError, FilingNotFoundError, CircuitOpenError
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class Filing:
-    """Represents a single SEC filing."""
-    form: str
-    accession: str
-    filing_date: str
-    primary_doc: str
-    cik: str = ""
-    company_name: str = ""
-
-    @property
-    def accession_no_dash(self) -> str:
-        """Get accession number without dashes."""
-        return self.accession.replace("-", "")
-
-    def __str__(self) -> str:
-        return f"{self.form} | {self.filing_date} | {self.accession}"
+# Filing indexes kept per downloader; each pins its submissions document
+_INDEX_CACHE_SIZE = 32
 
 
 class FilingDownloader:
@@ -42,7 +32,8 @@ class FilingDownloader:
     def __init__(
         self,
         client: Optional[SECClient] = None,
-        config: Optional[Config] = None
+        config: Optional[Config] = None,
+        catalog: Optional[FilingCatalog] = None
     ):
         """
         Initialize filing downloader.
@@ -50,25 +41,99 @@ class FilingDownloader:
         Args:
             client: SEC API client. If None, creates a new one.
             config: Configuration object.
+            catalog: Filing catalog; companies loaded into it from the bulk
+                     submissions archive are listed without API requests.
         """
         self.config = config or Config()
         self.client = client or SECClient(self.config)
+        self.catalog = catalog
+        # CIK -> (submissions document, index built from it)
+        self._indexes: "OrderedDict[str, Tuple[Dict[str, Any], FilingIndex]]" = OrderedDict()
+        self._indexes_lock = threading.Lock()
         logger.info("FilingDownloader initialized")
 
+    def get_submissions_index(self, cik: str) -> FilingIndex:
+        """
+        Get the columnar index of a company's recent filings.
+
+        Companies loaded into the catalog from the bulk submissions archive
+        within config.catalog_max_age are served from it (with their full
+        history). Otherwise the submissions API is used, and indexes are
+        reused for as long as the client returns the same submissions
+        document (i.e. while it stays in the JSON cache).
+
+        Args:
+            cik: 10-digit CIK string.
+
+        Returns:
+            FilingIndex over the catalog's filings or ``filings.recent``.
+
+        Raises:
+            APIError: If request fails.
+        """
+        local = self._catalog_index(cik)
+        if local is not None:
+            return local
+        return self._index_submissions(cik, self.client.get_company_submissions(cik))
+
+    def _catalog_index(self, cik: str) -> Optional[FilingIndex]:
+        """Get a company's filings from the catalog, if loaded there recently."""
+        if self.catalog is None:
+            return None
+        index = self.catalog.company_filings(cik, max_age=self.config.catalog_max_age)
+        if index is not None:
+            logger.debug(f"Serving filings for CIK {cik} from the catalog")
+        return index
+
+    def _index_submissions(self, cik: str, submissions: Dict[str, Any]) -> FilingIndex:
+        """Get the (cached) FilingIndex of a submissions document's recent block."""
+        with self._indexes_lock:
+            cached = self._indexes.get(cik)
+            if cached is not None and cached[0] is submissions:
+                self._indexes.move_to_end(cik)
+                return cached[1]
+
+        index = FilingIndex(
+            submissions.get("filings", {}).get("recent", {}),
+            cik=cik,
+            company_name=submissions.get("name", "Unknown")
+        )
+        with self._indexes_lock:
+            self._indexes[cik] = (submissions, index)
+            self._indexes.move_to_end(cik)
+            while len(self._indexes) > _INDEX_CACHE_SIZE:
+                self._indexes.popitem(last=False)
+        return index
+
     def get_recent_filings(
         self,
         cik: str,
         form_types: Optional[Tuple[str, ...]] = None,
-        limit: int = 20
+        limit: int = 20,
+        items: Optional[Tuple[str, ...]] = None,
+        xbrl: Optional[bool] = None,
+        inline_xbrl: Optional[bool] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None
     ) -> List[Filing]:
         """
         Get recent filings for a company.
 
+        All filters are applied to the submissions metadata, so filings
+        that do not match are never downloaded.
+
         Args:
             cik: 10-digit CIK string.
             form_types: Tuple of form types to filter (e.g., ('10-K', '10-Q')).
                        If None, uses config default.
             limit: Maximum number of filings to return.
+            items: Item codes to match (e.g., ('2.02', '5.02') for 8-Ks);
+                   a filing matches if it reports any of them.
+            xbrl: If set, only filings with (True) or without (False) XBRL.
+            inline_xbrl: If set, only filings with (True) or without (False)
+                        inline XBRL.
+            min_size: Minimum submission size in bytes.
+            max_size: Maximum submission size in bytes.
 
         Returns:
             List of Filing objects.
@@ -81,33 +146,14 @@ class FilingDownloader:
 
         logger.info(f"Fetching recent filings for CIK {cik}, forms: {form_types}")
 
-        submissions = self.client.get_company_submissions(cik)
-        recent = submissions.get("filings", {}).get("recent", {})
-
-        if not recent:
+        index = self.get_submissions_index(cik)
+        if not len(index):
             raise FilingNotFoundError(f"No filings found for CIK {cik}")
 
-        company_name = submissions.get("name", "Unknown")
-        filings = []
-
-        forms = recent.get("form", [])
-        accessions = recent.get("accessionNumber", [])
-        filing_dates = recent.get("filingDate", [])
-        primary_docs = recent.get("primaryDocument", [])
-
-        for i, form in enumerate(forms):
-            if form in form_types:
-                filings.append(Filing(
-                    form=form,
-                    accession=accessions[i],
-                    filing_date=filing_dates[i],
-                    primary_doc=primary_docs[i],
-                    cik=cik,
-                    company_name=company_name
-                ))
-
-            if len(filings) >= limit:
-                break
+        filings = index.select(
+            form_types, limit=limit, items=items, xbrl=xbrl,
+            inline_xbrl=inline_xbrl, min_size=min_size, max_size=max_size
+        )
 
         if not filings:
             raise FilingNotFoundError(
@@ -117,6 +163,89 @@ class FilingDownloader:
         logger.info(f"Found {len(filings)} filings")
         return filings
 
+    def iter_filings(
+        self,
+        cik: str,
+        form_types: Optional[Tuple[str, ...]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        items: Optional[Tuple[str, ...]] = None,
+        xbrl: Optional[bool] = None,
+        inline_xbrl: Optional[bool] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None
+    ) -> Iterator[Filing]:
+        """
+        Iterate over a company's full filing history, newest first.
+
+        Walks ``filings.recent`` and then the older pages listed in
+        ``filings.files``. Pages are fetched lazily, only when iteration
+        reaches them, and pages entirely outside the date range are never
+        fetched; iteration stops at the first filing older than ``since``.
+        Companies loaded from the bulk submissions archive are read from
+        the catalog instead.
+
+        Args:
+            cik: 10-digit CIK string.
+            form_types: Tuple of form types to include. If None, uses
+                       config default; an empty tuple includes every form.
+            since: Earliest filing date to include (YYYY-MM-DD).
+            until: Latest filing date to include (YYYY-MM-DD).
+            items: Item codes to match; a filing matches if it reports any.
+            xbrl: If set, only filings with (True) or without (False) XBRL.
+            inline_xbrl: If set, only filings with (True) or without (False)
+                        inline XBRL.
+            min_size: Minimum submission size in bytes.
+            max_size: Maximum submission size in bytes.
+
+        Yields:
+            Filing objects.
+
+        Raises:
+            APIError: If a request fails.
+        """
+        if form_types is None:
+            form_types = self.config.supported_form_types
+
+        logger.info(f"Iterating filings for CIK {cik}, forms: {form_types}, "
+                    f"dates: {since or '*'} to {until or '*'}")
+
+        filters = dict(items=items, xbrl=xbrl, inline_xbrl=inline_xbrl,
+                       min_size=min_size, max_size=max_size)
+
+        local = self._catalog_index(cik)
+        if local is not None:
+            for row in local.rows(form_types, since, until, **filters):
+                yield local[row]
+            return
+
+        submissions = self.client.get_company_submissions(cik)
+        company_name = submissions.get("name", "Unknown")
+        pages = submissions.get("filings", {}).get("files", [])
+
+        index = self._index_submissions(cik, submissions)
+        for row in index.rows(form_types, since, until, **filters):
+            yield index[row]
+        if since and index.oldest_date and index.oldest_date < since:
+            return
+
+        for page in pages:
+            # Pages carry their date range, so skip those outside it unread
+            if since and page.get("filingTo") and page["filingTo"] < since:
+                return
+            if until and page.get("filingFrom") and page["filingFrom"] > until:
+                continue
+
+            index = FilingIndex(
+                self.client.get_submissions_page(page["name"]),
+                cik=cik,
+                company_name=company_name
+            )
+            for row in index.rows(form_types, since, until, **filters):
+                yield index[row]
+            if since and index.oldest_date and index.oldest_date < since:
+                return
+
     def build_filing_urls(self, filing: Filing) -> Dict[str, str]:
         """
         Build URLs for a filing.
@@ -142,6 +271,40 @@ class FilingDownloader:
                           f"{filing.accession_no_dash}&xbrl_type=v"),
         }
 
+    def list_filing_files(self, filing: Filing, include_exhibits: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get the files of a filing from its ``index.json``.
+
+        Args:
+            filing: Filing object.
+            include_exhibits: Whether to include exhibit files; otherwise
+                              only HTML, text and XML documents are listed.
+
+        Returns:
+            Index items (dictionaries with name, size, type, ...).
+
+        Raises:
+            APIError: If the index request fails.
+            DownloadError: If the index lists no files.
+        """
+        cik_no_zeros = str(int(filing.cik))
+        index_data = self.client.get_filing_index(
+            cik_no_zeros,
+            filing.accession_no_dash
+        )
+
+        files = index_data.get("directory", {}).get("item", [])
+        if not files:
+            raise DownloadError("No files found in filing index")
+
+        # Filter files if not including exhibits
+        if not include_exhibits:
+            files = [
+                f for f in files
+                if re.search(r"\.(htm|html|txt|xml)$", f["name"], re.I)
+            ]
+        return files
+
     def download_filing(
         self,
         filing: Filing,
@@ -152,17 +315,28 @@ class FilingDownloader:
         """
         Download entire filing package.
 
+        Files are fetched concurrently by up to config.download_workers
+        threads; the client's shared rate limiter still paces every
+        request, so the pool only overlaps round trips. Workers run in a
+        copy of the caller's context, keeping its request priority.
+
+        Files that fail are logged and skipped, except when the archive
+        circuit breaker is open: then the whole download stops at once
+        rather than failing every remaining file.
+
         Args:
             filing: Filing object to download.
             output_dir: Output directory. If None, uses config default.
             include_exhibits: Whether to include exhibit files.
-            progress_callback: Optional callback for progress updates (current, total).
+            progress_callback: Optional callback for progress updates
+                               (files finished, total), called from worker
+                               threads one at a time.
 
         Returns:
-            List of downloaded file paths.
+            List of downloaded file paths, in filing index order.
 
         Raises:
-            DownloadError: If download fails.
+            DownloadError: If download fails or the circuit is open.
         """
         if output_dir is None:
             output_dir = self.config.output_dir
@@ -173,45 +347,52 @@ class FilingDownloader:
         logger.info(f"Downloading filing {filing.accession} to {filing_dir}")
 
         try:
-            # Get file index
             urls = self.build_filing_urls(filing)
-            cik_no_zeros = str(int(filing.cik))
-            index_data = self.client.get_filing_index(
-                cik_no_zeros,
-                filing.accession_no_dash
-            )
+            files = self.list_filing_files(filing, include_exhibits)
 
-            files = index_data.get("directory", {}).get("item", [])
-            if not files:
-                raise DownloadError("No files found in filing index")
-
-            # Filter files if not including exhibits
-            if not include_exhibits:
-                files = [
-                    f for f in files
-                    if re.search(r"\.(htm|html|txt|xml)$", f["name"], re.I)
-                ]
-
-            downloaded_paths = []
             total_files = len(files)
-
-            logger.info(f"Downloading {total_files} files")
-
-            for idx, file_info in enumerate(files):
-                filename = file_info["name"]
-                file_url = f"{urls['folder']}/{filename}"
+            workers = max(1, min(self.config.download_workers, total_files))
+            downloaded: Dict[int, Path] = {}
+            finished = 0
+            progress_lock = threading.Lock()
+            circuit_open = threading.Event()
+
+            logger.info(f"Downloading {total_files} files ({workers} workers)")
+
+            def download(idx: int, filename: str):
+                nonlocal finished
+                if circuit_open.is_set():
+                    return
                 dest_path = filing_dir / filename
-
                 try:
-                    self.client.download_file(file_url, dest_path)
-                    downloaded_paths.append(dest_path)
-
-                    if progress_callback:
-                        progress_callback(idx + 1, total_files)
-
+                    self.client.download_file(f"{urls['folder']}/{filename}", dest_path)
+                except CircuitOpenError:
+                    circuit_open.set()
+                    raise
                 except Exception as e:
                     logger.warning(f"Failed to download {filename}: {e}")
+                else:
+                    downloaded[idx] = dest_path
+
+                with progress_lock:
+                    finished += 1
+                    if progress_callback:
+                        progress_callback(finished, total_files)
 
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sec-download") as executor:
+                futures = [
+                    executor.submit(contextvars.copy_context().run, download, idx, file_info["name"])
+                    for idx, file_info in enumerate(files)
+                ]
+                for future in as_completed(futures):
+                    error = future.exception()
+                    if isinstance(error, CircuitOpenError):
+                        # The remaining files would fail the same way
+                        for pending in futures:
+                            pending.cancel()
+                        raise error
+
+            downloaded_paths = [downloaded[idx] for idx in sorted(downloaded)]
             logger.info(f"Successfully downloaded {len(downloaded_paths)} files")
             return downloaded_paths
 
@@ -246,9 +427,9 @@ class FilingDownloader:
             except Exception:
                 return 0
 
-        # Priority 1: Primary document if substantial
+        # Priority 1: Primary document if substantial (unknown for catalog filings)
         primary_path = filing_dir / filing.primary_doc
-        if primary_path.exists() and file_size(primary_path) > 2048:
+        if filing.primary_doc and primary_path.is_file() and file_size(primary_path) > 2048:
             logger.debug(f"Using primary document: {primary_path}")
             return primary_path
 
@@ -292,7 +473,7 @@ class FilingDownloader:
             return largest_html
 
         # Fallback: primary document even if small
-        if primary_path.exists():
+        if filing.primary_doc and primary_path.is_file():
             logger.debug(f"Fallback to primary document: {primary_path}")
             return primary_path
 
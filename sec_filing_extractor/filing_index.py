@@ -0,0 +1,372 @@
+"""
+Columnar index over a company's submissions data.
+
+The submissions API returns filing history as parallel arrays (one per
+field) ordered newest first. FilingIndex keeps those arrays as they are
+and answers queries without building an object per filing:
+
+* the filing-date column is searched with bisect, so a date range maps to
+  a contiguous block of rows;
+* the rows of each requested set of form types are collected on first
+  use, so later queries for them visit only matching rows;
+* 8-K item codes, XBRL flags and sizes are checked against their columns,
+  so filings can be filtered on them without downloading any document;
+* Filing objects are two-slot views onto a row, created only for results.
+"""
+import bisect
+import logging
+import operator
+from array import array
+from itertools import chain, islice
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+def item_codes(value: str) -> Tuple[str, ...]:
+    """
+    Split an ``items`` value ("2.02,9.01") into item codes.
+
+    Args:
+        value: Comma-separated item codes as published, or empty.
+
+    Returns:
+        Tuple of codes (empty if none).
+    """
+    if not value:
+        return ()
+    return tuple(code for code in (part.strip() for part in value.split(",")) if code)
+
+
+def normalize_item_code(code: str) -> str:
+    """Normalize a requested item code ("Item 2.02" -> "2.02")."""
+    code = code.strip()
+    if code.lower().startswith("item"):
+        code = code[4:].strip()
+    return code
+
+
+class _AscendingDates:
+    """Sequence view of the newest-first date column in ascending order, for bisect."""
+
+    def __init__(self, dates: List[str]):
+        self._dates = dates
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    def __getitem__(self, position: int) -> str:
+        return self._dates[len(self._dates) - 1 - position]
+
+
+class FilingIndex:
+    """
+    Read-only columnar index of one block of submissions data.
+
+    Columns are the lists of the decoded JSON document (which the JSON
+    cache already holds), so building an index copies nothing unless the
+    rows need re-sorting by date. An index spanning several companies
+    (e.g. a catalog query) carries per-row ``cik`` and ``companyName``
+    columns instead of a single CIK and name.
+    """
+
+    def __init__(self, columns: Dict[str, List[Any]], cik: str = "", company_name: str = ""):
+        """
+        Build an index from columnar submissions data.
+
+        Args:
+            columns: ``filings.recent`` or a submissions page, optionally
+                     with ``cik`` and ``companyName`` columns.
+            cik: 10-digit CIK string (when the columns have none).
+            company_name: Company name (when the columns have none).
+        """
+        self.cik = cik
+        self.company_name = company_name
+
+        forms = columns.get("form", [])
+        count = len(forms)
+
+        def column(name: str, default: Any) -> List[Any]:
+            values = columns.get(name)
+            return values if values is not None and len(values) == count else [default] * count
+
+        self.forms: List[str] = forms
+        self.accessions: List[str] = column("accessionNumber", "")
+        self.filing_dates: List[str] = column("filingDate", "")
+        self.primary_docs: List[str] = column("primaryDocument", "")
+        self.report_dates: List[str] = column("reportDate", "")
+        self.sizes: List[int] = column("size", 0)
+        self.is_xbrl: List[int] = column("isXBRL", 0)
+        self.is_inline_xbrl: List[int] = column("isInlineXBRL", 0)
+        self.items: List[str] = column("items", "")
+        self.ciks: List[str] = column("cik", cik)
+        self.company_names: List[str] = column("companyName", company_name)
+
+        dates = self.filing_dates
+        if any(map(operator.lt, dates, islice(dates, 1, None))):
+            # EDGAR orders by acceptance time; restore strict date order if needed
+            self._reorder(sorted(range(count), key=dates.__getitem__, reverse=True))
+
+        self._form_rows: Dict[frozenset, array] = {}
+
+    def _reorder(self, order: List[int]):
+        """Permute every column into the given row order."""
+        for name in ("forms", "accessions", "filing_dates", "primary_docs",
+                     "report_dates", "sizes", "is_xbrl", "is_inline_xbrl", "items", "ciks", "company_names"):
+            values = getattr(self, name)
+            setattr(self, name, [values[i] for i in order])
+
+    def __len__(self) -> int:
+        return len(self.forms)
+
+    def __getitem__(self, row: int) -> "Filing":
+        if not 0 <= row < len(self.forms):
+            raise IndexError(row)
+        return Filing._view(self, row)
+
+    @property
+    def newest_date(self) -> Optional[str]:
+        """Filing date of the newest row (None if empty)."""
+        return self.filing_dates[0] if self.filing_dates else None
+
+    @property
+    def oldest_date(self) -> Optional[str]:
+        """Filing date of the oldest row (None if empty)."""
+        return self.filing_dates[-1] if self.filing_dates else None
+
+    def _date_bounds(self, since: Optional[str], until: Optional[str]) -> Tuple[int, int]:
+        """Get the row range [start, end) with since <= date <= until."""
+        count = len(self.filing_dates)
+        ascending = _AscendingDates(self.filing_dates)
+        start = count - bisect.bisect_right(ascending, until) if until else 0
+        end = count - bisect.bisect_left(ascending, since) if since else count
+        return start, max(start, end)
+
+    def _rows_of_forms(self, form_types: frozenset) -> array:
+        """Get the rows of a set of form types, in row order."""
+        rows = self._form_rows.get(form_types)
+        if rows is None:
+            forms = self.forms
+            if len(form_types) == 1:
+                (form,) = form_types
+                matches = [i for i in range(len(forms)) if forms[i] == form]
+            else:
+                matches = sorted(chain.from_iterable(
+                    self._rows_of_forms(frozenset((form,))) for form in form_types
+                ))
+            rows = self._form_rows[form_types] = array("I", matches)
+        return rows
+
+    def rows(
+        self,
+        form_types: Optional[Tuple[str, ...]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        items: Optional[Tuple[str, ...]] = None,
+        xbrl: Optional[bool] = None,
+        inline_xbrl: Optional[bool] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None
+    ) -> Iterator[int]:
+        """
+        Iterate over matching rows, newest first.
+
+        Args:
+            form_types: Form types to include; None or empty includes all.
+            since: Earliest filing date (YYYY-MM-DD), or None.
+            until: Latest filing date (YYYY-MM-DD), or None.
+            items: Item codes (e.g. ('2.02', '5.02')); a filing matches if
+                   it reports any of them. None disables the filter.
+            xbrl: Require (True) or exclude (False) XBRL filings.
+            inline_xbrl: Require (True) or exclude (False) inline XBRL filings.
+            min_size: Minimum submission size in bytes.
+            max_size: Maximum submission size in bytes.
+
+        Returns:
+            Iterator of row numbers.
+        """
+        start, end = self._date_bounds(since, until)
+        if form_types:
+            form_rows = self._rows_of_forms(frozenset(form_types))
+            lo = bisect.bisect_left(form_rows, start)
+            rows: Iterator[int] = iter(form_rows[lo:bisect.bisect_left(form_rows, end, lo)])
+        else:
+            rows = iter(range(start, end))
+
+        if items:
+            wanted = frozenset(normalize_item_code(code) for code in items)
+            item_column = self.items
+            rows = (r for r in rows if item_column[r] and not wanted.isdisjoint(item_codes(item_column[r])))
+        if xbrl is not None:
+            xbrl_column = self.is_xbrl
+            rows = (r for r in rows if bool(xbrl_column[r]) == xbrl)
+        if inline_xbrl is not None:
+            inline_column = self.is_inline_xbrl
+            rows = (r for r in rows if bool(inline_column[r]) == inline_xbrl)
+        if min_size is not None or max_size is not None:
+            low = min_size if min_size is not None else 0
+            high = max_size if max_size is not None else float("inf")
+            sizes = self.sizes
+            rows = (r for r in rows if low <= (sizes[r] or 0) <= high)
+        return rows
+
+    def select(
+        self,
+        form_types: Optional[Tuple[str, ...]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None,
+        **filters: Any
+    ) -> List["Filing"]:
+        """
+        Get matching filings, newest first.
+
+        Args:
+            form_types: Form types to include; None or empty includes all.
+            since: Earliest filing date (YYYY-MM-DD), or None.
+            until: Latest filing date (YYYY-MM-DD), or None.
+            limit: Maximum number of filings, or None for all.
+            **filters: items, xbrl, inline_xbrl, min_size and max_size
+                       filters as accepted by ``rows``.
+
+        Returns:
+            List of Filing views.
+        """
+        return [
+            Filing._view(self, row)
+            for row in islice(self.rows(form_types, since, until, **filters), limit)
+        ]
+
+
+class Filing:
+    """
+    Represents a single SEC filing.
+
+    A Filing is a view onto one row of a FilingIndex; fields are read from
+    the index columns when accessed. Constructing a Filing directly builds
+    a one-row index.
+    """
+
+    __slots__ = ("_index", "_row")
+
+    def __init__(
+        self,
+        form: str,
+        accession: str,
+        filing_date: str,
+        primary_doc: str,
+        cik: str = "",
+        company_name: str = "",
+        report_date: str = "",
+        size: int = 0,
+        is_xbrl: bool = False,
+        is_inline_xbrl: bool = False,
+        items: Tuple[str, ...] = ()
+    ):
+        self._index = FilingIndex(
+            {
+                "form": [form],
+                "accessionNumber": [accession],
+                "filingDate": [filing_date],
+                "primaryDocument": [primary_doc],
+                "reportDate": [report_date],
+                "size": [size],
+                "isXBRL": [is_xbrl],
+                "isInlineXBRL": [is_inline_xbrl],
+                "items": [",".join(items)],
+            },
+            cik=cik,
+            company_name=company_name
+        )
+        self._row = 0
+
+    @classmethod
+    def _view(cls, index: FilingIndex, row: int) -> "Filing":
+        """Create a view onto a row without copying any field."""
+        filing = cls.__new__(cls)
+        filing._index = index
+        filing._row = row
+        return filing
+
+    @property
+    def form(self) -> str:
+        return self._index.forms[self._row]
+
+    @property
+    def accession(self) -> str:
+        return self._index.accessions[self._row]
+
+    @property
+    def filing_date(self) -> str:
+        return self._index.filing_dates[self._row]
+
+    @property
+    def primary_doc(self) -> str:
+        return self._index.primary_docs[self._row]
+
+    @property
+    def cik(self) -> str:
+        return self._index.ciks[self._row]
+
+    @property
+    def company_name(self) -> str:
+        return self._index.company_names[self._row]
+
+    @property
+    def report_date(self) -> str:
+        """Period of report (YYYY-MM-DD), or empty if not applicable."""
+        return self._index.report_dates[self._row]
+
+    @property
+    def size(self) -> int:
+        """Size of the filing submission in bytes."""
+        return self._index.sizes[self._row] or 0
+
+    @property
+    def is_xbrl(self) -> bool:
+        """Whether the filing includes XBRL financial data."""
+        return bool(self._index.is_xbrl[self._row])
+
+    @property
+    def is_inline_xbrl(self) -> bool:
+        """Whether the filing uses inline XBRL."""
+        return bool(self._index.is_inline_xbrl[self._row])
+
+    @property
+    def items(self) -> Tuple[str, ...]:
+        """Reported item codes (8-K and similar forms), e.g. ('2.02', '9.01')."""
+        return item_codes(self._index.items[self._row])
+
+    @property
+    def accession_no_dash(self) -> str:
+        """Get accession number without dashes."""
+        return self.accession.replace("-", "")
+
+    def _fields(self) -> Tuple[Any, ...]:
+        """Get the constructor arguments reproducing this filing."""
+        return (
+            self.form, self.accession, self.filing_date, self.primary_doc,
+            self.cik, self.company_name, self.report_date, self.size, self.is_xbrl,
+            self.is_inline_xbrl, self.items,
+        )
+
+    def __reduce__(self):
+        # Pickle the row alone, not the whole index it views
+        return (Filing, self._fields())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Filing):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __hash__(self) -> int:
+        return hash((self.cik, self.accession))
+
+    def __repr__(self) -> str:
+        return (f"Filing(form={self.form!r}, accession={self.accession!r}, "
+                f"filing_date={self.filing_date!r}, primary_doc={self.primary_doc!r}, "
+                f"cik={self.cik!r}, company_name={self.company_name!r})")
+
+    def __str__(self) -> str:
+        return f"{self.form} | {self.filing_date} | {self.accession}"
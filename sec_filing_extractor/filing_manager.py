@@ -2,6 +2,7 @@
 Filing manager to orchestrate all filing operations.
 """
 import logging
+import threading
 import webbrowser
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -10,6 +11,11 @@ from .config import Config
 from .sec_client import SECClient
 from .company_lookup import CompanyLookup
 from .filing_downloader import FilingDownloader, Filing
+from .catalog import FilingCatalog
+from .fact_store import FactStore
+from .download_queue import DownloadQueue
+from .exceptions import TickerNotFoundError, ValidationError
+from .name_index import normalize_name
 from .extractors import (
     TableExtractor,
     SectionExtractor,
@@ -36,51 +42,246 @@ class FilingManager:
         """
         self.config = config or Config()
         self.client = SECClient(self.config)
-        self.company_lookup = CompanyLookup(self.client, self.config)
-        self.downloader = FilingDownloader(self.client, self.config)
+        self.catalog: Optional[FilingCatalog] = None
+        if self.config.catalog_file:
+            self.catalog = FilingCatalog(Path(self.config.catalog_file), self.client, self.config)
+        self.company_lookup = CompanyLookup(self.client, self.config, self.catalog)
+        self.downloader = FilingDownloader(self.client, self.config, self.catalog)
         self.table_extractor = TableExtractor(self.config)
         self.section_extractor = SectionExtractor(self.config)
-        self.financial_extractor = FinancialStatementExtractor(self.client, self.config)
+        self.fact_store: Optional[FactStore] = None
+        if self.config.fact_store_dir:
+            self.fact_store = FactStore(Path(self.config.fact_store_dir), self.client, self.config)
+        self.financial_extractor = FinancialStatementExtractor(self.client, self.config, self.fact_store)
+        self._download_queue: Optional[DownloadQueue] = None
 
         logger.info("FilingManager initialized")
 
-    def search_company(self, ticker: str) -> Dict[str, Any]:
+    def search_company(self, query: str) -> Dict[str, Any]:
         """
-        Search for company by ticker.
+        Search for company by ticker or name.
+
+        The query is tried as a ticker first. Otherwise it is looked up in
+        the company-name index; a confident match (see ``_name_match``) is
+        returned with the other candidates under ``matches``.
 
         Args:
-            ticker: Stock ticker symbol.
+            query: Stock ticker symbol or company name.
 
         Returns:
             Company information dictionary.
+
+        Raises:
+            TickerNotFoundError: If no name matches the query confidently.
+                                 Weaker candidates are listed in the
+                                 message and under ``matches``.
+        """
+        logger.info(f"Searching for company: {query}")
+        try:
+            return self.company_lookup.get_company_info(query)
+        except (TickerNotFoundError, ValidationError):
+            pass
+
+        matches = self.company_lookup.search_companies(query)
+        info = self.company_lookup.get_company_info_by_cik(self._name_match(query, matches)["cik"])
+        info["matches"] = matches
+        return info
+
+    def _name_match(self, query: str, matches: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Pick the company a name query unambiguously refers to.
+
+        A name equal to the query (after normalization) is taken as is.
+        Otherwise the best fuzzy match must score at least
+        config.name_match_min_score and lead the runner-up by
+        config.name_match_min_lead, so a mistyped ticker does not quietly
+        resolve to an unrelated company.
+
+        Args:
+            query: Company name or unknown ticker.
+            matches: Results of ``search_companies``, best first.
+
+        Returns:
+            The chosen match.
+
+        Raises:
+            TickerNotFoundError: If no match is confident enough.
+        """
+        if not matches:
+            raise TickerNotFoundError(f"No company matching '{query}' found in SEC database")
+
+        normalized = normalize_name(query)
+        exact = {m["cik"] for m in matches if m["name"] == normalized}
+        if len(exact) == 1:
+            return next(m for m in matches if m["name"] == normalized)
+
+        best = matches[0]
+        runner_up = matches[1]["score"] if len(matches) > 1 else 0.0
+        if (
+            best["score"] >= self.config.name_match_min_score
+            and best["score"] - runner_up >= self.config.name_match_min_lead
+        ):
+            return best
+
+        candidates = ", ".join(
+            f"{m['name']} (CIK {m['cik']}, score {m['score']:.2f})" for m in matches[:5]
+        )
+        raise TickerNotFoundError(
+            f"'{query}' is not a known ticker and matches no company name clearly; "
+            f"candidates: {candidates}",
+            matches=matches
+        )
+
+    def resolve_cik(self, query: str) -> str:
         """
-        logger.info(f"Searching for company: {ticker}")
-        return self.company_lookup.get_company_info(ticker)
+        Resolve a ticker or company name to a 10-digit CIK.
+
+        Args:
+            query: Stock ticker symbol or company name.
+
+        Returns:
+            10-digit CIK string (confident name match for names).
+
+        Raises:
+            TickerNotFoundError: If no name matches the query confidently.
+        """
+        try:
+            return self.company_lookup.get_cik_from_ticker(query)
+        except (TickerNotFoundError, ValidationError):
+            pass
+
+        match = self._name_match(query, self.company_lookup.search_companies(query, limit=5))
+        logger.info(f"Resolved '{query}' to {match['name']} (CIK {match['cik']})")
+        return match["cik"]
 
     def get_filings(
         self,
         ticker: str,
         form_types: Optional[tuple] = None,
-        limit: int = 20
+        limit: int = 20,
+        items: Optional[tuple] = None,
+        xbrl: Optional[bool] = None,
+        inline_xbrl: Optional[bool] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None
     ) -> List[Filing]:
         """
         Get recent filings for a company.
 
         Args:
-            ticker: Stock ticker symbol.
+            ticker: Stock ticker symbol or company name.
             form_types: Tuple of form types to filter.
             limit: Maximum number of filings.
+            items: Item codes to match (e.g., ('2.02', '5.02') for 8-Ks).
+            xbrl: If set, only filings with (True) or without (False) XBRL.
+            inline_xbrl: If set, only filings with (True) or without (False)
+                        inline XBRL.
+            min_size: Minimum submission size in bytes.
+            max_size: Maximum submission size in bytes.
 
         Returns:
             List of Filing objects.
         """
         logger.info(f"Getting filings for {ticker}")
 
-        cik = self.company_lookup.get_cik_from_ticker(ticker)
-        filings = self.downloader.get_recent_filings(cik, form_types, limit)
+        cik = self.resolve_cik(ticker)
+        filings = self.downloader.get_recent_filings(
+            cik, form_types, limit, items=items, xbrl=xbrl,
+            inline_xbrl=inline_xbrl, min_size=min_size, max_size=max_size
+        )
 
         return filings
 
+    def _require_catalog(self) -> FilingCatalog:
+        """Get the filing catalog, or raise if none is configured."""
+        if self.catalog is None:
+            raise ValidationError("No filing catalog configured (set config.catalog_file)")
+        return self.catalog
+
+    def update_catalog(self, since: str, until: Optional[str] = None) -> int:
+        """
+        Ingest EDGAR's quarterly full index for a date range into the catalog.
+
+        Quarters already ingested completely are skipped.
+
+        Args:
+            since: First date to cover (YYYY-MM-DD).
+            until: Last date to cover (YYYY-MM-DD); defaults to today.
+
+        Returns:
+            Number of filings added.
+
+        Raises:
+            ValidationError: If no catalog is configured or a date is invalid.
+        """
+        return self._require_catalog().update(since, until, self.config.catalog_index_type)
+
+    def load_bulk_submissions(self, path: Optional[Path] = None, force: bool = False) -> Dict[str, int]:
+        """
+        Load every company's submissions from EDGAR's bulk archive into
+        the catalog, after which company info and filing lists for them
+        are served locally.
+
+        Args:
+            path: Local submissions.zip; downloaded if missing or stale.
+            force: Download even if a recent copy exists.
+
+        Returns:
+            Dictionary with the numbers of companies and filings loaded.
+
+        Raises:
+            ValidationError: If no catalog is configured.
+        """
+        return self._require_catalog().update_from_bulk(path, force)
+
+    def load_bulk_companyfacts(self, path: Optional[Path] = None, force: bool = False) -> Dict[str, int]:
+        """
+        Load every company's XBRL facts from EDGAR's bulk archive into the
+        fact store, after which financial statements for them are
+        generated locally.
+
+        Args:
+            path: Local companyfacts.zip; downloaded if missing or stale.
+            force: Download even if a recent copy exists.
+
+        Returns:
+            Dictionary with the numbers of companies and facts loaded.
+
+        Raises:
+            ValidationError: If no fact store is configured.
+        """
+        if self.fact_store is None:
+            raise ValidationError("No fact store configured (set config.fact_store_dir)")
+        return self.fact_store.update_from_bulk(path, force)
+
+    def find_filings(
+        self,
+        form_types: Optional[tuple] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        tickers: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[Filing]:
+        """
+        Find filings across companies in the local catalog.
+
+        Args:
+            form_types: Tuple of form types to filter; None for all.
+            since: Earliest filing date (YYYY-MM-DD).
+            until: Latest filing date (YYYY-MM-DD).
+            tickers: Restrict to these tickers or company names; None for all.
+            limit: Maximum number of filings.
+
+        Returns:
+            List of Filing objects, newest first.
+
+        Raises:
+            ValidationError: If no catalog is configured.
+        """
+        catalog = self._require_catalog()
+        ciks = [self.resolve_cik(t) for t in tickers] if tickers is not None else None
+        return catalog.find(form_types, since, until, ciks, limit)
+
     def download_filing(
         self,
         filing: Filing,
@@ -124,6 +325,51 @@ class FilingManager:
             "filing": filing,
         }
 
+    @property
+    def download_queue(self) -> DownloadQueue:
+        """Durable download queue, opened on first use (config.queue_file)."""
+        if self._download_queue is None:
+            path = Path(self.config.queue_file or self.config.output_dir / ".download_queue.db")
+            self._download_queue = DownloadQueue(path, self.downloader, self.config)
+        return self._download_queue
+
+    def queue_downloads(
+        self,
+        filings: List[Filing],
+        output_dir: Optional[Path] = None,
+        include_exhibits: bool = False
+    ) -> int:
+        """
+        Add filings to the durable download queue.
+
+        Args:
+            filings: Filings to download.
+            output_dir: Output directory.
+            include_exhibits: Whether to include exhibits.
+
+        Returns:
+            Number of filings newly queued (already queued ones are kept).
+        """
+        return self.download_queue.add(filings, output_dir, include_exhibits)
+
+    def run_download_queue(
+        self,
+        workers: Optional[int] = None,
+        stop_event: Optional[threading.Event] = None
+    ) -> Dict[str, int]:
+        """
+        Download everything queued, resuming any interrupted earlier run.
+
+        Args:
+            workers: Concurrent workers; defaults to config.download_workers.
+            stop_event: Event that stops the run; unfinished work stays queued.
+
+        Returns:
+            Dictionary with the numbers of files downloaded, skipped as
+            already complete, scheduled for retry and failed.
+        """
+        return self.download_queue.run(workers, stop_event)
+
     def extract_tables(
         self,
         html_file: Path,
@@ -292,6 +538,13 @@ class FilingManager:
 
     def close(self):
         """Close all resources."""
+        self.company_lookup.close()
+        if self.catalog is not None:
+            self.catalog.close()
+        if self.fact_store is not None:
+            self.fact_store.close()
+        if self._download_queue is not None:
+            self._download_queue.close()
         self.client.close()
         logger.info("FilingManager closed")
 
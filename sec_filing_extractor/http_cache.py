@@ -0,0 +1,242 @@
+"""
+Persistent on-disk HTTP response cache with conditional revalidation.
+"""
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Dict, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+logger = logging.getLogger(__name__)
+
+
+# Response headers persisted alongside cached bodies
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body with its validators."""
+    url: str
+    body_path: Path
+    headers: Dict[str, str] = field(default_factory=dict)
+    stored_at: float = 0.0
+
+    @property
+    def age(self) -> float:
+        """Seconds since the entry was stored or last revalidated."""
+        return time.time() - self.stored_at
+
+    @property
+    def etag(self) -> Optional[str]:
+        """ETag validator, if the server sent one."""
+        return self.headers.get("ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        """Last-Modified validator, if the server sent one."""
+        return self.headers.get("Last-Modified")
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        Build request headers for a conditional GET.
+
+        Returns:
+            Dictionary with If-None-Match / If-Modified-Since as available.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> requests.Response:
+        """
+        Rebuild a requests Response from the cached body.
+
+        Returns:
+            Response object with status 200 and the cached content.
+        """
+        response = requests.Response()
+        response.status_code = 200
+        response.url = self.url
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.body_path.read_bytes()
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+
+class HTTPCache:
+    """
+    On-disk cache of GET responses keyed by URL.
+
+    Each entry is a body file plus a small JSON metadata file holding the
+    ETag/Last-Modified validators and the time it was last confirmed fresh.
+    Freshness is decided per endpoint from a list of rules, each mapping a
+    URL substring to a TTL and a stale-while-revalidate window.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        rules: Tuple[Tuple[str, float, float], ...] = ()
+    ):
+        """
+        Initialize HTTP cache.
+
+        Args:
+            cache_dir: Directory for cached responses.
+            rules: Tuple of (url_substring, ttl, stale_while_revalidate)
+                   rules. The first matching rule wins; URLs without a
+                   match are always revalidated.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.rules = tuple(rules)
+        logger.debug(f"HTTP cache at {self.cache_dir}")
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> Tuple[str, str]:
+        """
+        Build the cache key for a request.
+
+        Args:
+            url: Request URL.
+            params: Optional query parameters.
+
+        Returns:
+            Tuple of (full URL including query string, hashed key).
+        """
+        full_url = requests.Request("GET", url, params=params).prepare().url
+        return full_url, hashlib.sha256(full_url.encode("utf-8")).hexdigest()
+
+    def policy_for(self, url: str) -> Tuple[float, float]:
+        """
+        Get freshness policy for a URL.
+
+        Args:
+            url: Request URL.
+
+        Returns:
+            Tuple of (ttl, stale_while_revalidate) in seconds.
+        """
+        for pattern, ttl, swr in self.rules:
+            if pattern in url:
+                return ttl, swr
+        return 0.0, 0.0
+
+    def _paths(self, key: str) -> Tuple[Path, Path]:
+        """Get (body, metadata) paths for a key."""
+        subdir = self.cache_dir / key[:2]
+        return subdir / f"{key}.body", subdir / f"{key}.json"
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """
+        Look up a cached entry.
+
+        Args:
+            key: Hashed cache key.
+
+        Returns:
+            CacheEntry or None if not cached.
+        """
+        body_path, meta_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if not body_path.exists():
+            return None
+
+        return CacheEntry(
+            url=meta["url"],
+            body_path=body_path,
+            headers=meta.get("headers", {}),
+            stored_at=meta.get("stored_at", 0.0),
+        )
+
+    def store(self, key: str, url: str, response: requests.Response) -> CacheEntry:
+        """
+        Store a 200 response.
+
+        Args:
+            key: Hashed cache key.
+            url: Full request URL.
+            response: Response with the body already read.
+
+        Returns:
+            The stored CacheEntry.
+        """
+        body_path, _ = self._paths(key)
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        self._atomic_write(body_path, response.content)
+
+        headers = {
+            name: response.headers[name]
+            for name in _KEPT_HEADERS
+            if name in response.headers
+        }
+        entry = CacheEntry(url=url, body_path=body_path, headers=headers, stored_at=time.time())
+        self._write_meta(key, entry)
+        return entry
+
+    def refresh(self, key: str, entry: CacheEntry, response: requests.Response) -> CacheEntry:
+        """
+        Mark an entry fresh after a 304 Not Modified response.
+
+        Args:
+            key: Hashed cache key.
+            entry: Existing cache entry.
+            response: The 304 response, whose validators replace the old ones.
+
+        Returns:
+            The refreshed CacheEntry.
+        """
+        for name in ("ETag", "Last-Modified"):
+            if name in response.headers:
+                entry.headers[name] = response.headers[name]
+        entry.stored_at = time.time()
+        self._write_meta(key, entry)
+        return entry
+
+    def _write_meta(self, key: str, entry: CacheEntry):
+        """Persist metadata for an entry."""
+        _, meta_path = self._paths(key)
+        meta = {
+            "url": entry.url,
+            "headers": entry.headers,
+            "stored_at": entry.stored_at,
+        }
+        self._atomic_write(meta_path, json.dumps(meta).encode("utf-8"))
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes):
+        """Write a file via a temp file and rename so readers never see partial data."""
+        fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+        except Exception:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+    def clear(self):
+        """Remove all cached entries."""
+        for path in self.cache_dir.glob("*/*"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        logger.info("HTTP cache cleared")
@@ -0,0 +1,531 @@
+"""
+Load-test driver running FilingManager batches against the mock EDGAR server.
+
+Example::
+
+    # Build a fixture from the checked-in AAPL 10-K and run 40 filings
+    python -m sec_filing_extractor.load_test /tmp/edgar_fixture \\
+        --from-filing filings/0000320193-24-000123 \\
+        --cik 320193 --ticker AAPL --name "Apple Inc." \\
+        --filings 40 --workers 8 --latency 0.05 --failure-rate 0.01
+
+    # Compare connection pool settings by handshakes opened
+    python -m sec_filing_extractor.load_test /tmp/edgar_fixture \\
+        --connection-benchmark --requests 500 --workers 32
+
+    # Check that a few percent of 503s keep throughput near the ceiling
+    python -m sec_filing_extractor.load_test /tmp/edgar_fixture \\
+        --failure-check --request-delay 0.02 --failure-rate 0.05
+
+    # Check that downloads cut off mid-body resume to identical files
+    python -m sec_filing_extractor.load_test /tmp/edgar_fixture --resume-check
+"""
+import json
+import time
+import random
+import shutil
+import argparse
+import logging
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from .config import Config
+from .filing_manager import FilingManager
+from .sec_client import SECClient
+from .mock_edgar import MockEDGARServer, build_fixture
+
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Get a percentile using nearest-rank.
+
+    Args:
+        values: Observations.
+        pct: Percentile between 0 and 100.
+
+    Returns:
+        The percentile, or 0.0 for no observations.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def run_load_test(
+    fixture_dir: Path,
+    filings: int = 20,
+    workers: int = 4,
+    server_rate: float = 10.0,
+    server_burst: float = 10.0,
+    latency: float = 0.0,
+    failure_rate: float = 0.0,
+    extract: bool = True,
+    include_exhibits: bool = False,
+    config_overrides: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Process a batch of filings against a mock EDGAR server.
+
+    Every ticker in the fixture's company_tickers.json is resolved and its
+    filings are cycled until ``filings`` jobs have been queued. Jobs run on
+    ``workers`` threads sharing one FilingManager.
+
+    Args:
+        fixture_dir: Mock server fixture directory.
+        filings: Number of filings to process.
+        workers: Concurrent worker threads.
+        server_rate: Requests per second the server admits.
+        server_burst: Burst size the server admits.
+        latency: Mean injected latency per request in seconds.
+        failure_rate: Probability of the server answering 503.
+        extract: Whether to run table/section/financial extraction.
+        include_exhibits: Whether to download exhibits.
+        config_overrides: Extra Config fields for the client side.
+
+    Returns:
+        Report dictionary.
+    """
+    with MockEDGARServer(
+        fixture_dir,
+        rate=server_rate,
+        burst=server_burst,
+        latency=latency,
+        failure_rate=failure_rate
+    ) as server, tempfile.TemporaryDirectory(prefix="sec-load-") as output_root:
+        settings = {
+            "sec_api_base": server.url,
+            "sec_files_base": server.url,
+            "default_output_dir": output_root,
+            "log_level": "WARNING",
+            "rate_limit_scope": "client",
+        }
+        settings.update(config_overrides or {})
+        config = Config(**settings)
+
+        tickers = json.loads((Path(fixture_dir) / "company_tickers.json").read_text(encoding="utf-8"))
+        rows = tickers.values() if isinstance(tickers, dict) else tickers
+
+        with FilingManager(config) as manager:
+            pool = []
+            for row in rows:
+                pool.extend(manager.get_filings(row["ticker"], limit=filings))
+            if not pool:
+                raise ValueError(f"No filings found in fixture {fixture_dir}")
+
+            jobs = [pool[i % len(pool)] for i in range(filings)]
+            durations: List[float] = []
+            errors: List[str] = []
+
+            def process(index: int):
+                started = time.monotonic()
+                try:
+                    manager.process_filing_complete(
+                        jobs[index],
+                        output_dir=Path(output_root) / f"job{index}",
+                        include_exhibits=include_exhibits,
+                        extract_tables=extract,
+                        extract_sections=extract,
+                        extract_financials=extract,
+                    )
+                    durations.append(time.monotonic() - started)
+                except Exception as e:
+                    errors.append(f"{jobs[index].accession}: {e}")
+
+            started = time.monotonic()
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(process, range(len(jobs))))
+            elapsed = time.monotonic() - started
+
+        stats = server.stats.snapshot()
+
+    useful = stats["ok"] + stats["not_modified"]
+    return {
+        "filings": len(jobs),
+        "succeeded": len(durations),
+        "failed": len(errors),
+        "errors": errors[:10],
+        "workers": workers,
+        "elapsed_s": elapsed,
+        "filings_per_min": len(durations) / elapsed * 60 if elapsed else 0.0,
+        "requests": stats["requests"],
+        "requests_ok": useful,
+        "requests_throttled": stats["throttled"],
+        "requests_failed": stats["failed"],
+        "requests_not_found": stats["not_found"],
+        "request_efficiency": useful / stats["requests"] if stats["requests"] else 0.0,
+        "requests_per_filing": stats["requests"] / len(jobs) if jobs else 0.0,
+        "bytes_sent": stats["bytes_sent"],
+        "connections": stats["connections"],
+        "request_latency_p50_s": percentile(stats["latencies"], 50),
+        "request_latency_p99_s": percentile(stats["latencies"], 99),
+        "filing_latency_p50_s": percentile(durations, 50),
+        "filing_latency_p99_s": percentile(durations, 99),
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """
+    Format a load-test report for the console.
+
+    Args:
+        report: Report from run_load_test.
+
+    Returns:
+        Multi-line summary.
+    """
+    lines = [
+        "=" * 70,
+        "LOAD TEST RESULTS",
+        "=" * 70,
+        f"Filings:             {report['succeeded']}/{report['filings']} "
+        f"({report['workers']} workers, {report['elapsed_s']:.2f}s)",
+        f"Throughput:          {report['filings_per_min']:.1f} filings/min",
+        f"Requests:            {report['requests']} "
+        f"({report['requests_per_filing']:.1f} per filing)",
+        f"  ok / 429 / 5xx:    {report['requests_ok']} / {report['requests_throttled']} / "
+        f"{report['requests_failed']}",
+        f"Request efficiency:  {report['request_efficiency']:.1%}",
+        f"Connections opened:  {report['connections']}",
+        f"Request latency:     p50 {report['request_latency_p50_s'] * 1000:.1f} ms, "
+        f"p99 {report['request_latency_p99_s'] * 1000:.1f} ms",
+        f"Filing latency:      p50 {report['filing_latency_p50_s']:.2f} s, "
+        f"p99 {report['filing_latency_p99_s']:.2f} s",
+        "=" * 70,
+    ]
+    for error in report["errors"]:
+        lines.append(f"  error: {error}")
+    return "\n".join(lines)
+
+
+def run_failure_check(
+    fixture_dir: Path,
+    filings: int = 10,
+    workers: int = 8,
+    request_delay: float = 0.02,
+    failure_rate: float = 0.05,
+    tolerance: float = 0.8
+) -> Dict[str, Any]:
+    """
+    Check that occasional 5xx responses do not drag throughput down.
+
+    Runs the same download-only batch twice against a server without an
+    admission limit, once without and once with ``failure_rate`` random
+    503s, so the client's own rate limit is the ceiling in both runs.
+    Plain 503s are retried but must not make the adaptive rate controller
+    back off, so the second run has to keep ``tolerance`` of the first
+    run's filing throughput.
+
+    Args:
+        fixture_dir: Mock server fixture directory.
+        filings: Number of filings per run.
+        workers: Concurrent worker threads.
+        request_delay: Client request_delay (the rate ceiling).
+        failure_rate: Probability of a 503 in the second run.
+        tolerance: Minimum throughput ratio of the second run.
+
+    Returns:
+        Report dictionary with both runs and their throughput ratio.
+
+    Raises:
+        AssertionError: If throughput falls below the tolerance.
+    """
+    def run(rate: float) -> Dict[str, Any]:
+        return run_load_test(
+            fixture_dir,
+            filings=filings,
+            workers=workers,
+            server_rate=0,
+            failure_rate=rate,
+            extract=False,
+            config_overrides={"request_delay": request_delay},
+        )
+
+    baseline = run(0.0)
+    degraded = run(failure_rate)
+    ratio = (
+        degraded["filings_per_min"] / baseline["filings_per_min"]
+        if baseline["filings_per_min"] else 0.0
+    )
+    assert degraded["failed"] == 0, f"Filings failed at {failure_rate:.0%} 5xx: {degraded['errors']}"
+    assert ratio >= tolerance, (
+        f"Throughput fell to {ratio:.0%} of the failure-free run at {failure_rate:.0%} 5xx"
+    )
+    return {"baseline": baseline, "with_failures": degraded, "throughput_ratio": ratio}
+
+
+# (label, Config overrides) compared by run_connection_benchmark
+CONNECTION_SCENARIOS = (
+    ("default pool (10/host)", {"pool_maxsize": 10}),
+    ("pool sized to workers", {}),
+    ("small blocking pool (4/host)", {"pool_maxsize": 4, "pool_block": True}),
+)
+
+
+def run_connection_benchmark(
+    fixture_dir: Path,
+    requests: int = 200,
+    workers: int = 16,
+    latency: float = 0.0,
+    scenarios: Optional[Tuple[Tuple[str, Dict[str, Any]], ...]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Measure connections opened for a burst of archive fetches.
+
+    Each scenario fetches the fixture's archive files ``requests`` times
+    from ``workers`` threads sharing one SECClient, in waves of ``workers``
+    concurrent requests (like a batch fanning out over a filing index and
+    then pausing to extract). Rate limiting and caching are disabled so
+    that only connection reuse differs. The mock
+    server counts accepted connections, i.e. the TCP/TLS handshakes a
+    client would pay against EDGAR. Scenario overrides are applied on top
+    of ``pool_maxsize=workers``.
+
+    Args:
+        fixture_dir: Mock server fixture directory.
+        requests: GET requests per scenario.
+        workers: Concurrent worker threads.
+        latency: Mean injected latency per request in seconds.
+        scenarios: (label, Config overrides) pairs; defaults to
+                   CONNECTION_SCENARIOS.
+
+    Returns:
+        One result dictionary per scenario.
+    """
+    archives = Path(fixture_dir) / "archives"
+    paths = sorted(
+        "/Archives/edgar/data/" + p.relative_to(archives).as_posix()
+        for p in archives.glob("*/*/*")
+        if p.is_file()
+    )
+    if not paths:
+        raise ValueError(f"No archive files found in fixture {fixture_dir}")
+
+    results = []
+    for label, overrides in scenarios or CONNECTION_SCENARIOS:
+        with MockEDGARServer(fixture_dir, rate=0, latency=latency) as server:
+            settings = {
+                "sec_api_base": server.url,
+                "sec_files_base": server.url,
+                "log_level": "ERROR",
+                "rate_limit_scope": "client",
+                "request_delay": 0,
+                "single_flight": False,
+                "json_cache_max_bytes": 0,
+                "pool_maxsize": workers,
+            }
+            settings.update(overrides)
+            config = Config(**settings)
+
+            with SECClient(config) as client:
+                def fetch(index: int):
+                    client.get(server.url + paths[index % len(paths)])
+
+                started = time.monotonic()
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    for wave in range(0, requests, workers):
+                        list(executor.map(fetch, range(wave, min(wave + workers, requests))))
+                elapsed = time.monotonic() - started
+
+            stats = server.stats.snapshot()
+
+        results.append({
+            "scenario": label,
+            "requests": stats["requests"],
+            "connections": stats["connections"],
+            "handshakes_avoided": stats["requests"] - stats["connections"],
+            "requests_per_connection": (
+                stats["requests"] / stats["connections"] if stats["connections"] else 0.0
+            ),
+            "elapsed_s": elapsed,
+        })
+    return results
+
+
+def format_connection_report(results: List[Dict[str, Any]]) -> str:
+    """
+    Format connection benchmark results for the console.
+
+    Args:
+        results: Results from run_connection_benchmark.
+
+    Returns:
+        Multi-line table.
+    """
+    lines = [
+        "=" * 70,
+        "CONNECTION BENCHMARK",
+        "=" * 70,
+        f"{'Scenario':<30}{'Requests':>9}{'Conns':>7}{'Avoided':>9}{'Req/conn':>9}{'Time':>7}",
+    ]
+    for r in results:
+        lines.append(
+            f"{r['scenario']:<30}{r['requests']:>9}{r['connections']:>7}"
+            f"{r['handshakes_avoided']:>9}{r['requests_per_connection']:>9.1f}"
+            f"{r['elapsed_s']:>6.2f}s"
+        )
+    lines.append("=" * 70)
+    return "\n".join(lines)
+
+
+def run_resume_check(
+    fixture_dir: Path,
+    compress: bool = True
+) -> Dict[str, Any]:
+    """
+    Download archive files whose first response is cut off mid-body.
+
+    The fixture's archive files are copied next to a generated, poorly
+    compressible binary file (whose decoded size at any cut-off lies
+    within its gzip size, so a Range counted in decoded bytes points into
+    the compressed stream). The server closes the connection halfway
+    through the first response for each file and, with ``compress``, gzips
+    bodies for clients that accept it, applying Range requests to the
+    compressed bytes. Each download must resume (or restart) into an
+    identical file.
+
+    Args:
+        fixture_dir: Mock server fixture directory.
+        compress: Whether the server gzips bodies.
+
+    Returns:
+        Report dictionary.
+
+    Raises:
+        AssertionError: If a downloaded file differs from its source.
+    """
+    rng = random.Random(0)
+    generated = bytes(rng.getrandbits(8) for _ in range(256 * 1024)) + b"<tr><td>0</td></tr>" * 8192
+
+    with tempfile.TemporaryDirectory(prefix="sec-resume-") as root:
+        archives = Path(root) / "fixture" / "archives"
+        source = Path(fixture_dir) / "archives"
+        if source.is_dir():
+            shutil.copytree(source, archives)
+        generated_path = archives / "0" / "000000000000000000" / "R1.bin"
+        generated_path.parent.mkdir(parents=True, exist_ok=True)
+        generated_path.write_bytes(generated)
+        files = sorted(p for p in archives.glob("*/*/*") if p.is_file())
+        expected = sum(p.stat().st_size for p in files)
+
+        with MockEDGARServer(
+            archives.parent, rate=0, drop_first=True, compress=compress
+        ) as server:
+            config = Config(
+                sec_api_base=server.url,
+                sec_files_base=server.url,
+                log_level="ERROR",
+                rate_limit_scope="client",
+                request_delay=0,
+                retry_delay=0.05,
+                download_resume_attempts=3,
+            )
+            with SECClient(config) as client:
+                for path in files:
+                    relative = path.relative_to(archives).as_posix()
+                    dest = Path(root) / "downloads" / relative
+                    client.download_file(f"{server.url}/Archives/edgar/data/{relative}", dest)
+                    assert dest.read_bytes() == path.read_bytes(), f"{relative} differs after resume"
+            stats = server.stats.snapshot()
+
+    return {
+        "files": len(files),
+        "requests": stats["requests"],
+        "bytes_sent": stats["bytes_sent"],
+        "bytes_expected": expected,
+    }
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Load-test FilingManager against a mock EDGAR server")
+    parser.add_argument("fixtures", help="Fixture directory (created with --from-filing)")
+    parser.add_argument("--from-filing", help="Build the fixture from a downloaded filing directory")
+    parser.add_argument("--cik", help="CIK for --from-filing")
+    parser.add_argument("--ticker", help="Ticker for --from-filing")
+    parser.add_argument("--name", default="", help="Company name for --from-filing")
+    parser.add_argument("--form", default="10-K", help="Form type for --from-filing")
+    parser.add_argument("--filings", type=int, default=20, help="Filings to process")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent workers")
+    parser.add_argument("--server-rate", type=float, default=10.0, help="Server-admitted requests/s")
+    parser.add_argument("--server-burst", type=float, default=10.0, help="Server-admitted burst")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean injected latency (s)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Probability of a 503")
+    parser.add_argument("--request-delay", type=float, default=0.1, help="Client request_delay")
+    parser.add_argument("--no-extract", action="store_true", help="Only download filings")
+    parser.add_argument("--include-exhibits", action="store_true", help="Download exhibits too")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--connection-benchmark", action="store_true",
+                        help="Compare connection pool settings instead of running filings")
+    parser.add_argument("--requests", type=int, default=200, help="GETs per benchmark scenario")
+    parser.add_argument("--failure-check", action="store_true",
+                        help="Check that --failure-rate 503s keep throughput near the ceiling")
+    parser.add_argument("--resume-check", action="store_true",
+                        help="Check downloads resume through dropped, gzipped responses")
+    args = parser.parse_args()
+
+    if args.from_filing:
+        if not (args.cik and args.ticker):
+            parser.error("--from-filing requires --cik and --ticker")
+        build_fixture(
+            Path(args.from_filing), Path(args.fixtures),
+            cik=args.cik, ticker=args.ticker,
+            company_name=args.name or args.ticker, form=args.form
+        )
+
+    if args.connection_benchmark:
+        results = run_connection_benchmark(
+            Path(args.fixtures),
+            requests=args.requests,
+            workers=args.workers,
+            latency=args.latency,
+        )
+        print(json.dumps(results, indent=2) if args.json else format_connection_report(results))
+        return
+
+    if args.failure_check:
+        report = run_failure_check(
+            Path(args.fixtures),
+            filings=args.filings,
+            workers=args.workers,
+            request_delay=args.request_delay,
+            failure_rate=args.failure_rate or 0.05,
+        )
+        print(json.dumps({
+            "baseline_elapsed_s": report["baseline"]["elapsed_s"],
+            "with_failures_elapsed_s": report["with_failures"]["elapsed_s"],
+            "throughput_ratio": report["throughput_ratio"],
+        }, indent=2))
+        return
+
+    if args.resume_check:
+        print(json.dumps(run_resume_check(Path(args.fixtures)), indent=2))
+        return
+
+    report = run_load_test(
+        Path(args.fixtures),
+        filings=args.filings,
+        workers=args.workers,
+        server_rate=args.server_rate,
+        server_burst=args.server_burst,
+        latency=args.latency,
+        failure_rate=args.failure_rate,
+        extract=not args.no_extract,
+        include_exhibits=args.include_exhibits,
+        config_overrides={"request_delay": args.request_delay},
+    )
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Size-bounded in-memory LRU cache for decoded API responses.
+"""
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class SizedLRUCache:
+    """
+    Thread-safe LRU cache bounded by approximate size in bytes.
+
+    Each entry carries a caller-supplied size (for decoded JSON, the length
+    of the raw response body is a cheap and proportional estimate). When
+    the total exceeds ``max_bytes`` the least recently used entries are
+    evicted. Entries older than ``ttl`` seconds are treated as misses.
+    """
+
+    def __init__(self, max_bytes: int, ttl: Optional[float] = None):
+        """
+        Initialize cache.
+
+        Args:
+            max_bytes: Maximum total size of cached entries.
+            ttl: Optional lifetime of an entry in seconds.
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up an entry and mark it as recently used.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached value, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, size, stored_at = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any, size: int):
+        """
+        Insert or replace an entry, evicting older entries as needed.
+
+        Entries larger than the whole cache are not stored.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+            size: Approximate size of the value in bytes.
+        """
+        if size > self.max_bytes:
+            logger.debug(f"Not caching {key}: {size} bytes exceeds cache size")
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (value, size, time.monotonic())
+            self._bytes += size
+
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key: Hashable):
+        """Remove an entry. Caller must hold the lock."""
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self):
+        """Remove all entries (statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, evictions, entries,
+            bytes and max_bytes.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
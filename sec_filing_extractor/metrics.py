@@ -0,0 +1,372 @@
+"""
+Lightweight request metrics for the SEC client.
+
+Recording costs one lock acquisition and a few dictionary updates per
+request, so metrics can stay enabled in production. Snapshots can be
+exported as JSON or in the Prometheus text exposition format.
+"""
+import os
+import json
+import time
+import bisect
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .exceptions import ValidationError
+
+
+logger = logging.getLogger(__name__)
+
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+METRICS_FORMATS = ("prometheus", "json")
+
+
+def endpoint_family(url: str) -> str:
+    """
+    Classify an EDGAR URL into an endpoint family.
+
+    Args:
+        url: Request URL.
+
+    Returns:
+        One of submissions, companyfacts, company_tickers, ticker_txt,
+        filing_index, archives or other.
+    """
+    path = urlsplit(url).path
+    if path.startswith("/submissions/"):
+        return "submissions"
+    if path.startswith("/api/xbrl/companyfacts/"):
+        return "companyfacts"
+    if path.startswith("/files/company_tickers"):
+        return "company_tickers"
+    if path == "/include/ticker.txt":
+        return "ticker_txt"
+    if path.startswith("/Archives/"):
+        return "filing_index" if path.endswith("/index.json") else "archives"
+    return "other"
+
+
+class Histogram:
+    """Fixed-bucket histogram (not thread-safe; guarded by its owner)."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        """Add one observation."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile as the upper bound of the bucket containing it.
+
+        Args:
+            q: Quantile between 0 and 1.
+
+        Returns:
+            Estimated value (the largest finite bound for the +Inf bucket).
+        """
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (self.buckets[-1],), self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return self.buckets[-1]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the histogram as a dictionary with cumulative bucket counts."""
+        cumulative = []
+        running = 0
+        for count in self.counts:
+            running += count
+            cumulative.append(running)
+        labels = [str(b) for b in self.buckets] + ["+Inf"]
+        return {
+            "buckets": dict(zip(labels, cumulative)),
+            "sum": self.sum,
+            "count": self.count,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+        }
+
+
+class _EndpointMetrics:
+    """Counters for one endpoint family."""
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.bytes_in = 0
+        self.statuses: Dict[str, int] = {}
+        self.latency = Histogram()
+
+
+class RequestMetrics:
+    """
+    Thread-safe request metrics keyed by endpoint family.
+
+    Tracks request counts, status codes, latency histograms, bytes
+    received and retries per endpoint, plus time spent waiting in the rate
+    limiter and sleeping in retry backoff.
+    """
+
+    def __init__(self):
+        """Initialize empty metrics."""
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _EndpointMetrics] = {}
+        self._started = time.time()
+        self.limiter_wait_seconds = 0.0
+        self.limiter_wait_by_priority: Dict[str, float] = {}
+        self.backoff_seconds = 0.0
+
+    def _endpoint(self, url: str) -> _EndpointMetrics:
+        """Get counters for a URL's family. Caller must hold the lock."""
+        family = endpoint_family(url)
+        metrics = self._endpoints.get(family)
+        if metrics is None:
+            metrics = self._endpoints[family] = _EndpointMetrics()
+        return metrics
+
+    def record_request(self, url: str, status: Optional[int], latency: float, bytes_in: int = 0):
+        """
+        Record one request attempt.
+
+        Args:
+            url: Request URL.
+            status: HTTP status, or None if no response was received.
+            latency: Seconds until the response headers arrived.
+            bytes_in: Body bytes received.
+        """
+        key = str(status) if status is not None else "error"
+        with self._lock:
+            metrics = self._endpoint(url)
+            metrics.requests += 1
+            metrics.bytes_in += bytes_in
+            metrics.statuses[key] = metrics.statuses.get(key, 0) + 1
+            metrics.latency.observe(latency)
+
+    def record_bytes(self, url: str, bytes_in: int):
+        """Add streamed body bytes for a URL."""
+        with self._lock:
+            self._endpoint(url).bytes_in += bytes_in
+
+    def record_retry(self, url: str, backoff: float):
+        """Record a retry and the backoff slept before it."""
+        with self._lock:
+            self._endpoint(url).retries += 1
+            self.backoff_seconds += backoff
+
+    def record_limiter_wait(self, seconds: float, priority: Optional[str] = None):
+        """Add time spent waiting for a rate limit token, by priority class."""
+        if seconds > 0:
+            with self._lock:
+                self.limiter_wait_seconds += seconds
+                if priority:
+                    self.limiter_wait_by_priority[priority] = (
+                        self.limiter_wait_by_priority.get(priority, 0.0) + seconds
+                    )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a consistent copy of all metrics.
+
+        Returns:
+            Dictionary with totals and an ``endpoints`` mapping.
+        """
+        with self._lock:
+            endpoints = {
+                family: {
+                    "requests": m.requests,
+                    "retries": m.retries,
+                    "bytes_in": m.bytes_in,
+                    "statuses": dict(m.statuses),
+                    "latency": m.latency.snapshot(),
+                }
+                for family, m in self._endpoints.items()
+            }
+            return {
+                "uptime_s": time.time() - self._started,
+                "requests": sum(m["requests"] for m in endpoints.values()),
+                "retries": sum(m["retries"] for m in endpoints.values()),
+                "bytes_in": sum(m["bytes_in"] for m in endpoints.values()),
+                "limiter_wait_s": self.limiter_wait_seconds,
+                "limiter_wait_by_priority_s": dict(self.limiter_wait_by_priority),
+                "backoff_s": self.backoff_seconds,
+                "endpoints": endpoints,
+            }
+
+
+def to_prometheus(snapshot: Dict[str, Any], prefix: str = "sec_client") -> str:
+    """
+    Render a metrics snapshot in the Prometheus text exposition format.
+
+    Args:
+        snapshot: Snapshot from RequestMetrics.snapshot or SECClient.stats.
+        prefix: Metric name prefix.
+
+    Returns:
+        Exposition text.
+    """
+    lines = []
+
+    def metric(name: str, kind: str, help_text: str):
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+    endpoints = snapshot.get("endpoints", {})
+
+    metric("requests_total", "counter", "HTTP request attempts by endpoint and status.")
+    for family, m in endpoints.items():
+        for status, count in m["statuses"].items():
+            lines.append(f'{prefix}_requests_total{{endpoint="{family}",status="{status}"}} {count}')
+
+    metric("retries_total", "counter", "Retried request attempts by endpoint.")
+    for family, m in endpoints.items():
+        lines.append(f'{prefix}_retries_total{{endpoint="{family}"}} {m["retries"]}')
+
+    metric("response_bytes_total", "counter", "Response body bytes received by endpoint.")
+    for family, m in endpoints.items():
+        lines.append(f'{prefix}_response_bytes_total{{endpoint="{family}"}} {m["bytes_in"]}')
+
+    metric("request_duration_seconds", "histogram", "Time to response headers by endpoint.")
+    for family, m in endpoints.items():
+        latency = m["latency"]
+        for bound, count in latency["buckets"].items():
+            lines.append(f'{prefix}_request_duration_seconds_bucket{{endpoint="{family}",le="{bound}"}} {count}')
+        lines.append(f'{prefix}_request_duration_seconds_sum{{endpoint="{family}"}} {latency["sum"]}')
+        lines.append(f'{prefix}_request_duration_seconds_count{{endpoint="{family}"}} {latency["count"]}')
+
+    # Labelled series only: an unlabelled total alongside would be double counted by sum()
+    metric("limiter_wait_seconds_total", "counter", "Time spent waiting for rate limit tokens by priority.")
+    for priority, seconds in snapshot.get("limiter_wait_by_priority_s", {}).items():
+        lines.append(f'{prefix}_limiter_wait_seconds_total{{priority="{priority}"}} {seconds}')
+
+    metric("backoff_seconds_total", "counter", "Time spent sleeping before retries.")
+    lines.append(f'{prefix}_backoff_seconds_total {snapshot.get("backoff_s", 0.0)}')
+
+    connections = snapshot.get("connections", {})
+    if connections:
+        metric("connections_opened_total", "counter", "Connections (handshakes) opened by host.")
+        for host, c in connections.items():
+            lines.append(f'{prefix}_connections_opened_total{{host="{host}"}} {c["connections"]}')
+
+    circuits = snapshot.get("circuits", {})
+    if circuits:
+        states = {"closed": 0, "half_open": 1, "open": 2}
+        metric("circuit_state", "gauge", "Circuit breaker state (0 closed, 1 half-open, 2 open).")
+        for name, c in circuits.items():
+            lines.append(f'{prefix}_circuit_state{{circuit="{name}"}} {states[c["state"]]}')
+        metric("circuit_rejected_total", "counter", "Requests refused by an open circuit.")
+        for name, c in circuits.items():
+            lines.append(f'{prefix}_circuit_rejected_total{{circuit="{name}"}} {c["rejected"]}')
+
+    if "rate_limit" in snapshot:
+        metric("rate_limit_requests_per_second", "gauge", "Current adaptive request rate.")
+        lines.append(f'{prefix}_rate_limit_requests_per_second {snapshot["rate_limit"]}')
+
+    return "\n".join(lines) + "\n"
+
+
+def validate_metrics_format(fmt: str) -> str:
+    """
+    Check a metrics file format.
+
+    Args:
+        fmt: Format name.
+
+    Returns:
+        The format.
+
+    Raises:
+        ValidationError: If the format is not one of METRICS_FORMATS.
+    """
+    if fmt not in METRICS_FORMATS:
+        raise ValidationError(
+            f"Invalid metrics format '{fmt}'; expected one of {', '.join(METRICS_FORMATS)}"
+        )
+    return fmt
+
+
+def write_metrics(snapshot: Dict[str, Any], path: Path, fmt: str = "prometheus"):
+    """
+    Atomically write a metrics snapshot to a file.
+
+    Args:
+        snapshot: Metrics snapshot.
+        path: Output file (e.g. for the node_exporter textfile collector).
+        fmt: "prometheus" or "json".
+
+    Raises:
+        ValidationError: If the format is unknown.
+    """
+    validate_metrics_format(fmt)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == "json":
+        data = json.dumps(snapshot, indent=2, default=str)
+    else:
+        data = to_prometheus(snapshot)
+
+    fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp-")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(data)
+    os.replace(tmp_name, path)
+
+
+class MetricsFileWriter:
+    """Background thread writing a metrics snapshot to a file periodically."""
+
+    def __init__(self, snapshot_func, path: Path, fmt: str = "prometheus", interval: float = 15.0):
+        """
+        Initialize writer.
+
+        Args:
+            snapshot_func: Zero-argument callable returning a snapshot.
+            path: Output file.
+            fmt: "prometheus" or "json".
+            interval: Seconds between writes.
+        """
+        self.snapshot_func = snapshot_func
+        self.path = Path(path)
+        self.fmt = fmt
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sec-metrics", daemon=True)
+
+    def start(self) -> "MetricsFileWriter":
+        """Start periodic writing."""
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.write()
+
+    def write(self):
+        """Write one snapshot now."""
+        try:
+            write_metrics(self.snapshot_func(), self.path, self.fmt)
+        except Exception as e:
+            logger.warning(f"Failed to write metrics to {self.path}: {e}")
+
+    def stop(self):
+        """Stop the thread and write a final snapshot."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.write()
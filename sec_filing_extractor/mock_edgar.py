@@ -0,0 +1,483 @@
+"""
+Local stand-in for the SEC EDGAR endpoints, for load and throughput testing.
+
+Serves submissions, company facts, ticker files and filing archives from a
+fixture directory laid out as::
+
+    fixtures/
+        company_tickers.json
+        ticker.txt                                  (optional)
+        cik-lookup-data.txt                         (optional)
+        submissions/CIK0000320193.json
+        companyfacts/CIK0000320193.json
+        archives/320193/000032019324000123/...      (filing files)
+        full-index/2024/QTR1/master.idx             (optional)
+        daily-index/2024/QTR1/master.20240102.idx   (optional)
+
+Filing ``index.json`` documents are generated from the archive directory
+listing unless one is present. The server enforces a request rate
+(answering 429 with Retry-After when exceeded) and can inject latency,
+random failures, and cut off the first full body served for each path. It can
+also gzip responses for clients that accept it, applying Range requests
+to the compressed bytes as real servers do.
+
+Run standalone with ``python -m sec_filing_extractor.mock_edgar FIXTURES``.
+"""
+import gzip
+import json
+import time
+import random
+import shutil
+import argparse
+import hashlib
+import logging
+import threading
+from email.utils import formatdate
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class MockEDGARStats:
+    """Thread-safe counters of requests handled by the mock server."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connections = 0
+        self.requests = 0
+        self.ok = 0
+        self.not_modified = 0
+        self.throttled = 0
+        self.failed = 0
+        self.not_found = 0
+        self.bytes_sent = 0
+        self.latencies = []
+
+    def record_connection(self):
+        """Record one accepted connection."""
+        with self._lock:
+            self.connections += 1
+
+    def record(self, status: int, size: int, latency: float):
+        """Record one handled request."""
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += size
+            self.latencies.append(latency)
+            if status in (200, 206):
+                self.ok += 1
+            elif status == 304:
+                self.not_modified += 1
+            elif status == 429:
+                self.throttled += 1
+            elif status == 404:
+                self.not_found += 1
+            else:
+                self.failed += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a copy of the counters."""
+        with self._lock:
+            return {
+                "connections": self.connections,
+                "requests": self.requests,
+                "ok": self.ok,
+                "not_modified": self.not_modified,
+                "throttled": self.throttled,
+                "failed": self.failed,
+                "not_found": self.not_found,
+                "bytes_sent": self.bytes_sent,
+                "latencies": list(self.latencies),
+            }
+
+
+class _AdmissionBucket:
+    """Server-side token bucket that rejects instead of waiting."""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.capacity = max(burst, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available."""
+        if self.rate <= 0:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+
+class _MockEDGARHandler(BaseHTTPRequestHandler):
+    """Request handler routing EDGAR URL paths to fixture files."""
+
+    protocol_version = "HTTP/1.1"
+    server: "MockEDGARServer"
+
+    def setup(self):
+        super().setup()
+        self.server.stats.record_connection()
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def do_GET(self):
+        started = time.monotonic()
+        status, size = self._handle()
+        self.server.stats.record(status, size, time.monotonic() - started)
+
+    def _handle(self) -> Tuple[int, int]:
+        server = self.server
+
+        if server.latency > 0:
+            time.sleep(server.latency * random.uniform(0.5, 1.5))
+
+        if not server.bucket.try_acquire():
+            return self._send(429, b"", {"Retry-After": "1"})
+
+        if server.failure_rate > 0 and random.random() < server.failure_rate:
+            return self._send(503, b"")
+
+        path = self.path.split("?", 1)[0]
+        resolved = server.resolve(path)
+        if resolved is None:
+            return self._send(404, b"")
+
+        body, content_type, mtime = resolved
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        headers = {
+            "Content-Type": content_type,
+            "ETag": etag,
+            "Last-Modified": formatdate(mtime, usegmt=True),
+            "Accept-Ranges": "bytes",
+        }
+
+        if self.headers.get("If-None-Match") == etag:
+            return self._send(304, b"", headers)
+
+        if server.compress and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, mtime=0)
+            headers["Content-Encoding"] = "gzip"
+
+        range_header = self.headers.get("Range", "")
+        if range_header.startswith("bytes="):
+            start = int(range_header[6:].split("-", 1)[0] or 0)
+            if start >= len(body):
+                headers["Content-Range"] = f"bytes */{len(body)}"
+                return self._send(416, b"", headers)
+            headers["Content-Range"] = f"bytes {start}-{len(body) - 1}/{len(body)}"
+            return self._send(206, body[start:], headers)
+
+        return self._send(200, body, headers)
+
+    def _send(self, status: int, body: bytes, headers: Optional[Dict[str, str]] = None) -> Tuple[int, int]:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if status == 200 and len(body) > 1 and self.server.first_cut(self.path):
+            # Announce the full length but close the connection halfway
+            body = body[:len(body) // 2]
+            self.close_connection = True
+        if body:
+            self.wfile.write(body)
+        return status, len(body)
+
+
+class MockEDGARServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server emulating EDGAR from a fixture directory.
+
+    Point a Config at it with ``sec_api_base`` and ``sec_files_base`` both
+    set to ``server.url``.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        fixture_dir: Path,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        rate: float = 10.0,
+        burst: float = 10.0,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        drop_first: bool = False,
+        compress: bool = False
+    ):
+        """
+        Initialize mock server.
+
+        Args:
+            fixture_dir: Directory with fixture files.
+            host: Interface to bind.
+            port: Port to bind (0 picks a free port).
+            rate: Requests per second admitted before answering 429.
+            burst: Requests admitted back-to-back.
+            latency: Mean injected latency per request in seconds.
+            failure_rate: Probability of answering 503 to a request.
+            drop_first: Close the connection halfway through the first
+                        full (non-range) body served for each path.
+            compress: Gzip file contents for clients accepting gzip.
+        """
+        super().__init__((host, port), _MockEDGARHandler)
+        self.fixture_dir = Path(fixture_dir)
+        self.bucket = _AdmissionBucket(rate, burst)
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.drop_first = drop_first
+        self.compress = compress
+        self._cut_paths = set()
+        self._cut_lock = threading.Lock()
+        self.stats = MockEDGARStats()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def first_cut(self, path: str) -> bool:
+        """
+        Check whether a full response for a path should be cut off.
+
+        Args:
+            path: Request path.
+
+        Returns:
+            True the first time a path is seen with drop_first set.
+        """
+        if not self.drop_first:
+            return False
+        with self._cut_lock:
+            if path in self._cut_paths:
+                return False
+            self._cut_paths.add(path)
+            return True
+
+    def resolve(self, path: str) -> Optional[Tuple[bytes, str, float]]:
+        """
+        Map an EDGAR URL path to fixture content.
+
+        Args:
+            path: URL path without query string.
+
+        Returns:
+            Tuple of (body, content type, modification time), or None
+            (also for paths leading outside the fixture directory).
+        """
+        root = self.fixture_dir
+        parts = [p for p in path.split("/") if p]
+
+        if parts[:1] == ["submissions"] and len(parts) == 2:
+            return self._read(root / "submissions" / parts[1])
+        if parts[:3] == ["api", "xbrl", "companyfacts"] and len(parts) == 4:
+            return self._read(root / "companyfacts" / parts[3])
+        if parts == ["files", "company_tickers.json"]:
+            return self._read(root / "company_tickers.json")
+        if parts == ["include", "ticker.txt"]:
+            return self._read(root / "ticker.txt")
+        if parts == ["Archives", "edgar", "cik-lookup-data.txt"]:
+            return self._read(root / "cik-lookup-data.txt")
+        if parts[:3] in (["Archives", "edgar", "full-index"], ["Archives", "edgar", "daily-index"]) and len(parts) >= 4:
+            return self._read(root.joinpath(*parts[2:]))
+        if parts[:3] == ["Archives", "edgar", "data"] and len(parts) >= 5:
+            filing_dir = root / "archives" / parts[3] / parts[4]
+            if len(parts) == 6 and parts[5] == "index.json" and not (filing_dir / "index.json").exists():
+                return self._directory_index(filing_dir, path)
+            if len(parts) == 6:
+                return self._read(filing_dir / parts[5])
+        return None
+
+    def _inside(self, file_path: Path) -> bool:
+        """Check that a path stays within the fixture directory (no ``..`` escapes)."""
+        root = self.fixture_dir.resolve()
+        resolved = file_path.resolve()
+        return resolved == root or root in resolved.parents
+
+    def _read(self, file_path: Path) -> Optional[Tuple[bytes, str, float]]:
+        """Read a fixture file."""
+        if not self._inside(file_path) or not file_path.is_file():
+            return None
+        suffix = file_path.suffix.lower()
+        content_type = {
+            ".json": "application/json",
+            ".htm": "text/html",
+            ".html": "text/html",
+            ".xml": "application/xml",
+            ".txt": "text/plain",
+        }.get(suffix, "application/octet-stream")
+        return file_path.read_bytes(), content_type, file_path.stat().st_mtime
+
+    def _directory_index(self, filing_dir: Path, path: str) -> Optional[Tuple[bytes, str, float]]:
+        """Generate an EDGAR-style index.json from a directory listing."""
+        if not self._inside(filing_dir) or not filing_dir.is_dir():
+            return None
+        items = [
+            {
+                "name": p.name,
+                "type": "text.gif",
+                "size": str(p.stat().st_size),
+                "last-modified": time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(p.stat().st_mtime)),
+            }
+            for p in sorted(filing_dir.iterdir())
+            if p.is_file()
+        ]
+        index = {
+            "directory": {
+                "item": items,
+                "name": path.rsplit("/", 1)[0],
+                "parent-dir": "",
+            }
+        }
+        return json.dumps(index).encode("utf-8"), "application/json", filing_dir.stat().st_mtime
+
+    def start(self) -> "MockEDGARServer":
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name="mock-edgar", daemon=True)
+        self._thread.start()
+        logger.info(f"Mock EDGAR serving {self.fixture_dir} at {self.url}")
+        return self
+
+    def stop(self):
+        """Stop serving and release the socket."""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def build_fixture(
+    filing_dir: Path,
+    fixture_dir: Path,
+    cik: str,
+    ticker: str,
+    company_name: str,
+    form: str = "10-K",
+    filing_date: str = "",
+    primary_doc: str = ""
+) -> Path:
+    """
+    Build a fixture directory from a previously downloaded filing.
+
+    Copies the filing's files into the archive layout, reuses a saved
+    ``facts/company_facts.json`` if present, and writes minimal ticker,
+    company-name and submissions documents describing the single filing.
+
+    Args:
+        filing_dir: Downloaded filing directory named after its accession.
+        fixture_dir: Output fixture directory.
+        cik: Company CIK.
+        ticker: Ticker symbol.
+        company_name: Company name.
+        form: Form type of the filing.
+        filing_date: Filing date (YYYY-MM-DD).
+        primary_doc: Primary document name. If empty, the largest HTML file.
+
+    Returns:
+        Path to the fixture directory.
+    """
+    filing_dir = Path(filing_dir)
+    fixture_dir = Path(fixture_dir)
+    accession = filing_dir.name
+    cik_int = int(cik)
+    cik10 = f"{cik_int:010d}"
+
+    archive_dir = fixture_dir / "archives" / str(cik_int) / accession.replace("-", "")
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    files = [p for p in filing_dir.iterdir() if p.is_file()]
+    for src in files:
+        shutil.copy2(src, archive_dir / src.name)
+
+    if not primary_doc:
+        html_files = [p for p in files if p.suffix.lower() in (".htm", ".html")]
+        primary_doc = max(html_files, key=lambda p: p.stat().st_size).name if html_files else ""
+
+    (fixture_dir / "company_tickers.json").write_text(
+        json.dumps({"0": {"cik_str": cik_int, "ticker": ticker.upper(), "title": company_name}}),
+        encoding="utf-8"
+    )
+    (fixture_dir / "cik-lookup-data.txt").write_text(
+        f"{company_name.upper()}:{cik10}:\n", encoding="latin-1"
+    )
+
+    submissions = {
+        "cik": str(cik_int),
+        "name": company_name,
+        "tickers": [ticker.upper()],
+        "filings": {
+            "recent": {
+                "accessionNumber": [accession],
+                "filingDate": [filing_date],
+                "reportDate": [""],
+                "form": [form],
+                "primaryDocument": [primary_doc],
+            },
+            "files": [],
+        },
+    }
+    (fixture_dir / "submissions").mkdir(exist_ok=True)
+    (fixture_dir / "submissions" / f"CIK{cik10}.json").write_text(json.dumps(submissions), encoding="utf-8")
+
+    facts_src = filing_dir / "facts" / "company_facts.json"
+    if facts_src.exists():
+        (fixture_dir / "companyfacts").mkdir(exist_ok=True)
+        shutil.copy2(facts_src, fixture_dir / "companyfacts" / f"CIK{cik10}.json")
+
+    logger.info(f"Built fixture for {ticker} {accession} in {fixture_dir}")
+    return fixture_dir
+
+
+def main():
+    """Run the mock server in the foreground."""
+    parser = argparse.ArgumentParser(description="Mock SEC EDGAR server")
+    parser.add_argument("fixtures", help="Fixture directory")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--rate", type=float, default=10.0, help="Admitted requests per second")
+    parser.add_argument("--burst", type=float, default=10.0, help="Admitted burst size")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean injected latency (s)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Probability of a 503")
+    parser.add_argument("--drop-first", action="store_true",
+                        help="Cut off the first full response for each path")
+    parser.add_argument("--gzip", action="store_true", help="Gzip bodies for clients accepting it")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = MockEDGARServer(
+        Path(args.fixtures), args.host, args.port,
+        rate=args.rate, burst=args.burst,
+        latency=args.latency, failure_rate=args.failure_rate,
+        drop_first=args.drop_first, compress=args.gzip
+    )
+    print(f"Mock EDGAR listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
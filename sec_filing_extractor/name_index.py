@@ -0,0 +1,369 @@
+"""
+Fuzzy company-name search over EDGAR's company name to CIK list.
+
+EDGAR publishes every registrant name it knows, including former names
+and filers without a ticker, in ``cik-lookup-data.txt`` with lines of the
+form ``NAME:CIK:``. The file is large, so it is ingested line by line
+into compact structures:
+
+* name ids sorted by normalized name, for prefix search with bisect;
+* a token vocabulary with a posting list (array of name ids) per token,
+  and the token ids of each name;
+* a trigram index over the vocabulary, to match misspelled tokens.
+
+A query is answered by intersecting the posting lists of its tokens,
+rarest first, so a lookup scores only the names that share its tokens
+rather than a million names; results are capped after scoring.
+"""
+import re
+import bisect
+import logging
+from array import array
+from pathlib import Path
+from typing import Dict, List, Iterable, Optional, Set, Tuple, Union
+
+
+logger = logging.getLogger(__name__)
+
+
+# Legal-form words that carry no identifying information
+STOPWORDS = frozenset((
+    "INC", "INCORPORATED", "CORP", "CORPORATION", "CO", "COMPANY", "LTD",
+    "LIMITED", "LLC", "LP", "LLP", "PLC", "THE", "OF", "AND", "SA", "AG",
+    "NV", "DE", "HOLDINGS", "GROUP", "TRUST",
+))
+
+_NON_ALNUM = re.compile(r"[^A-Z0-9]+")
+
+# Vocabulary tokens considered per query token for prefix/fuzzy matches
+MAX_TOKEN_EXPANSIONS = 20
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a company name for comparison.
+
+    Args:
+        name: Raw company name.
+
+    Returns:
+        Uppercase name with punctuation collapsed to single spaces.
+    """
+    return _NON_ALNUM.sub(" ", name.upper()).strip()
+
+
+def name_tokens(normalized: str) -> List[str]:
+    """
+    Split a normalized name into search tokens.
+
+    Args:
+        normalized: Name from normalize_name.
+
+    Returns:
+        Tokens without stopwords (all tokens if every one is a stopword).
+    """
+    tokens = normalized.split()
+    meaningful = [t for t in tokens if t not in STOPWORDS]
+    return meaningful or tokens
+
+
+def _trigrams(token: str) -> Set[str]:
+    """Get the padded trigrams of a token."""
+    padded = f" {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def parse_cik_lookup_line(line: Union[str, bytes]) -> Optional[Tuple[str, int]]:
+    """
+    Parse one ``NAME:CIK:`` line (names may themselves contain colons).
+
+    Args:
+        line: Line as text or latin-1 bytes.
+
+    Returns:
+        Tuple of (name, CIK), or None for malformed lines.
+    """
+    if isinstance(line, bytes):
+        line = line.decode("latin-1")
+    line = line.rstrip("\r\n")
+    if line.endswith(":"):
+        line = line[:-1]
+    name, sep, cik = line.rpartition(":")
+    if not sep or not name.strip():
+        return None
+    try:
+        return name.strip(), int(cik)
+    except ValueError:
+        return None
+
+
+class _SortedNames:
+    """Sequence view of normalized names in sorted order, for bisect."""
+
+    def __init__(self, index: "CompanyNameIndex"):
+        self._index = index
+
+    def __len__(self) -> int:
+        return len(self._index._sorted_ids)
+
+    def __getitem__(self, position: int) -> str:
+        return normalize_name(self._index._names[self._index._sorted_ids[position]])
+
+
+class CompanyNameIndex:
+    """
+    In-memory company-name index supporting prefix and fuzzy queries.
+
+    Build it by calling ``add`` (or ``ingest_lines``/``ingest_file``) for
+    every name and then ``finalize``. Names are stored once; normalized
+    forms are recomputed on the few entries a query inspects.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._names: List[str] = []
+        self._ciks = array("I")
+        # Token ids of every name, flattened; name i owns
+        # _name_tokens[_token_offsets[i]:_token_offsets[i + 1]]
+        self._name_tokens = array("I")
+        self._token_offsets = array("I", [0])
+        self._token_ids: Dict[str, int] = {}
+        self._postings: List[array] = []
+        self._vocab: List[str] = []
+        self._vocab_order: List[int] = []
+        self._trigram_index: Dict[str, array] = {}
+        self._sorted_ids = array("I")
+        self.finalized = False
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, name: str, cik: int):
+        """
+        Add one name.
+
+        Args:
+            name: Company name as published.
+            cik: Company CIK.
+        """
+        normalized = normalize_name(name)
+        if not normalized:
+            return
+
+        name_id = len(self._names)
+        self._names.append(name)
+        self._ciks.append(cik)
+
+        for token in dict.fromkeys(name_tokens(normalized)):
+            token_id = self._token_ids.get(token)
+            if token_id is None:
+                token_id = self._token_ids[token] = len(self._postings)
+                self._postings.append(array("I"))
+            self._postings[token_id].append(name_id)
+            self._name_tokens.append(token_id)
+        self._token_offsets.append(len(self._name_tokens))
+        self.finalized = False
+
+    def ingest_lines(self, lines: Iterable[Union[str, bytes]]) -> int:
+        """
+        Add names from ``NAME:CIK:`` lines and finalize the index.
+
+        Args:
+            lines: Iterable of lines (consumed lazily).
+
+        Returns:
+            Number of names in the index.
+        """
+        for line in lines:
+            parsed = parse_cik_lookup_line(line)
+            if parsed is not None:
+                self.add(*parsed)
+        self.finalize()
+        return len(self)
+
+    def ingest_file(self, path: Path) -> int:
+        """
+        Add names from a local copy of cik-lookup-data.txt.
+
+        Args:
+            path: File path.
+
+        Returns:
+            Number of names in the index.
+        """
+        with open(path, "rb") as f:
+            return self.ingest_lines(f)
+
+    def finalize(self):
+        """Build the sorted and trigram structures after adding names."""
+        self._sorted_ids = array("I", sorted(
+            range(len(self._names)),
+            key=lambda i: normalize_name(self._names[i])
+        ))
+
+        self._vocab = sorted(self._token_ids)
+        self._vocab_order = [self._token_ids[t] for t in self._vocab]
+
+        trigram_index: Dict[str, array] = {}
+        for position, token in enumerate(self._vocab):
+            for gram in _trigrams(token):
+                trigram_index.setdefault(gram, array("I")).append(position)
+        self._trigram_index = trigram_index
+        self.finalized = True
+        logger.info(f"Company name index built: {len(self._names)} names, {len(self._vocab)} tokens")
+
+    def _expand_token(self, token: str, allow_prefix: bool) -> List[Tuple[int, float]]:
+        """
+        Find vocabulary tokens matching a query token.
+
+        Args:
+            token: Normalized query token.
+            allow_prefix: Whether longer tokens starting with it match.
+
+        Returns:
+            List of (posting list id, weight) pairs, best first.
+        """
+        token_id = self._token_ids.get(token)
+        matches = [(token_id, 1.0)] if token_id is not None else []
+
+        if allow_prefix:
+            start = bisect.bisect_left(self._vocab, token)
+            for position in range(start, min(start + MAX_TOKEN_EXPANSIONS, len(self._vocab))):
+                candidate = self._vocab[position]
+                if not candidate.startswith(token):
+                    break
+                if candidate != token:
+                    matches.append((self._vocab_order[position], 0.8))
+
+        if matches or len(token) < 3:
+            return matches
+
+        # No exact or prefix match: compare trigrams (Dice coefficient)
+        grams = _trigrams(token)
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for position in self._trigram_index.get(gram, ()):
+                shared[position] = shared.get(position, 0) + 1
+        scored = []
+        for position, count in shared.items():
+            similarity = 2.0 * count / (len(grams) + len(_trigrams(self._vocab[position])))
+            if similarity >= 0.4:
+                scored.append((similarity, position))
+        scored.sort(reverse=True)
+        return [
+            (self._vocab_order[position], 0.7 * similarity)
+            for similarity, position in scored[:MAX_TOKEN_EXPANSIONS]
+        ]
+
+    def prefix_search(self, prefix: str, limit: int = 10) -> List[Dict[str, object]]:
+        """
+        Find names starting with a prefix.
+
+        Args:
+            prefix: Name prefix (normalized internally).
+            limit: Maximum results.
+
+        Returns:
+            List of dictionaries with name and cik, in name order.
+        """
+        if not self.finalized:
+            self.finalize()
+        normalized = normalize_name(prefix)
+        if not normalized:
+            return []
+
+        sorted_names = _SortedNames(self)
+        start = bisect.bisect_left(sorted_names, normalized)
+        results = []
+        for position in range(start, len(sorted_names)):
+            if len(results) >= limit or not sorted_names[position].startswith(normalized):
+                break
+            name_id = self._sorted_ids[position]
+            results.append({"name": self._names[name_id], "cik": f"{self._ciks[name_id]:010d}"})
+        return results
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, object]]:
+        """
+        Fuzzy search for companies by name.
+
+        Every query token is matched exactly, then as a prefix (the last
+        token only, for type-ahead), then by trigram similarity. Names are
+        scored by the average of their best match per query token, with a
+        bonus for names starting with the whole query; ties go to names
+        with the fewest words beyond the query.
+
+        Args:
+            query: Company name or fragment.
+            limit: Maximum results.
+
+        Returns:
+            List of dictionaries with name, cik and score (0-1], best
+            first.
+        """
+        if not self.finalized:
+            self.finalize()
+        normalized = normalize_name(query)
+        tokens = name_tokens(normalized)
+        if not tokens:
+            return []
+
+        expansions = [
+            self._expand_token(token, allow_prefix=(i == len(tokens) - 1))
+            for i, token in enumerate(tokens)
+        ]
+
+        # Candidates are the names matching every query token that matches
+        # anything; the smallest sets are intersected first
+        matched = sorted(
+            (expansion for expansion in expansions if expansion),
+            key=lambda expansion: sum(len(self._postings[pid]) for pid, _ in expansion)
+        )
+        if not matched:
+            return []
+        candidates: Set[int] = set()
+        for posting_id, _ in matched[0]:
+            candidates.update(self._postings[posting_id])
+        for expansion in matched[1:]:
+            names: Set[int] = set()
+            for posting_id, _ in expansion:
+                names.update(self._postings[posting_id])
+            narrowed = candidates & names
+            if not narrowed:
+                # A token no candidate shares is scored, not required
+                continue
+            candidates = narrowed
+
+        # Score candidates against every query token
+        weights = [dict(matches) for matches in expansions]
+        offsets = self._token_offsets
+        results = []
+        for name_id in candidates:
+            own = self._name_tokens[offsets[name_id]:offsets[name_id + 1]]
+            total = 0.0
+            used = set()
+            for token_weights in weights:
+                best = 0.0
+                best_token = None
+                for token_id in own:
+                    weight = token_weights.get(token_id)
+                    if weight is not None and weight > best:
+                        best, best_token = weight, token_id
+                total += best
+                used.add(best_token)
+            score = total / len(tokens)
+            # Names that start like the query rank first
+            if own and weights[0].get(own[0]) == 1.0:
+                score = min(1.0, score + 0.1)
+            # Among equal scores, names with fewer words beyond the query win
+            extra = sum(1 for token_id in own if token_id not in used)
+            results.append((score, -extra, -len(self._names[name_id]), name_id))
+
+        results.sort(reverse=True)
+        return [
+            {
+                "name": self._names[name_id],
+                "cik": f"{self._ciks[name_id]:010d}",
+                "score": round(score, 3),
+            }
+            for score, _, _, name_id in results[:limit]
+        ]
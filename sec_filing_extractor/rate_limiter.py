@@ -0,0 +1,532 @@
+"""
+Token bucket rate limiters shared by the sync and async SEC clients.
+
+Limiters can be scoped to a single client, to the whole process, or to the
+whole host (via a small state file guarded by an OS file lock), so that
+every SECClient on a machine draws from the same SEC request budget.
+
+Limiters also adapt their rate to server feedback (additive increase on
+success, multiplicative decrease on throttling) and can be paused for a
+server-requested Retry-After interval.
+"""
+import os
+import time
+import struct
+import asyncio
+import logging
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional, Dict, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from .config import Config
+from .exceptions import ValidationError
+
+
+logger = logging.getLogger(__name__)
+
+
+RATE_LIMIT_SCOPES = ("client", "process", "host")
+
+# tokens, last update (unix time), current rate, last decrease (unix time)
+_STATE_FORMAT = "<dddd"
+_STATE_SIZE = struct.calcsize(_STATE_FORMAT)
+
+# Minimum seconds between two multiplicative decreases, so one burst of
+# throttled responses from concurrent requests only cuts the rate once
+DECREASE_COOLDOWN = 1.0
+
+
+def _refill(
+    tokens: float,
+    updated: float,
+    now: float,
+    rate: float,
+    capacity: float
+) -> float:
+    """
+    Compute the tokens in a bucket after refilling.
+
+    Args:
+        tokens: Tokens in the bucket at time ``updated``. Negative when
+                callers have borrowed against future refills.
+        updated: Time of the last update.
+        now: Current time.
+        rate: Tokens added per second.
+        capacity: Maximum number of tokens.
+
+    Returns:
+        Tokens available at time ``now``.
+    """
+    elapsed = max(0.0, now - updated)
+    return min(capacity, tokens + elapsed * rate)
+
+
+def _take(tokens: float, rate: float) -> Tuple[float, float]:
+    """
+    Take one token from a refilled bucket.
+
+    Args:
+        tokens: Tokens currently available.
+        rate: Tokens added per second.
+
+    Returns:
+        Tuple of (remaining tokens, seconds the caller must wait).
+    """
+    tokens -= 1.0
+    wait = -tokens / rate if tokens < 0 else 0.0
+    return tokens, wait
+
+
+class RateLimiter(ABC):
+    """
+    Abstract base class for request rate limiters.
+
+    Subclasses implement ``_reserve``, which takes a token without blocking
+    and reports how long the caller must wait before using it. That lets
+    the same limiter serve both blocking and asyncio callers.
+
+    When ``increase``/``decrease`` are set, the rate adapts between
+    ``min_rate`` and the configured rate (AIMD): successful requests win
+    back ``increase`` times the configured rate per second of traffic,
+    however low the rate has fallen, and each throttled response
+    multiplies the rate by ``decrease``.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float],
+        capacity: float = 1.0,
+        min_rate: Optional[float] = None,
+        increase: float = 0.0,
+        decrease: float = 1.0
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate: Tokens added per second. None or 0 disables limiting.
+            capacity: Maximum number of tokens (burst size).
+            min_rate: Lowest rate the limiter may adapt down to.
+            increase: Fraction of ``rate`` regained per second of
+                      successful requests.
+            decrease: Factor applied to the rate after a throttled request.
+        """
+        self.max_rate = rate or 0.0
+        self.rate = self.max_rate
+        self.capacity = max(float(capacity), 1.0)
+        self.min_rate = min(min_rate or self.max_rate, self.max_rate)
+        self.increase = increase
+        self.decrease = decrease
+
+    @property
+    def adaptive(self) -> bool:
+        """Whether the rate adapts to server feedback."""
+        return self.max_rate > 0 and (self.increase > 0 or self.decrease < 1)
+
+    def _increased(self, rate: float) -> float:
+        """
+        Apply the additive increase for one successful request to a rate.
+
+        A rate of ``rate`` sees that many successes per second, so each one
+        adds ``increase * max_rate / rate`` and the rate recovers by
+        ``increase * max_rate`` per second at any level.
+        """
+        return min(self.max_rate, rate + self.increase * self.max_rate / rate)
+
+    def _decreased(self, rate: float) -> float:
+        """Apply the multiplicative decrease to a rate."""
+        return max(self.min_rate, rate * self.decrease)
+
+    @abstractmethod
+    def _reserve(self) -> float:
+        """
+        Take one token, borrowing against future refills if needed.
+
+        Returns:
+            Seconds the caller must wait before using the token.
+        """
+        pass
+
+    @abstractmethod
+    def record_success(self):
+        """Record a successful response (additive increase)."""
+        pass
+
+    @abstractmethod
+    def record_throttle(self):
+        """Record a throttling response (multiplicative decrease)."""
+        pass
+
+    @abstractmethod
+    def penalize(self, seconds: float) -> bool:
+        """
+        Hold back all callers for a number of seconds.
+
+        Args:
+            seconds: Pause requested by the server (e.g. Retry-After).
+
+        Returns:
+            True if the pause was applied, False if the limiter is disabled.
+        """
+        pass
+
+    def acquire(self) -> float:
+        """
+        Block until a token is available.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            logger.debug(f"Rate limiting: sleeping for {wait:.2f}s")
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """
+        Wait until a token is available without blocking the event loop.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            logger.debug(f"Rate limiting: awaiting {wait:.2f}s")
+            await asyncio.sleep(wait)
+        return wait
+
+
+class TokenBucket(RateLimiter):
+    """
+    Thread-safe in-process token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    With a capacity of 1 this reproduces the classic "minimum delay between
+    requests" behaviour of ``Config.request_delay``.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float],
+        capacity: float = 1.0,
+        min_rate: Optional[float] = None,
+        increase: float = 0.0,
+        decrease: float = 1.0
+    ):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second. None or 0 disables limiting.
+            capacity: Maximum number of tokens (burst size).
+            min_rate: Lowest rate the limiter may adapt down to.
+            increase: Fraction of ``rate`` regained per second of
+                      successful requests.
+            decrease: Factor applied to the rate after a throttled request.
+        """
+        super().__init__(rate, capacity, min_rate, increase, decrease)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Config) -> "TokenBucket":
+        """
+        Create a bucket using the rate settings of a configuration.
+
+        Args:
+            config: Configuration object.
+
+        Returns:
+            Configured token bucket.
+        """
+        return cls(config.requests_per_second, config.rate_limit_burst, **_adaptive_settings(config))
+
+    def _refill_locked(self, now: float):
+        """Bring the token count up to date. Caller must hold the lock."""
+        self._tokens = _refill(self._tokens, self._updated, now, self.rate, self.capacity)
+        self._updated = now
+
+    def _reserve(self) -> float:
+        """Take one token from the in-memory bucket."""
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            self._refill_locked(time.monotonic())
+            self._tokens, wait = _take(self._tokens, self.rate)
+        return wait
+
+    def record_success(self):
+        """Record a successful response (additive increase)."""
+        if not self.adaptive or self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self._refill_locked(time.monotonic())
+            self.rate = self._increased(self.rate)
+
+    def record_throttle(self):
+        """Record a throttling response (multiplicative decrease)."""
+        if not self.adaptive:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_decrease < DECREASE_COOLDOWN:
+                return
+            self._refill_locked(now)
+            self._last_decrease = now
+            previous, self.rate = self.rate, self._decreased(self.rate)
+        logger.warning(f"Throttled by SEC: request rate lowered from {previous:.2f}/s to {self.rate:.2f}/s")
+
+    def penalize(self, seconds: float) -> bool:
+        """Hold back all callers for a number of seconds."""
+        if self.rate <= 0:
+            return False
+        with self._lock:
+            self._refill_locked(time.monotonic())
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+        return True
+
+
+class FileTokenBucket(RateLimiter):
+    """
+    Cross-process token bucket backed by a lock file.
+
+    The bucket state (tokens, last update time, current adaptive rate and
+    last decrease time) lives in a 32-byte file. Each operation locks the
+    file, updates the state and unlocks it, so every process on the host
+    that points at the same file shares one budget and one adaptive rate.
+    The lock is held only for the read-modify-write, never while sleeping.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        rate: Optional[float],
+        capacity: float = 1.0,
+        min_rate: Optional[float] = None,
+        increase: float = 0.0,
+        decrease: float = 1.0
+    ):
+        """
+        Initialize file-backed token bucket.
+
+        Args:
+            path: State file shared by all participating processes.
+            rate: Tokens added per second. None or 0 disables limiting.
+            capacity: Maximum number of tokens (burst size).
+            min_rate: Lowest rate the limiter may adapt down to.
+            increase: Fraction of ``rate`` regained per second of
+                      successful requests.
+            decrease: Factor applied to the rate after a throttled request.
+        """
+        super().__init__(rate, capacity, min_rate, increase, decrease)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._thread_lock = threading.Lock()
+        self._fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o666)
+        logger.debug(f"Using host-wide rate limit state file {self.path}")
+
+    def _lock(self):
+        """Acquire the exclusive OS lock on the state file."""
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        else:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+
+    def _unlock(self):
+        """Release the OS lock on the state file."""
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+
+    def _transact(self, func):
+        """
+        Run a read-modify-write of the shared state under the file lock.
+
+        Args:
+            func: Callable taking (state list, now). It may modify the state
+                  list in place; its return value is passed through. Tokens
+                  are refilled up to ``now`` before it is called.
+
+        Returns:
+            Result of func.
+        """
+        with self._thread_lock:
+            self._lock()
+            try:
+                now = time.time()
+                raw = self._read()
+                if len(raw) == _STATE_SIZE:
+                    state = list(struct.unpack(_STATE_FORMAT, raw))
+                else:
+                    state = [self.capacity, now, self.max_rate, 0.0]
+
+                # Processes may be configured differently; never exceed our own ceiling
+                rate = state[2] if state[2] > 0 else self.max_rate
+                self.rate = min(rate, self.max_rate)
+                state[0] = _refill(state[0], state[1], now, self.rate, self.capacity)
+                state[1] = now
+                state[2] = self.rate
+
+                result = func(state, now)
+                self.rate = state[2]
+                self._write(struct.pack(_STATE_FORMAT, *state))
+                return result
+            finally:
+                self._unlock()
+
+    def _reserve(self) -> float:
+        """Take one token from the shared state file."""
+        if self.max_rate <= 0:
+            return 0.0
+
+        def take(state, now):
+            state[0], wait = _take(state[0], state[2])
+            return wait
+
+        return self._transact(take)
+
+    def record_success(self):
+        """Record a successful response (additive increase)."""
+        if not self.adaptive or self.rate >= self.max_rate:
+            return
+
+        def increase(state, now):
+            state[2] = self._increased(state[2])
+
+        self._transact(increase)
+
+    def record_throttle(self):
+        """Record a throttling response (multiplicative decrease)."""
+        if not self.adaptive:
+            return
+
+        def decrease(state, now):
+            if now - state[3] < DECREASE_COOLDOWN:
+                return None
+            state[3] = now
+            previous, state[2] = state[2], self._decreased(state[2])
+            return previous
+
+        previous = self._transact(decrease)
+        if previous is not None:
+            logger.warning(f"Throttled by SEC: request rate lowered from {previous:.2f}/s to {self.rate:.2f}/s")
+
+    def penalize(self, seconds: float) -> bool:
+        """Hold back all callers on the host for a number of seconds."""
+        if self.max_rate <= 0:
+            return False
+
+        def pause(state, now):
+            state[0] = min(state[0], 0.0) - seconds * state[2]
+
+        self._transact(pause)
+        return True
+
+    def _read(self) -> bytes:
+        """Read the raw state from the start of the file."""
+        if hasattr(os, "pread"):
+            return os.pread(self._fd, _STATE_SIZE, 0)
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        return os.read(self._fd, _STATE_SIZE)
+
+    def _write(self, data: bytes):
+        """Overwrite the raw state at the start of the file."""
+        if hasattr(os, "pwrite"):
+            os.pwrite(self._fd, data, 0)
+        else:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            os.write(self._fd, data)
+
+    def close(self):
+        """Close the state file descriptor."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+_shared_limiters: Dict[tuple, RateLimiter] = {}
+_shared_lock = threading.Lock()
+
+
+def default_state_file() -> Path:
+    """Get the default host-wide rate limit state file path."""
+    return Path(tempfile.gettempdir()) / "sec_filing_extractor.ratelimit"
+
+
+def _adaptive_settings(config: Config) -> Dict[str, float]:
+    """
+    Get AIMD keyword arguments for a limiter from a configuration.
+
+    Args:
+        config: Configuration object.
+
+    Returns:
+        Dictionary with min_rate, increase and decrease.
+    """
+    if not config.adaptive_rate:
+        return {}
+    return {
+        "min_rate": config.adaptive_min_rate,
+        "increase": config.adaptive_increase,
+        "decrease": config.adaptive_decrease,
+    }
+
+
+def create_limiter(config: Config) -> RateLimiter:
+    """
+    Build or reuse the rate limiter selected by ``config.rate_limit_scope``.
+
+    - ``client``: a private bucket for this client only.
+    - ``process``: one bucket shared by every client in the process.
+    - ``host``: one file-backed bucket shared by every process on the host.
+
+    Args:
+        config: Configuration object.
+
+    Returns:
+        Rate limiter instance.
+
+    Raises:
+        ValidationError: If the scope is unknown.
+    """
+    scope = config.rate_limit_scope
+    rate = config.requests_per_second
+    burst = config.rate_limit_burst
+    adaptive = _adaptive_settings(config)
+
+    if scope == "client":
+        return TokenBucket(rate, burst, **adaptive)
+
+    if scope == "process":
+        key = (scope, rate, burst, tuple(sorted(adaptive.items())))
+        factory = lambda: TokenBucket(rate, burst, **adaptive)
+    elif scope == "host":
+        path = Path(config.rate_limit_state_file or default_state_file())
+        key = (scope, str(path.resolve()), rate, burst, tuple(sorted(adaptive.items())))
+        factory = lambda: FileTokenBucket(path, rate, burst, **adaptive)
+    else:
+        raise ValidationError(
+            f"Invalid rate_limit_scope '{scope}' (expected one of {RATE_LIMIT_SCOPES})"
+        )
+
+    with _shared_lock:
+        limiter = _shared_limiters.get(key)
+        if limiter is None:
+            limiter = factory()
+            _shared_limiters[key] = limiter
+        return limiter
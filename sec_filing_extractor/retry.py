@@ -0,0 +1,128 @@
+"""
+Retry and backoff policy for SEC API requests.
+"""
+import random
+import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from .config import Config
+
+
+logger = logging.getLogger(__name__)
+
+
+# Statuses worth retrying
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_throttle(status: int, retry_after: Optional[str] = None) -> bool:
+    """
+    Check whether a response means "slow down" to the adaptive rate controller.
+
+    A 429 always does. A 503 only does when it carries Retry-After; without
+    one it is an ordinary server error that is retried but does not lower
+    the request rate, which would otherwise sink to its floor under a
+    steady trickle of 5xx.
+
+    Args:
+        status: HTTP status code.
+        retry_after: Retry-After header value, if any.
+
+    Returns:
+        True if the response should lower the request rate.
+    """
+    return status == 429 or (status == 503 and bool(retry_after))
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter.
+
+    The n-th retry waits a random time between 0 and
+    ``min(max_delay, base_delay * 2**n)``, which spreads retries from
+    concurrent workers instead of letting them arrive together.
+    """
+
+    def __init__(self, max_retries: int, base_delay: float, max_delay: float = 60.0):
+        """
+        Initialize retry policy.
+
+        Args:
+            max_retries: Maximum retries per request (0 disables retries).
+            base_delay: Backoff base in seconds.
+            max_delay: Upper bound for a single backoff in seconds.
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @classmethod
+    def from_config(cls, config: Config) -> "RetryPolicy":
+        """
+        Create a policy from configuration.
+
+        Args:
+            config: Configuration object.
+
+        Returns:
+            Configured retry policy.
+        """
+        return cls(config.max_retries, config.retry_delay, config.max_retry_delay)
+
+    def should_retry(self, attempt: int, status: Optional[int] = None) -> bool:
+        """
+        Decide whether a failed attempt should be retried.
+
+        Args:
+            attempt: Number of retries already made.
+            status: HTTP status code, or None for connection errors.
+
+        Returns:
+            True if another attempt is allowed.
+        """
+        if attempt >= self.max_retries:
+            return False
+        return status is None or status in RETRY_STATUSES
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Get the jittered backoff before a retry.
+
+        Args:
+            attempt: Number of retries already made.
+
+        Returns:
+            Seconds to wait.
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def retry_after(self, header: Optional[str]) -> Optional[float]:
+        """
+        Parse a Retry-After header.
+
+        Args:
+            header: Header value, either delta-seconds or an HTTP date.
+
+        Returns:
+            Seconds to wait (capped at max_delay), or None if absent/invalid.
+        """
+        if not header:
+            return None
+
+        header = header.strip()
+        try:
+            seconds = float(header)
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(header)
+            except (TypeError, ValueError):
+                logger.debug(f"Ignoring invalid Retry-After header: {header}")
+                return None
+            if when.tzinfo is None:
+                when = when.replace(tzinfo=timezone.utc)
+            seconds = (when - datetime.now(timezone.utc)).total_seconds()
+
+        return min(max(seconds, 0.0), self.max_delay)
@@ -0,0 +1,203 @@
+"""
+Priority-aware hand-out of rate limit tokens.
+
+Requests carry a priority class: ``interactive`` (a person is waiting),
+``pipeline`` (regular batch work) or ``backfill`` (bulk historical
+downloads). When several threads wait for a token, the scheduler grants
+it to the highest class first, so an interactive lookup does not queue
+behind thousands of exhibit downloads while backfill still consumes every
+token nobody else wants.
+
+Waiting requests age: every ``aging`` seconds spent waiting promote a
+request by one class, so lower classes cannot be starved indefinitely.
+"""
+import time
+import logging
+import itertools
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from .exceptions import ValidationError
+
+
+logger = logging.getLogger(__name__)
+
+
+PRIORITY_CLASSES = ("interactive", "pipeline", "backfill")
+
+_current_priority: contextvars.ContextVar = contextvars.ContextVar(
+    "sec_request_priority", default=None
+)
+
+
+def validate_priority(priority: str) -> int:
+    """
+    Get the rank of a priority class (0 is most urgent).
+
+    Args:
+        priority: Priority class name.
+
+    Returns:
+        Rank of the class.
+
+    Raises:
+        ValidationError: If the class is unknown.
+    """
+    try:
+        return PRIORITY_CLASSES.index(priority)
+    except ValueError:
+        raise ValidationError(
+            f"Invalid priority '{priority}'; expected one of {', '.join(PRIORITY_CLASSES)}"
+        ) from None
+
+
+def current_priority() -> Optional[str]:
+    """Get the priority class set by the innermost request_priority block."""
+    return _current_priority.get()
+
+
+@contextmanager
+def request_priority(priority: str):
+    """
+    Run SEC requests made in this context (thread or task) at a priority.
+
+    Example::
+
+        with request_priority("backfill"):
+            manager.download_filing(filing)
+
+    Args:
+        priority: One of PRIORITY_CLASSES.
+
+    Raises:
+        ValidationError: If the class is unknown.
+    """
+    validate_priority(priority)
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class PriorityScheduler:
+    """
+    Grants tokens from a rate limiter to waiting threads in priority order.
+
+    One waiter at a time takes a token from the limiter (sleeping until it
+    is due); the next waiter is chosen only once that grant completes, so
+    a newly arrived urgent request overtakes everything still queued. With
+    no contention a request goes straight to the limiter.
+    """
+
+    def __init__(self, limiter, aging: float = 30.0):
+        """
+        Initialize scheduler.
+
+        Args:
+            limiter: Rate limiter (anything with ``acquire()`` and ``rate``).
+            aging: Seconds of waiting that promote a request by one class;
+                   0 disables aging.
+        """
+        self.limiter = limiter
+        self.aging = aging
+        self._cond = threading.Condition()
+        self._waiting: Dict[int, Tuple[int, float]] = {}
+        self._tickets = itertools.count()
+        self._granting = False
+
+    def _next_ticket(self, now: float) -> int:
+        """Choose the waiter to serve next. Caller must hold the lock."""
+        def effective(item):
+            ticket, (rank, enqueued) = item
+            if self.aging > 0:
+                return (rank - (now - enqueued) / self.aging, ticket)
+            return (rank, ticket)
+
+        return min(self._waiting.items(), key=effective)[0]
+
+    def acquire(self, priority: str = "pipeline", take: Optional[Callable[[], float]] = None) -> float:
+        """
+        Wait for a token at the given priority.
+
+        Args:
+            priority: One of PRIORITY_CLASSES.
+            take: Takes the token once this request's turn comes; defaults
+                  to the limiter's ``acquire``. A limiter adapter (such as
+                  the async client's, which waits on its event loop) passes
+                  its own to queue in the same order as everyone else.
+
+        Returns:
+            Seconds spent waiting.
+
+        Raises:
+            ValidationError: If the class is unknown.
+        """
+        rank = validate_priority(priority)
+        take = take or self.limiter.acquire
+        if self.limiter.rate <= 0:
+            return take()
+        started = time.monotonic()
+
+        with self._cond:
+            ticket = next(self._tickets)
+            self._waiting[ticket] = (rank, started)
+            while self._granting or self._next_ticket(time.monotonic()) != ticket:
+                # Waiters re-check after every grant; the timeout lets aging
+                # promote a waiter even if no grant happens meanwhile
+                self._cond.wait(timeout=self.aging or None)
+            del self._waiting[ticket]
+            self._granting = True
+
+        try:
+            take()
+        finally:
+            with self._cond:
+                self._granting = False
+                self._cond.notify_all()
+
+        return time.monotonic() - started
+
+    def waiting(self) -> Dict[str, int]:
+        """
+        Get the number of queued requests per priority class.
+
+        Returns:
+            Mapping of class name to waiters.
+        """
+        with self._cond:
+            counts = {name: 0 for name in PRIORITY_CLASSES}
+            for rank, _ in self._waiting.values():
+                counts[PRIORITY_CLASSES[rank]] += 1
+            return counts
+
+
+_schedulers: "WeakKeyDictionary" = WeakKeyDictionary()
+_schedulers_lock = threading.Lock()
+
+
+def scheduler_for(limiter, aging: float = 30.0) -> PriorityScheduler:
+    """
+    Get the scheduler in front of a limiter.
+
+    Clients sharing a limiter (scope "process") share its scheduler, so
+    priorities hold across all clients in the process. A limiter adapter
+    (anything exposing the limiter it wraps as ``limiter``) gets the
+    scheduler of the wrapped limiter.
+
+    Args:
+        limiter: Rate limiter or limiter adapter.
+        aging: Aging period used if the scheduler is created.
+
+    Returns:
+        Shared PriorityScheduler.
+    """
+    limiter = getattr(limiter, "limiter", limiter)
+    with _schedulers_lock:
+        scheduler = _schedulers.get(limiter)
+        if scheduler is None:
+            scheduler = _schedulers[limiter] = PriorityScheduler(limiter, aging)
+        return scheduler
@@ -1,22 +1,60 @@
 """
 SEC API client with rate limiting and retry logic.
 """
+import os
+import re
 import time
 import logging
+import threading
 from typing import Optional, Dict, Any
 from pathlib import Path
+from datetime import date
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from .config import Config
-from .exceptions import APIError, RateLimitError, DownloadError
+from .exceptions import APIError, RateLimitError, DownloadError, ValidationError, CircuitOpenError
+from .rate_limiter import RateLimiter, create_limiter
+from .http_cache import HTTPCache, CacheEntry
+from .retry import RetryPolicy, is_throttle
+from .singleflight import SingleFlight
+from .lru_cache import SizedLRUCache
+from .cassette import Cassette, CassetteAdapter
+from .metrics import RequestMetrics, MetricsFileWriter, write_metrics, validate_metrics_format
+from .circuit_breaker import CircuitBreakerRegistry
+from .scheduler import scheduler_for, request_priority, current_priority, validate_priority
+from .transport import HTTP2Adapter, create_http_adapter, pool_stats
 
 
 logger = logging.getLogger(__name__)
 
 
+_CONTENT_RANGE_RE = re.compile(r"bytes\s+(\d+|\*)(?:-(\d+))?/(\d+|\*)")
+
+
+def _content_range_start(header: Optional[str]) -> Optional[int]:
+    """Get the first byte position from a Content-Range header."""
+    match = _CONTENT_RANGE_RE.match(header or "")
+    if not match or match.group(1) == "*":
+        return None
+    return int(match.group(1))
+
+
+def _content_range_total(header: Optional[str]) -> Optional[int]:
+    """Get the complete length from a Content-Range header."""
+    match = _CONTENT_RANGE_RE.match(header or "")
+    if not match or match.group(3) == "*":
+        return None
+    return int(match.group(3))
+
+
+def _full_url(url: str, params: Optional[Dict] = None) -> str:
+    """Get a request URL with its query string, for use as an identity key."""
+    if not params:
+        return url
+    return requests.Request("GET", url, params=params).prepare().url
+
+
 class SECClient:
     """
     Client for interacting with SEC EDGAR API.
@@ -25,38 +63,104 @@ class SECClient:
     for all SEC API interactions.
     """
 
-    def __init__(self, config: Optional[Config] = None):
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        limiter: Optional[RateLimiter] = None,
+        pool_maxsize: Optional[int] = None
+    ):
         """
         Initialize SEC client.
 
         Args:
             config: Configuration object. If None, uses default config.
+            limiter: Rate limiter consulted before every request. If None,
+                     one is selected by config.rate_limit_scope.
+            pool_maxsize: Connections kept open per host. If None, uses
+                          config.pool_maxsize.
         """
         self.config = config or Config()
-        self._last_request_time = 0
-        self._session = self._create_session()
+        self._limiter = limiter or create_limiter(self.config)
+        validate_priority(self.config.default_priority)
+        validate_metrics_format(self.config.metrics_format)
+        self._scheduler = scheduler_for(self._limiter, self.config.priority_aging)
+        self._breakers = CircuitBreakerRegistry(self.config) if self.config.circuit_breaker else None
+        self._retry_policy = RetryPolicy.from_config(self.config)
+        self._session = self._create_session(pool_maxsize)
+        self._cache = None
+        if self.config.http_cache_dir:
+            self._cache = HTTPCache(
+                Path(self.config.http_cache_dir),
+                self.config.http_cache_rules
+            )
+        self._revalidating = set()
+        self._revalidating_lock = threading.Lock()
+        self._single_flight = SingleFlight() if self.config.single_flight else None
+        self._json_cache = None
+        if self.config.json_cache_max_bytes > 0:
+            self._json_cache = SizedLRUCache(
+                self.config.json_cache_max_bytes,
+                self.config.json_cache_ttl
+            )
+        self._metrics = RequestMetrics() if self.config.metrics_enabled else None
+        self._metrics_writer = None
+        if self._metrics is not None and self.config.metrics_file:
+            self._metrics_writer = MetricsFileWriter(
+                self.stats,
+                Path(self.config.metrics_file),
+                self.config.metrics_format,
+                self.config.metrics_interval
+            ).start()
         logger.info("SEC Client initialized")
 
-    def _create_session(self) -> requests.Session:
+    def _create_session(self, pool_maxsize: Optional[int] = None) -> requests.Session:
         """
-        Create a requests session with retry logic.
+        Create a requests session.
+
+        Retries are handled by ``_request`` so that every attempt passes
+        through the rate limiter; the transport itself never retries.
+        Keep-alive pools are shared by all threads using the client and
+        sized per host from config.pool_maxsize_per_host. With
+        config.http2 a single multiplexing HTTP/2 transport is used instead.
+
+        Args:
+            pool_maxsize: Connections kept open per host. If None, uses
+                          config.pool_maxsize.
 
         Returns:
             Configured requests Session object.
+
+        Raises:
+            ValidationError: If HTTP/2 is requested without httpx, or a
+                             cassette mode is set without a path.
         """
         session = requests.Session()
-
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=self.config.max_retries,
-            backoff_factor=self.config.retry_delay,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST"]
-        )
-
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+        pool_maxsize = pool_maxsize or self.config.pool_maxsize
+
+        if self.config.http2:
+            adapters = {"": HTTP2Adapter(pool_maxsize)}
+        else:
+            adapters = {"": create_http_adapter(
+                pool_maxsize, self.config.pool_connections, self.config.pool_block
+            )}
+            for host, size in self.config.pool_maxsize_per_host.items():
+                adapters[host] = create_http_adapter(
+                    size, self.config.pool_connections, self.config.pool_block
+                )
+
+        if self.config.cassette_mode != "off":
+            if not self.config.cassette_path:
+                raise ValidationError("cassette_path is required when cassette_mode is set")
+            cassette = Cassette(Path(self.config.cassette_path), self.config.cassette_mode)
+            adapters = {
+                host: CassetteAdapter(cassette, adapter, self.config.cassette_latency)
+                for host, adapter in adapters.items()
+            }
+
+        for host, adapter in adapters.items():
+            suffix = f"{host}/" if host else ""
+            session.mount(f"http://{suffix}", adapter)
+            session.mount(f"https://{suffix}", adapter)
         session.headers.update(self.config.headers)
 
         return session
@@ -65,19 +169,44 @@ class SECClient:
         """
         Enforce rate limiting between requests.
 
-        Ensures minimum delay between consecutive requests.
+        Takes a token from the limiter, sleeping until one is available.
+        Waiting requests are served in priority order (see ``priority``).
+        """
+        priority = current_priority() or self.config.default_priority
+        waited = self._scheduler.acquire(priority, self._limiter.acquire)
+        if self._metrics is not None and waited:
+            self._metrics.record_limiter_wait(waited, priority)
+
+    def priority(self, priority: str):
+        """
+        Context manager running requests made inside it at a priority.
+
+        The class applies to the calling thread (or asyncio task) and to
+        every client sharing this client's limiter, e.g.::
+
+            with client.priority("interactive"):
+                client.get_company_submissions(cik)
+
+        Args:
+            priority: "interactive", "pipeline" or "backfill".
+
+        Returns:
+            Context manager.
+
+        Raises:
+            ValidationError: If the class is unknown.
         """
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.config.request_delay:
-            sleep_time = self.config.request_delay - elapsed
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-        self._last_request_time = time.time()
+        return request_priority(priority)
 
     def get(self, url: str, params: Optional[Dict] = None, stream: bool = False) -> requests.Response:
         """
         Perform a GET request with rate limiting.
 
+        Non-streaming requests are served from the HTTP cache when one is
+        configured: fresh entries cost no request at all, stale entries are
+        revalidated with a conditional GET. Identical non-streaming requests
+        made concurrently share a single network round trip.
+
         Args:
             url: URL to request.
             params: Optional query parameters.
@@ -90,29 +219,299 @@ class SECClient:
             APIError: If the request fails.
             RateLimitError: If rate limit is exceeded.
         """
-        self._rate_limit()
+        if stream:
+            return self._request(url, params=params, stream=True)
+        if self._single_flight is None:
+            return self._fetch(url, params)
+        return self._single_flight.do(
+            ("GET", _full_url(url, params)),
+            lambda: self._fetch(url, params)
+        )
 
-        try:
-            logger.debug(f"GET request: {url}")
-            response = self._session.get(url, params=params, stream=stream, timeout=30)
-            response.raise_for_status()
-            return response
-
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 429:
-                logger.error("Rate limit exceeded")
-                raise RateLimitError("SEC API rate limit exceeded") from e
-            logger.error(f"HTTP error: {e}")
-            raise APIError(f"SEC API request failed: {e}") from e
-
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            raise APIError(f"Request to SEC API failed: {e}") from e
+    def _fetch(self, url: str, params: Optional[Dict] = None) -> requests.Response:
+        """
+        Fetch a non-streaming response, through the HTTP cache if configured.
+
+        Args:
+            url: URL to request.
+            params: Optional query parameters.
+
+        Returns:
+            Response object.
+        """
+        if self._cache is not None:
+            return self._cached_get(url, params)
+        return self._request(url, params=params)
+
+    def _request(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
+        """
+        Perform a rate-limited GET request against the network.
+
+        Connection errors and 429/5xx responses are retried with jittered
+        exponential backoff. Every attempt takes a token from the rate
+        limiter, a Retry-After header pauses the limiter for all callers,
+        and throttling responses lower the adaptive request rate. Attempts
+        are checked against the circuit breaker for the URL's host and
+        endpoint family first; while it is open no token is spent and the
+        request fails immediately.
+
+        Args:
+            url: URL to request.
+            params: Optional query parameters.
+            stream: Whether to stream the response.
+            headers: Optional extra request headers.
+
+        Returns:
+            Response object.
+
+        Raises:
+            APIError: If the request fails.
+            CircuitOpenError: If the endpoint's circuit breaker is open.
+            RateLimitError: If rate limit is exceeded.
+        """
+        breaker = self._breakers.breaker_for(url) if self._breakers is not None else None
+        attempt = 0
+        while True:
+            if breaker is not None and not breaker.allow():
+                retry_in = breaker.retry_in()
+                logger.debug(f"Circuit {breaker.name} open, not requesting {url}")
+                raise CircuitOpenError(
+                    f"Circuit open for {breaker.name}, retry in {retry_in:.0f}s",
+                    retry_in=retry_in
+                )
+
+            self._rate_limit()
+
+            started = time.monotonic()
+            try:
+                logger.debug(f"GET request: {url}")
+                # Always streamed, so the latency stops at the response headers;
+                # a non-streaming body is read right after
+                response = self._session.get(
+                    url, params=params, stream=True, headers=headers, timeout=30
+                )
+                latency = time.monotonic() - started
+                if not stream:
+                    response.content
+            except requests.exceptions.RequestException as e:
+                if self._metrics is not None:
+                    self._metrics.record_request(url, None, time.monotonic() - started)
+                if breaker is not None:
+                    breaker.record_failure()
+                if self._retry_policy.should_retry(attempt):
+                    self._backoff(attempt, url, str(e))
+                    attempt += 1
+                    continue
+                logger.error(f"Request failed: {e}")
+                raise APIError(f"Request to SEC API failed: {e}") from e
+
+            status = response.status_code
+            if self._metrics is not None:
+                self._metrics.record_request(
+                    url,
+                    status,
+                    latency,
+                    0 if stream else len(response.content)
+                )
+
+            if breaker is not None:
+                if status >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+
+            if is_throttle(status, response.headers.get("Retry-After")):
+                self._limiter.record_throttle()
+            elif status < 400:
+                self._limiter.record_success()
+
+            if status >= 400 and self._retry_policy.should_retry(attempt, status):
+                retry_after = self._retry_policy.retry_after(response.headers.get("Retry-After"))
+                response.close()
+                self._backoff(attempt, url, f"HTTP {status}", retry_after)
+                attempt += 1
+                continue
+
+            try:
+                response.raise_for_status()
+                return response
+
+            except requests.exceptions.HTTPError as e:
+                if status == 429:
+                    logger.error("Rate limit exceeded")
+                    raise RateLimitError("SEC API rate limit exceeded") from e
+                logger.error(f"HTTP error: {e}")
+                raise APIError(
+                    f"SEC API request failed: {e}",
+                    status_code=status
+                ) from e
+
+    def _backoff(
+        self,
+        attempt: int,
+        url: str,
+        reason: str,
+        retry_after: Optional[float] = None,
+        max_attempts: Optional[int] = None
+    ):
+        """
+        Wait before retrying a request.
+
+        A server-supplied Retry-After pauses the shared limiter, so every
+        caller backs off, not just this one. The jittered backoff is slept
+        by this caller only.
+
+        Args:
+            attempt: Number of retries already made.
+            url: Request URL (for logging).
+            reason: Why the attempt failed (for logging).
+            retry_after: Seconds requested by the server, if any.
+            max_attempts: Attempt limit shown in the log message. If None,
+                          uses the retry policy's max_retries.
+        """
+        delay = self._retry_policy.backoff(attempt)
+        if retry_after is not None and not self._limiter.penalize(retry_after):
+            delay = max(delay, retry_after)
+
+        logger.warning(
+            f"Retrying {url} after {reason} "
+            f"(attempt {attempt + 1}/{max_attempts or self._retry_policy.max_retries}, "
+            f"backoff {delay:.2f}s)"
+        )
+        if self._metrics is not None:
+            self._metrics.record_retry(url, delay)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _cached_get(self, url: str, params: Optional[Dict] = None) -> requests.Response:
+        """
+        Serve a GET request through the HTTP cache.
+
+        Args:
+            url: URL to request.
+            params: Optional query parameters.
+
+        Returns:
+            Response object (rebuilt from cache or fresh from the network).
+        """
+        full_url, key = self._cache.make_key(url, params)
+        entry = self._cache.lookup(key)
+
+        if entry is not None:
+            ttl, stale_window = self._cache.policy_for(full_url)
+            age = entry.age
+
+            if age < ttl:
+                logger.debug(f"Cache hit (fresh): {full_url}")
+                return entry.to_response()
+
+            if age < ttl + stale_window:
+                logger.debug(f"Cache hit (stale, revalidating): {full_url}")
+                self._revalidate_in_background(key, full_url, entry)
+                return entry.to_response()
+
+        return self._revalidate(key, full_url, entry)
+
+    def _revalidate(
+        self,
+        key: str,
+        full_url: str,
+        entry: Optional[CacheEntry]
+    ) -> requests.Response:
+        """
+        Fetch a URL, sending validators from the cached entry if present.
+
+        Args:
+            key: Hashed cache key.
+            full_url: URL including query string.
+            entry: Existing cache entry, or None.
+
+        Returns:
+            Response object.
+        """
+        headers = entry.conditional_headers() if entry is not None else None
+        response = self._request(full_url, headers=headers)
+
+        if response.status_code == 304 and entry is not None:
+            logger.debug(f"Not modified: {full_url}")
+            return self._cache.refresh(key, entry, response).to_response()
+
+        if response.status_code == 200:
+            self._cache.store(key, full_url, response)
+        return response
+
+    def _revalidate_in_background(self, key: str, full_url: str, entry: CacheEntry):
+        """
+        Revalidate a stale entry on a background thread.
+
+        At most one revalidation per key runs at a time.
+
+        Args:
+            key: Hashed cache key.
+            full_url: URL including query string.
+            entry: Stale cache entry.
+        """
+        with self._revalidating_lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+
+        def worker():
+            try:
+                # A stale copy has already been served; nobody is waiting
+                with request_priority("backfill"):
+                    self._revalidate(key, full_url, entry)
+            except Exception as e:
+                logger.warning(f"Background revalidation failed for {full_url}: {e}")
+            finally:
+                with self._revalidating_lock:
+                    self._revalidating.discard(key)
+
+        threading.Thread(target=worker, name="sec-revalidate", daemon=True).start()
 
     def get_json(self, url: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Perform a GET request and parse JSON response.
 
+        Decoded documents are kept in an in-memory LRU cache shared by all
+        components using this client, and concurrent callers asking for the
+        same URL share one request. Returned objects are shared and must
+        therefore be treated as read-only.
+
+        Args:
+            url: URL to request.
+            params: Optional query parameters.
+
+        Returns:
+            Parsed JSON data as dictionary.
+
+        Raises:
+            APIError: If the request fails or JSON parsing fails.
+        """
+        key = _full_url(url, params)
+        if self._json_cache is not None:
+            data = self._json_cache.get(key)
+            if data is not None:
+                logger.debug(f"JSON cache hit: {key}")
+                return data
+
+        if self._single_flight is None:
+            return self._fetch_json(url, params)
+        return self._single_flight.do(
+            ("JSON", key),
+            lambda: self._fetch_json(url, params)
+        )
+
+    def _fetch_json(self, url: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Fetch and decode a JSON response.
+
         Args:
             url: URL to request.
             params: Optional query parameters.
@@ -126,11 +525,27 @@ class SECClient:
         response = self.get(url, params=params)
 
         try:
-            return response.json()
+            data = response.json()
         except ValueError as e:
             logger.error(f"Failed to parse JSON response from {url}")
             raise APIError(f"Invalid JSON response from SEC API") from e
 
+        if self._json_cache is not None:
+            self._json_cache.put(_full_url(url, params), data, len(response.content))
+        return data
+
+    def json_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics of the decoded JSON cache.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, evictions, entries,
+            bytes and max_bytes (empty if the cache is disabled).
+        """
+        if self._json_cache is None:
+            return {}
+        return self._json_cache.stats()
+
     def download_file(
         self,
         url: str,
@@ -140,6 +555,16 @@ class SECClient:
         """
         Download a file from SEC with streaming.
 
+        Data is written to ``<dest_path>.part`` and renamed into place once
+        complete. If the connection drops or the server keeps throttling,
+        the download resumes from the last byte written using an HTTP
+        Range request after a jittered backoff, up to
+        config.download_resume_attempts times. A partial file left behind
+        by a failed run is resumed the same way on the next call. Bodies
+        are requested without content encoding so that offsets count the
+        bytes the server ranges over; a partial file written from an
+        encoded body is discarded and the download restarted.
+
         Args:
             url: URL of file to download.
             dest_path: Destination path for downloaded file.
@@ -149,36 +574,144 @@ class SECClient:
             Path to downloaded file.
 
         Raises:
+            CircuitOpenError: If the archive circuit breaker is open (any
+                              partial file is kept for a later resume).
             DownloadError: If download fails.
         """
         # Ensure parent directory exists
         dest_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = dest_path.with_name(dest_path.name + ".part")
+
+        logger.info(f"Downloading {url} to {dest_path}")
+
+        attempt = 0
+        while True:
+            try:
+                self._download_to_part(url, part_path, progress_callback)
+                os.replace(part_path, dest_path)
+                logger.info(f"Successfully downloaded {dest_path.name}")
+                return dest_path
+
+            except CircuitOpenError:
+                raise
+
+            except Exception as e:
+                attempt += 1
+                if self._is_resumable(e) and attempt <= self.config.download_resume_attempts:
+                    offset = part_path.stat().st_size if part_path.exists() else 0
+                    self._backoff(
+                        attempt - 1, url,
+                        f"download interrupted at {offset} bytes ({e})",
+                        max_attempts=self.config.download_resume_attempts
+                    )
+                    continue
+
+                logger.error(f"Failed to download {url}: {e}")
+                # Keep partial data only if a later run can resume it
+                if not self._is_resumable(e) and part_path.exists():
+                    part_path.unlink()
+                raise DownloadError(f"Failed to download file: {e}") from e
+
+    def _download_to_part(
+        self,
+        url: str,
+        part_path: Path,
+        progress_callback: Optional[callable] = None
+    ):
+        """
+        Stream a URL into a partial file, resuming from its current size.
 
-        try:
-            response = self.get(url, stream=True)
-            total_size = int(response.headers.get('content-length', 0))
-
-            logger.info(f"Downloading {url} to {dest_path}")
+        Args:
+            url: URL of file to download.
+            part_path: Partial file to create or extend.
+            progress_callback: Optional callback function for progress updates.
 
-            downloaded = 0
-            with open(dest_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=self.config.chunk_size):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
+        Raises:
+            APIError: If the request fails.
+            DownloadError: If the server returns an inconsistent range.
+        """
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        # Ranges count the bytes on the wire, so ask for them unencoded
+        headers = {"Accept-Encoding": "identity"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
 
-                        if progress_callback and total_size:
-                            progress_callback(downloaded, total_size)
+        try:
+            response = self._request(url, stream=True, headers=headers)
+        except APIError as e:
+            if offset and e.status_code == 416:
+                # Nothing left to fetch if the partial file is already complete
+                total = _content_range_total(e.__cause__.response.headers.get("Content-Range"))
+                if total == offset:
+                    return
+                part_path.unlink()
+                raise DownloadError("Partial file does not match remote size, restarting") from e
+            raise
+
+        with response:
+            encoding = response.headers.get("Content-Encoding", "identity").lower()
+            encoded = encoding not in ("", "identity")
+            if offset and encoded:
+                # The range was applied to compressed bytes, not to the file
+                part_path.unlink()
+                raise DownloadError(f"Server sent a '{encoding}' encoded range, restarting")
+            if offset and response.status_code == 206:
+                content_range = response.headers.get("Content-Range")
+                if _content_range_start(content_range) != offset:
+                    part_path.unlink()
+                    raise DownloadError(f"Unexpected Content-Range '{content_range}', restarting")
+                mode = "ab"
+            else:
+                # Server ignored the Range header; start over
+                offset = 0
+                mode = "wb"
+
+            # Content-Length counts encoded bytes, iter_content yields decoded ones
+            total_size = 0 if encoded else int(response.headers.get('content-length', 0))
+            if total_size:
+                total_size += offset
+
+            downloaded = offset
+            try:
+                with open(part_path, mode) as f:
+                    for chunk in response.iter_content(chunk_size=self.config.chunk_size):
+                        if chunk:
+                            f.write(chunk)
+                            downloaded += len(chunk)
+
+                            if progress_callback and total_size:
+                                progress_callback(downloaded, total_size)
+            except Exception as e:
+                # Decoded bytes cannot be resumed with a Range request
+                if encoded or isinstance(e, requests.exceptions.ContentDecodingError):
+                    part_path.unlink(missing_ok=True)
+                raise
+            finally:
+                if self._metrics is not None:
+                    self._metrics.record_bytes(url, downloaded - offset)
+
+            if total_size and downloaded < total_size:
+                raise DownloadError(
+                    f"Connection closed after {downloaded} of {total_size} bytes"
+                )
+
+    @staticmethod
+    def _is_resumable(error: Exception) -> bool:
+        """
+        Check whether a download error is worth resuming.
 
-            logger.info(f"Successfully downloaded {dest_path.name}")
-            return dest_path
+        Args:
+            error: Exception raised while downloading.
 
-        except Exception as e:
-            logger.error(f"Failed to download {url}: {e}")
-            # Clean up partial download
-            if dest_path.exists():
-                dest_path.unlink()
-            raise DownloadError(f"Failed to download file: {e}") from e
+        Returns:
+            True for dropped connections, server errors, throttling and
+            range mismatches.
+        """
+        if isinstance(error, (DownloadError, RateLimitError, requests.exceptions.RequestException)):
+            return True
+        if isinstance(error, APIError):
+            return error.status_code is None or error.status_code >= 500
+        return False
 
     def get_company_submissions(self, cik: str) -> Dict[str, Any]:
         """
@@ -197,6 +730,27 @@ class SECClient:
         logger.info(f"Fetching submissions for CIK {cik}")
         return self.get_json(url)
 
+    def get_submissions_page(self, name: str) -> Dict[str, Any]:
+        """
+        Get an additional page of a company's filing history.
+
+        Large filers list only their most recent filings in the main
+        submissions document; older ones are split across the files named
+        in ``filings.files`` (e.g. ``CIK0000320193-submissions-001.json``).
+
+        Args:
+            name: Page file name from ``filings.files``.
+
+        Returns:
+            Columnar filing data (same keys as ``filings.recent``).
+
+        Raises:
+            APIError: If request fails.
+        """
+        url = f"{self.config.sec_api_base}/submissions/{name}"
+        logger.info(f"Fetching submissions page {name}")
+        return self.get_json(url)
+
     def get_company_facts(self, cik: str) -> Dict[str, Any]:
         """
         Get company facts (XBRL data) from SEC API.
@@ -243,6 +797,104 @@ class SECClient:
         response = self.get(url)
         return response.text
 
+    @property
+    def cik_lookup_data_url(self) -> str:
+        """URL of EDGAR's company name to CIK list."""
+        return f"{self.config.sec_files_base}/Archives/edgar/cik-lookup-data.txt"
+
+    def get_cik_lookup_data(self) -> requests.Response:
+        """
+        Stream EDGAR's company name to CIK list (``NAME:CIK:`` lines).
+
+        The file is large, so the response is streamed; the caller must
+        close it.
+
+        Returns:
+            Streaming response object.
+
+        Raises:
+            APIError: If request fails.
+        """
+        logger.info("Streaming company name to CIK list")
+        return self.get(self.cik_lookup_data_url, stream=True)
+
+    @property
+    def bulk_submissions_url(self) -> str:
+        """URL of EDGAR's nightly archive of every company's submissions JSON."""
+        return f"{self.config.sec_files_base}/Archives/edgar/daily-index/bulkdata/submissions.zip"
+
+    @property
+    def bulk_companyfacts_url(self) -> str:
+        """URL of EDGAR's nightly archive of every company's XBRL company facts."""
+        return f"{self.config.sec_files_base}/Archives/edgar/daily-index/xbrl/companyfacts.zip"
+
+    def full_index_url(self, year: int, quarter: int, index_type: str = "master") -> str:
+        """
+        URL of a quarterly EDGAR full-index file.
+
+        Args:
+            year: Calendar year.
+            quarter: Quarter (1-4).
+            index_type: "master" (pipe-delimited) or "form" (fixed-width).
+
+        Returns:
+            URL of ``{index_type}.idx`` for the quarter.
+        """
+        return (f"{self.config.sec_files_base}/Archives/edgar/full-index/"
+                f"{year}/QTR{quarter}/{index_type}.idx")
+
+    def get_full_index(self, year: int, quarter: int, index_type: str = "master") -> requests.Response:
+        """
+        Stream a quarterly EDGAR full-index file.
+
+        The caller must close the response.
+
+        Args:
+            year: Calendar year.
+            quarter: Quarter (1-4).
+            index_type: "master" or "form".
+
+        Returns:
+            Streaming response object.
+
+        Raises:
+            APIError: If request fails.
+        """
+        logger.info(f"Streaming {index_type} full index for {year} Q{quarter}")
+        return self.get(self.full_index_url(year, quarter, index_type), stream=True)
+
+    def daily_index_url(self, day: date, index_type: str = "master") -> str:
+        """
+        URL of an EDGAR daily-index file.
+
+        Args:
+            day: Filing date.
+            index_type: "master" (pipe-delimited) or "form" (fixed-width).
+
+        Returns:
+            URL of ``{index_type}.{YYYYMMDD}.idx`` for the day.
+        """
+        quarter = (day.month - 1) // 3 + 1
+        return (f"{self.config.sec_files_base}/Archives/edgar/daily-index/"
+                f"{day.year}/QTR{quarter}/{index_type}.{day:%Y%m%d}.idx")
+
+    def get_daily_index(self, day: date, index_type: str = "master") -> requests.Response:
+        """
+        Get an EDGAR daily-index file (published after each business day).
+
+        Args:
+            day: Filing date.
+            index_type: "master" or "form".
+
+        Returns:
+            Response object.
+
+        Raises:
+            APIError: If request fails (404 if no index exists for the day).
+        """
+        logger.info(f"Fetching {index_type} daily index for {day.isoformat()}")
+        return self.get(self.daily_index_url(day, index_type))
+
     def get_filing_index(self, cik_no_zeros: str, accession_no_dash: str) -> Dict[str, Any]:
         """
         Get filing index JSON for a specific filing.
@@ -262,8 +914,85 @@ class SECClient:
         logger.info(f"Fetching filing index for {accession_no_dash}")
         return self.get_json(url)
 
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of request metrics.
+
+        Returns:
+            Dictionary with request, retry, byte and latency figures per
+            endpoint family, limiter wait and backoff time, the current
+            request rate and JSON cache statistics. Empty if metrics are
+            disabled.
+        """
+        if self._metrics is None:
+            return {}
+        snapshot = self._metrics.snapshot()
+        snapshot["rate_limit"] = self._limiter.rate
+        snapshot["waiting"] = self._scheduler.waiting()
+        snapshot["json_cache"] = self.json_cache_stats()
+        snapshot["connections"] = self.connection_stats()
+        snapshot["circuits"] = self.circuit_stats()
+        return snapshot
+
+    def circuit_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the circuit breaker state per host and endpoint family.
+
+        Returns:
+            Mapping of ``host/family`` to state, recent failure rate, trips
+            and rejected requests (empty if breakers are disabled).
+        """
+        if self._breakers is None:
+            return {}
+        return self._breakers.snapshot()
+
+    def connection_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get connections opened and requests sent per host.
+
+        Each opened connection is one TCP (and, for HTTPS, TLS) handshake,
+        so ``requests / connections`` is the keep-alive reuse factor.
+
+        Returns:
+            Mapping of ``host:port`` to connection and request counts.
+        """
+        stats: Dict[str, Dict[str, int]] = {}
+        seen = set()
+        for adapter in self._session.adapters.values():
+            adapter = getattr(adapter, "inner", adapter)
+            if id(adapter) in seen:
+                continue
+            seen.add(id(adapter))
+            if isinstance(adapter, HTTP2Adapter):
+                counts = adapter.stats()
+            elif hasattr(adapter, "poolmanager"):
+                counts = pool_stats(adapter)
+            else:
+                continue
+            for host, entry in counts.items():
+                total = stats.setdefault(host, {"connections": 0, "requests": 0})
+                total["connections"] += entry["connections"]
+                total["requests"] += entry["requests"]
+        return stats
+
+    def write_stats(self, path: Path, fmt: str = "prometheus"):
+        """
+        Write a metrics snapshot to a file.
+
+        Args:
+            path: Output file.
+            fmt: "prometheus" (text exposition format) or "json".
+
+        Raises:
+            ValidationError: If the format is unknown.
+        """
+        write_metrics(self.stats(), path, fmt)
+
     def close(self):
         """Close the session."""
+        if self._metrics_writer is not None:
+            self._metrics_writer.stop()
+            self._metrics_writer = None
         self._session.close()
         logger.info("SEC Client session closed")
 
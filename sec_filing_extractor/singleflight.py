@@ -0,0 +1,85 @@
+"""
+Single-flight coalescing of identical concurrent calls.
+"""
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """An in-flight call and its eventual outcome."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key.
+
+    The first caller for a key (the leader) runs the function; callers
+    arriving while it is in flight block until it finishes and receive the
+    same result or exception. Once the call completes the key is released,
+    so later calls run again. Results are shared objects and must be
+    treated as read-only by callers.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Run func once for all concurrent callers with the same key.
+
+        Args:
+            key: Identity of the call (e.g. the request URL).
+            func: Zero-argument callable producing the result.
+
+        Returns:
+            Result of func, shared by all coalesced callers.
+
+        Raises:
+            Exception: Whatever func raised, re-raised in every caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            logger.debug(f"Joining in-flight request: {key}")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            if call.waiters:
+                logger.debug(f"Shared result of {key} with {call.waiters} waiting callers")
+            call.done.set()
+
+    def in_flight(self) -> int:
+        """Get the number of distinct calls currently in flight."""
+        with self._lock:
+            return len(self._calls)
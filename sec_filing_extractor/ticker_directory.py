@@ -0,0 +1,199 @@
+"""
+Indexed ticker/CIK directory built from EDGAR's ticker mapping files.
+"""
+import os
+import json
+import time
+import logging
+import tempfile
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Iterable
+
+
+logger = logging.getLogger(__name__)
+
+
+def _split_ticker_line(line: str) -> Optional[List[str]]:
+    """Split a ticker.txt line ("aapl<TAB>320193" or "AAPL|320193")."""
+    for delimiter in ("\t", "|"):
+        if delimiter in line:
+            parts = line.split(delimiter, 1)
+            if len(parts) == 2 and parts[0].strip() and parts[1].strip():
+                return parts
+    return None
+
+
+class TickerDirectory:
+    """
+    Ticker to CIK index with reverse CIK to tickers lookup.
+
+    Built in one pass from ``company_tickers.json`` (which also provides
+    company names) and ``ticker.txt`` (which adds tickers missing from the
+    JSON). Lookups are dictionary accesses. The directory can be saved to
+    and loaded from a JSON file so later processes start without a
+    download. Replacing the contents swaps whole dictionaries, so readers
+    on other threads always see a consistent directory.
+    """
+
+    def __init__(self):
+        """Initialize an empty directory."""
+        self._by_ticker: Dict[str, str] = {}
+        self._by_cik: Dict[str, List[str]] = {}
+        self._names: Dict[str, str] = {}
+        self.loaded_at: Optional[float] = None
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the directory holds data."""
+        return self.loaded_at is not None
+
+    @property
+    def age(self) -> float:
+        """Seconds since the data was fetched (infinite if never loaded)."""
+        if self.loaded_at is None:
+            return float("inf")
+        return time.time() - self.loaded_at
+
+    def build(
+        self,
+        tickers_json: Any,
+        ticker_text: Optional[str] = None,
+        loaded_at: Optional[float] = None
+    ):
+        """
+        Replace the directory contents from EDGAR mapping documents.
+
+        Args:
+            tickers_json: Parsed company_tickers.json (dict of rows or list).
+            ticker_text: Optional ticker.txt content.
+            loaded_at: Fetch time (epoch seconds); defaults to now.
+        """
+        by_ticker: Dict[str, str] = {}
+        names: Dict[str, str] = {}
+
+        rows = tickers_json.values() if isinstance(tickers_json, dict) else (tickers_json or [])
+        for row in rows:
+            if not isinstance(row, dict):
+                continue
+            ticker = str(row.get("ticker", "")).strip().upper()
+            cik_str = row.get("cik_str")
+            if not ticker or cik_str is None:
+                continue
+            try:
+                cik = f"{int(cik_str):010d}"
+            except (TypeError, ValueError):
+                continue
+            # First row wins, as with the previous linear scan
+            by_ticker.setdefault(ticker, cik)
+            if row.get("title"):
+                names.setdefault(cik, row["title"])
+
+        for line in (ticker_text or "").splitlines():
+            parts = _split_ticker_line(line)
+            if parts is None:
+                continue
+            try:
+                by_ticker.setdefault(parts[0].strip().upper(), f"{int(parts[1]):010d}")
+            except ValueError:
+                continue
+
+        self._install(by_ticker, names, loaded_at if loaded_at is not None else time.time())
+
+    def _install(self, by_ticker: Dict[str, str], names: Dict[str, str], loaded_at: float):
+        """Swap in new indexes."""
+        by_cik: Dict[str, List[str]] = {}
+        for ticker, cik in by_ticker.items():
+            by_cik.setdefault(cik, []).append(ticker)
+
+        self._by_ticker = by_ticker
+        self._by_cik = by_cik
+        self._names = names
+        self.loaded_at = loaded_at
+        logger.info(f"Ticker directory loaded: {len(by_ticker)} tickers, {len(by_cik)} companies")
+
+    def lookup(self, ticker: str) -> Optional[str]:
+        """
+        Get the CIK for a normalized (uppercase) ticker.
+
+        Args:
+            ticker: Ticker symbol.
+
+        Returns:
+            10-digit CIK string, or None if unknown.
+        """
+        return self._by_ticker.get(ticker)
+
+    def tickers_for(self, cik: str) -> List[str]:
+        """
+        Get all tickers of a company.
+
+        Args:
+            cik: 10-digit CIK string.
+
+        Returns:
+            List of tickers (empty if none).
+        """
+        return list(self._by_cik.get(cik, ()))
+
+    def name_for(self, cik: str) -> Optional[str]:
+        """
+        Get the company name from company_tickers.json.
+
+        Args:
+            cik: 10-digit CIK string.
+
+        Returns:
+            Company name, or None if unknown.
+        """
+        return self._names.get(cik)
+
+    def items(self) -> Iterable:
+        """Iterate over (ticker, CIK) pairs."""
+        return self._by_ticker.items()
+
+    def __len__(self) -> int:
+        return len(self._by_ticker)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._by_ticker
+
+    def save(self, path: Path):
+        """
+        Atomically write the directory to a JSON file.
+
+        Args:
+            path: Output file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "loaded_at": self.loaded_at,
+            "tickers": self._by_ticker,
+            "names": self._names,
+        }
+        fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_name, path)
+        logger.debug(f"Saved ticker directory to {path}")
+
+    def load(self, path: Path) -> bool:
+        """
+        Load the directory from a file written by ``save``.
+
+        Args:
+            path: Directory file.
+
+        Returns:
+            True if loaded, False if the file is missing or unreadable.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._install(data["tickers"], data.get("names", {}), float(data["loaded_at"]))
+            return True
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable ticker directory {path}: {e}")
+            return False
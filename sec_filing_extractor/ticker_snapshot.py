@@ -0,0 +1,182 @@
+"""
+Compact memory-mapped ticker/CIK snapshot shared by worker processes.
+
+File layout (little-endian)::
+
+    header   32 bytes: magic "SECTKR1\\0", record count (u32),
+             key width (u16), 2 pad bytes, fetch time (f64), 8 pad bytes
+    records  count x (ticker ASCII, NUL-padded to key width; CIK as u32),
+             sorted by ticker
+
+Opening a snapshot maps the file read-only: nothing is parsed, and every
+process mapping the same file shares its pages through the OS page cache.
+Lookups binary-search the records. Snapshots are replaced atomically with
+``os.replace``, so a reader keeps a consistent view of the file it mapped
+until it opens the replacement.
+"""
+import os
+import mmap
+import time
+import struct
+import logging
+import tempfile
+from pathlib import Path
+from typing import Optional, List, Iterable, Iterator, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+_MAGIC = b"SECTKR1\0"
+_HEADER = struct.Struct("<8sIH2xd8x")
+_CIK = struct.Struct("<I")
+
+
+class TickerSnapshot:
+    """
+    Read-only ticker to CIK index backed by a memory-mapped file.
+
+    Offers the lookup interface of TickerDirectory, so CompanyLookup can
+    use either. Company names are not stored.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Map a snapshot file.
+
+        Args:
+            path: Snapshot file written by ``write``.
+
+        Raises:
+            OSError: If the file cannot be opened.
+            ValueError: If the file is not a valid snapshot.
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mm) < _HEADER.size:
+            self._mm.close()
+            raise ValueError(f"Ticker snapshot {self.path} is truncated")
+        magic, count, width, loaded_at = _HEADER.unpack_from(self._mm, 0)
+        record_size = width + _CIK.size
+        if magic != _MAGIC or len(self._mm) < _HEADER.size + count * record_size:
+            self._mm.close()
+            raise ValueError(f"Invalid ticker snapshot {self.path}")
+
+        self._count = count
+        self._width = width
+        self._record_size = record_size
+        self.loaded_at: Optional[float] = loaded_at
+        logger.debug(f"Mapped ticker snapshot {self.path} ({count} tickers)")
+
+    @staticmethod
+    def write(path: Path, items: Iterable[Tuple[str, str]], loaded_at: Optional[float] = None):
+        """
+        Atomically write a snapshot.
+
+        Args:
+            path: Output file.
+            items: (ticker, CIK) pairs; tickers that are not ASCII are skipped.
+            loaded_at: Fetch time of the data (epoch seconds); defaults to now.
+        """
+        records = []
+        for ticker, cik in items:
+            try:
+                records.append((ticker.encode("ascii"), int(cik)))
+            except (UnicodeEncodeError, ValueError):
+                continue
+        records.sort()
+        width = max((len(key) for key, _ in records), default=1)
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(
+                _MAGIC, len(records), width,
+                loaded_at if loaded_at is not None else time.time()
+            ))
+            f.write(b"".join(key.ljust(width, b"\0") + _CIK.pack(cik) for key, cik in records))
+        os.replace(tmp_name, path)
+        logger.info(f"Wrote ticker snapshot {path} ({len(records)} tickers)")
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the snapshot holds data (always True once mapped)."""
+        return True
+
+    @property
+    def age(self) -> float:
+        """Seconds since the data was fetched."""
+        return time.time() - self.loaded_at
+
+    def _key_at(self, index: int) -> bytes:
+        """Get the padded ticker of a record."""
+        offset = _HEADER.size + index * self._record_size
+        return self._mm[offset:offset + self._width]
+
+    def _cik_at(self, index: int) -> str:
+        """Get the 10-digit CIK of a record."""
+        offset = _HEADER.size + index * self._record_size + self._width
+        return f"{_CIK.unpack_from(self._mm, offset)[0]:010d}"
+
+    def lookup(self, ticker: str) -> Optional[str]:
+        """
+        Get the CIK for a normalized (uppercase) ticker.
+
+        Args:
+            ticker: Ticker symbol.
+
+        Returns:
+            10-digit CIK string, or None if unknown.
+        """
+        try:
+            key = ticker.encode("ascii")
+        except UnicodeEncodeError:
+            return None
+        if len(key) > self._width:
+            return None
+        key = key.ljust(self._width, b"\0")
+
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._key_at(lo) == key:
+            return self._cik_at(lo)
+        return None
+
+    def tickers_for(self, cik: str) -> List[str]:
+        """
+        Get all tickers of a company (scans the snapshot).
+
+        Args:
+            cik: 10-digit CIK string.
+
+        Returns:
+            List of tickers (empty if none).
+        """
+        return [ticker for ticker, value in self.items() if value == cik]
+
+    def name_for(self, cik: str) -> Optional[str]:
+        """Company names are not stored in snapshots; always None."""
+        return None
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        """Iterate over (ticker, CIK) pairs in ticker order."""
+        for index in range(self._count):
+            yield self._key_at(index).rstrip(b"\0").decode("ascii"), self._cik_at(index)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, ticker: str) -> bool:
+        return self.lookup(ticker) is not None
+
+    def close(self):
+        """Unmap the file."""
+        self._mm.close()
@@ -0,0 +1,267 @@
+"""
+HTTP transports for the SEC client: tuned keep-alive pools and HTTP/2.
+
+``requests`` keeps connections in per-host urllib3 pools. A pool holds at
+most ``pool_maxsize`` idle connections; when more threads than that use a
+host at once, the surplus connections are closed after each response and
+the next request pays for a new TCP (and TLS) handshake. Sizing the pools
+to the expected concurrency keeps every connection alive and shared
+across threads.
+
+The optional HTTP/2 transport multiplexes all requests to a host over one
+connection. It requires ``httpx`` with HTTP/2 support
+(``pip install httpx[http2]``).
+"""
+import logging
+import threading
+from typing import Optional, Dict, Any, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from .exceptions import ValidationError
+
+try:
+    import httpx
+except ImportError:  # optional dependency
+    httpx = None
+
+
+logger = logging.getLogger(__name__)
+
+
+def create_http_adapter(pool_maxsize: int, pool_connections: int = 10, pool_block: bool = False) -> HTTPAdapter:
+    """
+    Create a keep-alive HTTP/1.1 adapter.
+
+    Transport-level retries are disabled; SECClient retries every attempt
+    through its rate limiter instead.
+
+    Args:
+        pool_maxsize: Connections kept alive per host.
+        pool_connections: Number of hosts whose pools are cached.
+        pool_block: Wait for a free connection instead of opening a
+                    surplus one that is discarded after use.
+
+    Returns:
+        Configured HTTPAdapter.
+    """
+    return HTTPAdapter(
+        max_retries=0,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block
+    )
+
+
+def pool_stats(adapter: HTTPAdapter) -> Dict[str, Dict[str, int]]:
+    """
+    Get connection counts from an adapter's urllib3 pools.
+
+    Args:
+        adapter: HTTP adapter.
+
+    Returns:
+        Mapping of ``host:port`` to connections opened and requests sent.
+    """
+    stats = {}
+    pools = adapter.poolmanager.pools
+    for key in pools.keys():
+        pool = pools.get(key)
+        if pool is None:
+            continue
+        host = f"{pool.host}:{pool.port}"
+        entry = stats.setdefault(host, {"connections": 0, "requests": 0})
+        entry["connections"] += pool.num_connections
+        entry["requests"] += pool.num_requests
+    return stats
+
+
+class _HTTPXRaw:
+    """File-like view of a streamed httpx response for requests.Response.raw."""
+
+    def __init__(self, response: "httpx.Response"):
+        self._response = response
+        self._chunks = None
+        self._buffer = b""
+
+    def read(self, amt: Optional[int] = None, **kwargs) -> bytes:
+        """Read up to ``amt`` decoded body bytes (all remaining if None)."""
+        if self._chunks is None:
+            self._chunks = self._response.iter_bytes()
+        try:
+            while amt is None or len(self._buffer) < amt:
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    break
+                self._buffer += chunk
+        except httpx.TransportError as e:
+            raise requests.exceptions.ChunkedEncodingError(e) from e
+        except httpx.DecodingError as e:
+            raise requests.exceptions.ContentDecodingError(e) from e
+
+        if amt is None:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    def close(self):
+        """Close the underlying response, returning its stream."""
+        self._response.close()
+
+    def release_conn(self):
+        """Release the connection (same as close for httpx)."""
+        self._response.close()
+
+
+class HTTP2Adapter(BaseAdapter):
+    """
+    Transport adapter sending requests through an HTTP/2 ``httpx.Client``.
+
+    Requests to one host share a single multiplexed connection, so many
+    small fetches (filing indexes, ``R*.htm`` pages) cost one handshake.
+    Servers that do not negotiate HTTP/2, and plain ``http://`` URLs, fall
+    back to HTTP/1.1 keep-alive. Transport errors are raised as their
+    ``requests`` equivalents so retry and resume logic is unchanged.
+
+    TLS verification, client certificates and proxies passed by
+    ``requests`` (including ``HTTPS_PROXY`` from the environment) are
+    honoured; each combination gets its own ``httpx.Client``.
+    """
+
+    def __init__(self, max_connections: int = 10):
+        """
+        Initialize adapter.
+
+        Args:
+            max_connections: Connections kept alive across all hosts.
+
+        Raises:
+            ValidationError: If httpx is not installed.
+        """
+        if httpx is None:
+            raise ValidationError("HTTP/2 requires httpx: pip install httpx[http2]")
+        super().__init__()
+        self.max_connections = max_connections
+        self._clients: Dict[Tuple[Any, Any, Optional[str]], "httpx.Client"] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _client_for(self, verify, cert, proxy: Optional[str]) -> "httpx.Client":
+        """
+        Get the client for a TLS/proxy combination, creating it on first use.
+
+        Args:
+            verify: False, True or a CA bundle path, as passed by requests.
+            cert: Client certificate path or (cert, key) tuple, or None.
+            proxy: Proxy URL for the request, or None.
+
+        Returns:
+            HTTP/2 client.
+        """
+        if isinstance(cert, list):
+            cert = tuple(cert)
+        key = (verify, cert, proxy)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                limits = httpx.Limits(
+                    max_connections=None,
+                    max_keepalive_connections=self.max_connections
+                )
+                # requests has already resolved proxies from the environment
+                client = httpx.Client(
+                    http2=True,
+                    limits=limits,
+                    follow_redirects=False,
+                    verify=verify,
+                    cert=cert,
+                    proxy=proxy,
+                    trust_env=False
+                )
+                self._clients[key] = client
+            return client
+
+    def _count(self, host: str, field: str):
+        """Increment a per-host counter."""
+        with self._lock:
+            entry = self._stats.setdefault(host, {"connections": 0, "requests": 0})
+            entry[field] += 1
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        """Send a prepared request over httpx."""
+        parts = urlsplit(request.url)
+        host = f"{parts.hostname}:{parts.port or (443 if parts.scheme == 'https' else 80)}"
+
+        def trace(event: str, info: Dict[str, Any]):
+            if event == "connection.connect_tcp.complete":
+                self._count(host, "connections")
+
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+
+        client = self._client_for(verify, cert, requests.utils.select_proxy(request.url, proxies))
+        httpx_request = client.build_request(
+            request.method,
+            request.url,
+            headers=dict(request.headers),
+            content=request.body,
+            timeout=timeout,
+            extensions={"trace": trace}
+        )
+
+        self._count(host, "requests")
+        try:
+            response = client.send(httpx_request, stream=True)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(e, request=request) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e, request=request) from e
+
+        return self._build_response(request, response, stream)
+
+    @staticmethod
+    def _build_response(request, response: "httpx.Response", stream: bool) -> requests.Response:
+        """Convert an httpx response into a requests Response."""
+        result = requests.Response()
+        result.status_code = response.status_code
+        result.reason = response.reason_phrase
+        result.url = request.url
+        result.request = request
+        # Bodies are handed over already decoded, so the encoded length
+        # would not match the bytes read
+        dropped = {"content-encoding", "transfer-encoding"}
+        if response.headers.get("content-encoding", "identity").lower() not in ("", "identity"):
+            dropped.add("content-length")
+        result.headers = requests.structures.CaseInsensitiveDict(
+            (name, value) for name, value in response.headers.items()
+            if name.lower() not in dropped
+        )
+        result.encoding = requests.utils.get_encoding_from_headers(result.headers)
+        result.raw = _HTTPXRaw(response)
+        if not stream:
+            try:
+                result._content = result.raw.read()
+            finally:
+                response.close()
+            result._content_consumed = True
+        return result
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get connection counts.
+
+        Returns:
+            Mapping of ``host:port`` to connections opened and requests sent.
+        """
+        with self._lock:
+            return {host: dict(entry) for host, entry in self._stats.items()}
+
+    def close(self):
+        """Close all connections."""
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
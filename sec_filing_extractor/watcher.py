@@ -0,0 +1,270 @@
+"""
+Watch mode: poll EDGAR's daily index and process new filings.
+
+Instead of polling every watched company's submissions, the watcher
+fetches the daily index (``Archives/edgar/daily-index/{year}/QTR{n}/
+master.{YYYYMMDD}.idx``, one file listing every filing accepted that day)
+once per interval. Matching filings not yet processed are handed to a
+bounded pool of workers running ``FilingManager.process_filing_complete``.
+
+Progress is kept in a JSON state file: the last day whose index was fully
+processed (the high-water mark) and, for days still open, the accessions
+already handled. A restarted watcher resumes from there without
+re-processing anything.
+"""
+import os
+import json
+import time
+import logging
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Callable, Iterable, Set
+
+from .catalog import parse_full_index, edgar_today
+from .exceptions import APIError
+from .filing_index import Filing, FilingIndex
+
+
+logger = logging.getLogger(__name__)
+
+
+# Days after a day ends before a missing daily index is taken as "no filings"
+_DAY_SETTLE_DAYS = 2
+
+
+class FilingWatcher:
+    """
+    Polls the EDGAR daily index and fans new filings out to a handler.
+    """
+
+    def __init__(
+        self,
+        manager,
+        form_types: Iterable[str] = ("10-Q", "8-K"),
+        watchlist: Optional[Iterable[str]] = None,
+        state_file: Optional[Path] = None,
+        interval: Optional[float] = None,
+        workers: Optional[int] = None,
+        handler: Optional[Callable[[Filing], Any]] = None
+    ):
+        """
+        Initialize watcher.
+
+        Args:
+            manager: FilingManager providing the client, CIK resolution and
+                     (by default) filing processing.
+            form_types: Form types to react to; empty reacts to all.
+            watchlist: Tickers, company names or CIKs to watch; None watches
+                       every company.
+            state_file: High-water mark file. Defaults to
+                        config.watch_state_file, then
+                        ``<output_dir>/.watch_state.json``.
+            interval: Seconds between polls; defaults to config.watch_interval.
+            workers: Filings processed concurrently; defaults to
+                     config.watch_workers.
+            handler: Callable invoked with each new Filing. Defaults to
+                     ``manager.process_filing_complete``.
+        """
+        self.manager = manager
+        self.config = manager.config
+        self.client = manager.client
+        self.form_types = frozenset(form_types)
+        self.ciks: Optional[Set[str]] = None
+        if watchlist is not None:
+            self.ciks = {self._resolve(item) for item in watchlist}
+        self.state_file = Path(
+            state_file or self.config.watch_state_file
+            or self.config.output_dir / ".watch_state.json"
+        )
+        self.interval = interval if interval is not None else self.config.watch_interval
+        self.workers = workers or self.config.watch_workers
+        self.handler = handler or manager.process_filing_complete
+        self._state_lock = threading.Lock()
+        self._state = self._load_state()
+
+    def _resolve(self, item: str) -> str:
+        """Resolve a watchlist entry to a 10-digit CIK."""
+        if item.strip().isdigit():
+            return f"{int(item):010d}"
+        return self.manager.resolve_cik(item)
+
+    def _load_state(self) -> Dict[str, Any]:
+        """Load the persisted high-water mark."""
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            state.setdefault("pending", {})
+            state.setdefault("failures", {})
+            return state
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable watch state {self.state_file}: {e}")
+        # Start with today: earlier filings are history, not news
+        return {
+            "last_complete": (edgar_today() - timedelta(days=1)).isoformat(),
+            "pending": {},
+            "failures": {},
+        }
+
+    def _save_state(self):
+        """Atomically persist the state. Caller must hold the state lock."""
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=str(self.state_file.parent), prefix=".tmp-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self._state, f, separators=(",", ":"))
+        os.replace(tmp_name, self.state_file)
+
+    @property
+    def high_water_mark(self) -> date:
+        """Last day whose daily index was fully processed."""
+        return date.fromisoformat(self._state["last_complete"])
+
+    def _fetch_day(self, day: date) -> Optional[List[Filing]]:
+        """
+        Get the matching filings of a day's index.
+
+        Returns:
+            Filings (one per accession), or None if no index exists yet.
+        """
+        try:
+            response = self.client.get_daily_index(day)
+        except APIError as e:
+            if e.status_code in (403, 404):
+                return None
+            raise
+
+        rows = parse_full_index(response.content.splitlines(), "master")
+        if self.manager.catalog is not None:
+            rows = list(rows)
+            self.manager.catalog.add(rows)
+
+        columns: Dict[str, List[Any]] = {
+            "accessionNumber": [], "cik": [], "companyName": [], "form": [], "filingDate": [],
+        }
+        seen: Set[str] = set()
+        for accession, cik, company, form, filing_date, _ in rows:
+            cik10 = f"{cik:010d}"
+            if accession in seen:
+                continue
+            if self.form_types and form not in self.form_types:
+                continue
+            if self.ciks is not None and cik10 not in self.ciks:
+                continue
+            seen.add(accession)
+            columns["accessionNumber"].append(accession)
+            columns["cik"].append(cik10)
+            columns["companyName"].append(company)
+            columns["form"].append(form)
+            columns["filingDate"].append(filing_date)
+        return FilingIndex(columns).select()
+
+    def _process(self, day_key: str, filing: Filing):
+        """Run the handler for one filing and record the outcome."""
+        try:
+            self.handler(filing)
+        except Exception as e:
+            with self._state_lock:
+                failures = self._state["failures"]
+                failures[filing.accession] = failures.get(filing.accession, 0) + 1
+                attempts = failures[filing.accession]
+                if attempts < self.config.watch_max_attempts:
+                    logger.warning(f"Processing {filing} failed (attempt {attempts}), will retry: {e}")
+                    self._save_state()
+                    return
+                logger.error(f"Giving up on {filing} after {attempts} attempts: {e}")
+                del failures[filing.accession]
+        else:
+            logger.info(f"Processed new filing {filing} ({filing.company_name})")
+
+        with self._state_lock:
+            self._state["failures"].pop(filing.accession, None)
+            self._state["pending"].setdefault(day_key, []).append(filing.accession)
+            self._save_state()
+
+    def poll_once(self) -> List[Filing]:
+        """
+        Check the daily indexes after the high-water mark and process new
+        filings.
+
+        Days are counted in EDGAR's time zone (US/Eastern). A day is done
+        once it is over, its index exists and all its filings are
+        processed. EDGAR publishes indexes late and skips weekends and
+        holidays, so a missing index is only taken as "no filings"
+        ``_DAY_SETTLE_DAYS`` days after the day; until then the day stays
+        open and is re-checked on every poll, while later days are
+        processed as usual. The high-water mark advances over leading done
+        days.
+
+        Returns:
+            Filings handed to the handler in this poll.
+
+        Raises:
+            APIError: If an index request fails (other than not found).
+        """
+        today = edgar_today()
+        day = self.high_water_mark + timedelta(days=1)
+        handed_out: List[Filing] = []
+        advancing = True
+
+        while day <= today:
+            day_key = day.isoformat()
+            filings = self._fetch_day(day)
+
+            with self._state_lock:
+                done = set(self._state["pending"].get(day_key, ()))
+            new = [f for f in (filings or ()) if f.accession not in done]
+            if new:
+                logger.info(f"{len(new)} new filings in the {day_key} daily index")
+                with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="sec-watch") as executor:
+                    list(executor.map(lambda f: self._process(day_key, f), new))
+                handed_out.extend(new)
+
+            if filings is None:
+                settled = (today - day).days > _DAY_SETTLE_DAYS
+                if not settled:
+                    logger.debug(f"No daily index for {day_key} yet")
+            else:
+                settled = day < today
+
+            with self._state_lock:
+                retry = any(f.accession in self._state["failures"] for f in new)
+                if advancing and settled and not retry:
+                    self._state["last_complete"] = day_key
+                    self._state["pending"].pop(day_key, None)
+                    self._save_state()
+                else:
+                    advancing = False
+            day += timedelta(days=1)
+
+        return handed_out
+
+    def run(self, stop_event: Optional[threading.Event] = None, max_polls: Optional[int] = None):
+        """
+        Poll until stopped.
+
+        Errors in a poll are logged and the next poll proceeds as scheduled.
+
+        Args:
+            stop_event: Event that ends the loop when set.
+            max_polls: Stop after this many polls (None polls forever).
+        """
+        stop_event = stop_event or threading.Event()
+        polls = 0
+        logger.info(f"Watching daily index every {self.interval:.0f}s for "
+                    f"{', '.join(sorted(self.form_types)) or 'all forms'}"
+                    f"{f' from {len(self.ciks)} companies' if self.ciks is not None else ''}")
+
+        while not stop_event.is_set():
+            started = time.monotonic()
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.error(f"Watch poll failed: {e}")
+            polls += 1
+            if max_polls is not None and polls >= max_polls:
+                break
+            stop_event.wait(max(0.0, self.interval - (time.monotonic() - started)))